@@ -5,6 +5,7 @@ Provides category classification, time series metrics, and Prometheus-style data
 
 import sqlite3
 import json
+import importlib.util
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -119,47 +120,83 @@ CATEGORIES = {
 }
 
 
+def _load_keyword_matcher():
+    """KeywordMatcher of the parser worker (compose-project/worker/app/core/keyword_matcher.py).
+
+    The module only uses the standard library, but importing it through the
+    worker's app.core package would pull in the worker's dependencies, so it
+    is loaded from its file.
+    """
+    path = Path(__file__).resolve().parent / "compose-project" / "worker" / "app" / "core" / "keyword_matcher.py"
+    spec = importlib.util.spec_from_file_location("keyword_matcher", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.KeywordMatcher
+
+
+KeywordMatcher = _load_keyword_matcher()
+
+
 class JobClassifier:
     """Classifies jobs into categories based on title and content keywords"""
 
     def __init__(self):
         self.categories = CATEGORIES
+        # Compiled once per classifier: English keywords match
+        # case-insensitively, Georgian as-is
+        self._en_matcher, self._en_entries = self._build_keyword_index("keywords_en", fold_case=True)
+        self._ge_matcher, self._ge_entries = self._build_keyword_index("keywords_ge", fold_case=False)
+
+    def _build_keyword_index(self, field: str, fold_case: bool):
+        """Map each keyword of one language to the categories listing it"""
+        entries = defaultdict(list)
+        for order, (category, data) in enumerate(self.categories.items()):
+            if category == "Other":
+                continue
+            for keyword in data[field]:
+                entries[keyword.lower() if fold_case else keyword].append((category, order))
+        return KeywordMatcher(entries), dict(entries)
 
     def classify(self, title_en: str = "", title_ge: str = "", body_en: str = "", body_ge: str = "") -> str:
         """Classify a job into a category based on title and body content"""
-        # Combine all text for matching
-        text_en = f"{title_en} {body_en}".lower()
-        text_ge = f"{title_ge} {body_ge}"
-
         scores = defaultdict(int)
-
-        for category, data in self.categories.items():
-            if category == "Other":
+        order = {}
+
+        for matcher, entries, title, text in (
+            (self._en_matcher, self._en_entries, title_en.lower(), f"{title_en} {body_en}".lower()),
+            (self._ge_matcher, self._ge_entries, title_ge, f"{title_ge} {body_ge}"),
+        ):
+            hits = matcher.find(text)
+            if not hits:
                 continue
-
-            # Check English keywords
-            for keyword in data["keywords_en"]:
-                if keyword.lower() in text_en:
+            in_title = matcher.find(title)
+            for keyword in hits:
+                for category, rank in entries[keyword]:
                     # Title matches are worth more
-                    if keyword.lower() in title_en.lower():
-                        scores[category] += 3
-                    else:
-                        scores[category] += 1
-
-            # Check Georgian keywords
-            for keyword in data["keywords_ge"]:
-                if keyword in text_ge:
-                    if keyword in title_ge:
-                        scores[category] += 3
-                    else:
-                        scores[category] += 1
+                    scores[category] += 3 if keyword in in_title else 1
+                    order[category] = rank
 
         if scores:
-            # Return category with highest score
-            return max(scores, key=scores.get)
+            # Return category with highest score (ties: first in self.categories)
+            return min(scores, key=lambda category: (-scores[category], order[category]))
 
         return "Other"
 
+    def classify_many(self, jobs) -> list:
+        """Classify many jobs at once.
+
+        `jobs` yields (title_en, title_ge, body_en, body_ge) tuples; returns
+        the categories in the same order. Repeated texts are scored once.
+        """
+        results = []
+        seen = {}
+        for job in jobs:
+            key = tuple(text or "" for text in job)
+            if key not in seen:
+                seen[key] = self.classify(*key)
+            results.append(seen[key])
+        return results
+
     def get_category_color(self, category: str) -> str:
         """Get the color for a category"""
         return self.categories.get(category, {}).get("color", "#BDC3C7")
@@ -229,21 +266,17 @@ class MetricsDatabase:
             """)
 
             jobs = cursor.fetchall()
-            classified = 0
-
-            for job in jobs:
-                category = self.classifier.classify(
-                    job['title_en'] or '',
-                    job['title_ge'] or '',
-                    job['body_en'] or '',
-                    job['body_ge'] or ''
-                )
-
-                cursor.execute("""
-                    INSERT OR REPLACE INTO job_categories (job_id, category, updated_at)
-                    VALUES (?, ?, ?)
-                """, (job['id'], category, datetime.now().isoformat()))
-                classified += 1
+            categories = self.classifier.classify_many(
+                (job['title_en'], job['title_ge'], job['body_en'], job['body_ge'])
+                for job in jobs
+            )
+
+            now = datetime.now().isoformat()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO job_categories (job_id, category, updated_at)
+                VALUES (?, ?, ?)
+            """, [(job['id'], category, now) for job, category in zip(jobs, categories)])
+            classified = len(jobs)
 
             conn.commit()
             return classified
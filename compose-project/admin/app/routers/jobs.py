@@ -9,6 +9,17 @@ from app.database import get_db
 
 router = APIRouter()
 
+# Channel the API LISTENs on to drop its cached job responses
+JOBS_CHANGED_CHANNEL = "jobs_changed"
+
+
+async def _notify_jobs_changed(db: AsyncSession):
+    """Invalidate the API's cached job lists; delivered when the transaction commits."""
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": JOBS_CHANGED_CHANNEL, "payload": "admin"},
+    )
+
 
 @router.get("")
 async def list_jobs(
@@ -148,6 +159,8 @@ async def update_job_status(
         {"id": str(job_id), "status": status}
     )
     row = result.fetchone()
+    if row:
+        await _notify_jobs_changed(db)
     await db.commit()
 
     if not row:
@@ -164,6 +177,8 @@ async def delete_job(job_id: UUID, db: AsyncSession = Depends(get_db)):
         {"id": str(job_id)}
     )
     row = result.fetchone()
+    if row:
+        await _notify_jobs_changed(db)
     await db.commit()
 
     if not row:
@@ -8,6 +8,7 @@ Provides endpoints for:
 - Batch job execution
 - Skip reason analysis
 """
+import json
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List
 from uuid import UUID
@@ -25,6 +26,9 @@ router = APIRouter()
 # Docker internal DNS does not support TLS; all traffic stays within the Docker network
 WORKER_URL = "http://worker:8000"  # NOSONAR - internal Docker network communication
 
+# Channel the worker LISTENs on for pause/resume/stop of running jobs
+JOB_CONTROL_CHANNEL = "parse_job_control"
+
 
 # ============================================================================
 # Pydantic Models
@@ -538,6 +542,14 @@ async def get_current_progress(db: AsyncSession = Depends(get_db)):
 # Job Control
 # ============================================================================
 
+async def _notify_job_control(db: AsyncSession, job_id: str, action: str):
+    """Wake the worker running this job; delivered when the transaction commits."""
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": JOB_CONTROL_CHANNEL, "payload": json.dumps({"job_id": job_id, "action": action})},
+    )
+
+
 @router.post("/jobs/{job_id}/control")
 async def control_job(
     job_id: str,
@@ -553,6 +565,7 @@ async def control_job(
             SET should_pause = true
             WHERE id = :job_id AND status = 'running'
         """), {"job_id": job_id})
+        await _notify_job_control(db, job_id, action)
         await db.commit()
         return {"success": True, "message": "Pause signal sent"}
 
@@ -581,6 +594,7 @@ async def control_job(
                 pause_duration_seconds = :duration
             WHERE id = :job_id
         """), {"job_id": job_id, "now": datetime.now(timezone.utc), "duration": new_duration})
+        await _notify_job_control(db, job_id, action)
         await db.commit()
         return {"success": True, "message": "Job resumed"}
 
@@ -590,6 +604,7 @@ async def control_job(
             SET should_stop = true, status = 'stopping'
             WHERE id = :job_id AND status IN ('running', 'paused')
         """), {"job_id": job_id})
+        await _notify_job_control(db, job_id, action)
         await db.commit()
         return {"success": True, "message": "Stop signal sent"}
 
@@ -601,6 +616,7 @@ async def control_job(
                 completed_at = :now
             WHERE id = :job_id AND status NOT IN ('completed', 'failed', 'cancelled')
         """), {"job_id": job_id, "now": datetime.now(timezone.utc)})
+        await _notify_job_control(db, job_id, action)
         await db.commit()
         return {"success": True, "message": "Job cancelled"}
 
@@ -29,6 +29,14 @@ class Settings(BaseSettings):
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    COUNT_CACHE_SECONDS: int = 60  # Reuse list totals for this long
+
+    # Response cache for public read endpoints (app/core/response_cache.py)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 300  # Upper bound if a NOTIFY is missed
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000
+    RESPONSE_CACHE_MAX_AGE: int = 30  # Cache-Control max-age for nginx/browsers
+    RESPONSE_CACHE_JOB_PAGES: int = 3  # Jobs list pages cached per filter set
 
     # Parser settings (Phase 2)
     PARSER_INTERVAL_MINUTES: int = 60
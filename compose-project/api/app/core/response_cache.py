@@ -0,0 +1,247 @@
+"""In-process cache for public read endpoints.
+
+Categories, regions, stats and the first pages of the jobs list only
+change when the worker writes jobs, yet were recomputed from Postgres on
+every request. ResponseCache keeps their JSON bodies in an LRU with a TTL,
+keyed on path and normalized query string, and tags every entry with what
+it depends on ("jobs", "categories", "regions").
+
+Invalidation:
+- The worker sends NOTIFY jobs_changed after writing jobs, and the admin
+  service after editing or deleting one; JobsChangedListener drops the
+  "jobs" entries (and list totals).
+- Admin writes through this API drop everything.
+- Entries expire after RESPONSE_CACHE_TTL_SECONDS in any case, which
+  bounds staleness while the listener is disconnected.
+
+Responses carry an ETag (If-None-Match gets a 304) and a Cache-Control
+max-age that nginx and browsers can honor.
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set, Tuple
+
+import asyncpg
+from sqlalchemy.engine import make_url
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# NOTIFY channel of job writes (JOBS_CHANGED_CHANNEL in the worker's
+# app/core/runner.py and the admin's app/routers/jobs.py)
+JOBS_CHANGED_CHANNEL = "jobs_changed"
+
+# Cacheable path prefixes and the tags their responses depend on
+CACHED_PATHS = {
+    "/api/v1/jobs": {"jobs", "categories", "regions"},
+    "/api/v1/stats": {"jobs"},
+    "/api/v1/categories": {"categories"},
+    "/api/v1/regions": {"regions"},
+}
+
+ADMIN_PREFIX = "/api/v1/admin"
+RECONNECT_SECONDS = 30.0
+
+
+@dataclass
+class CachedResponse:
+    """A cached 200 response body."""
+
+    body: bytes
+    media_type: str
+    etag: str
+    tags: Set[str]
+    expires_at: float
+
+
+class ResponseCache:
+    """LRU of response bodies with TTL and tag invalidation."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        """Initialize cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is dropped
+            ttl: Seconds an entry is served
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], CachedResponse]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str]) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple[str, str], body: bytes, media_type: str, tags: Set[str]) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            media_type=media_type,
+            etag=make_etag(body),
+            tags=tags,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, tag: Optional[str] = None) -> int:
+        """Drop the entries tagged tag (all entries if None).
+
+        Returns:
+            Number of entries dropped
+        """
+        if tag is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+        keys = [key for key, entry in self._entries.items() if tag in entry.tags]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def cache_key(request: Request) -> Optional[Tuple[str, str]]:
+    """Cache key of a request, or None if its response isn't cached.
+
+    Query params are sorted and blank ones dropped, so equivalent URLs
+    share an entry. Only the first RESPONSE_CACHE_JOB_PAGES offset pages
+    of the jobs list are cached; cursor pages and job details are not.
+    """
+    if request.method != "GET":
+        return None
+    path = request.url.path.rstrip("/")
+    if path not in CACHED_PATHS and not path.startswith(("/api/v1/categories/", "/api/v1/regions/")):
+        return None
+
+    params = sorted((name, value) for name, value in request.query_params.multi_items() if value != "")
+    if path == "/api/v1/jobs":
+        query = dict(params)
+        if "cursor" in query:
+            return None
+        try:
+            if int(query.get("page", "1")) > settings.RESPONSE_CACHE_JOB_PAGES:
+                return None
+        except ValueError:
+            return None
+    return path, "&".join(f"{name}={value}" for name, value in params)
+
+
+def cache_tags(path: str) -> Set[str]:
+    for prefix, tags in CACHED_PATHS.items():
+        if path == prefix or path.startswith(prefix + "/"):
+            return tags
+    return set()
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.RESPONSE_CACHE_MAX_AGE}",
+    }
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+async def handle(cache: ResponseCache, request: Request, call_next) -> Response:
+    """Serve a request through the cache (HTTP middleware body)."""
+    key = cache_key(request)
+    if key is None:
+        response = await call_next(request)
+        if request.method != "GET" and request.url.path.startswith(ADMIN_PREFIX) and response.status_code < 400:
+            dropped = cache.invalidate()
+            logger.debug("response_cache_invalidated", reason="admin_write", entries=dropped)
+        return response
+
+    entry = cache.get(key)
+    status = "HIT"
+    if entry is None:
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        entry = cache.put(key, body, response.media_type or response.headers.get("content-type"), cache_tags(key[0]))
+        status = "MISS"
+
+    headers = {**_cache_headers(entry.etag), "X-Cache": status}
+    if _not_modified(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
+class JobsChangedListener:
+    """LISTENs for the worker's jobs_changed notifications."""
+
+    def __init__(self, database_url: str, on_change: Callable[[str], None]):
+        """Initialize listener.
+
+        Args:
+            database_url: SQLAlchemy URL of the database (any async driver)
+            on_change: Called with the notification payload (source name)
+        """
+        self._dsn = make_url(database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self._on_change = on_change
+        self._conn = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Listen in the background, reconnecting while the app runs."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._conn is not None and not self._conn.is_closed():
+            await self._conn.close()
+        self._conn = None
+
+    async def _run(self):
+        while True:
+            if self._conn is None or self._conn.is_closed():
+                try:
+                    self._conn = await asyncpg.connect(self._dsn)
+                    await self._conn.add_listener(JOBS_CHANGED_CHANNEL, self._on_notify)
+                    logger.info("jobs_changed_listening", channel=JOBS_CHANGED_CHANNEL)
+                    # Writes while disconnected went unannounced
+                    self._on_change("reconnected")
+                except Exception as e:
+                    logger.warning("jobs_changed_listen_failed", error=str(e))
+                    self._conn = None
+            await asyncio.sleep(RECONNECT_SECONDS)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        self._on_change(payload)
@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.database import init_db
+from app.core import response_cache
 from app.core.logging import configure_logging, get_logger, bind_request_context, clear_request_context
 
 # Configure structured logging
@@ -50,6 +51,20 @@ from app.routers.stats import router as stats_router
 
 logger = get_logger(__name__)
 
+cache = response_cache.ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def on_jobs_changed(source: str):
+    """Drop cached job lists, stats and totals after the worker wrote jobs."""
+    from app.services.job_service import clear_count_cache
+
+    clear_count_cache()
+    dropped = cache.invalidate("jobs")
+    logger.info("response_cache_invalidated", reason="jobs_changed", source=source, entries=dropped)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -59,10 +74,17 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("database_initialized")
 
+    listener = None
+    if settings.RESPONSE_CACHE_ENABLED:
+        listener = response_cache.JobsChangedListener(settings.DATABASE_URL, on_jobs_changed)
+        listener.start()
+
     yield
 
     # Shutdown
     logger.info("application_shutting_down")
+    if listener:
+        await listener.close()
 
 
 # Create FastAPI application
@@ -75,6 +97,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Add response cache middleware (added before CORS so CORS headers are
+# applied per request on cached responses too)
+if settings.RESPONSE_CACHE_ENABLED:
+    @app.middleware("http")
+    async def response_cache_middleware(request: Request, call_next):
+        """Serve public read endpoints from the in-process cache."""
+        return await response_cache.handle(cache, request, call_next)
+
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
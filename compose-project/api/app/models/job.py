@@ -4,19 +4,32 @@ from sqlalchemy import (
     String,
     Boolean,
     Integer,
+    BigInteger,
+    Computed,
     Text,
     DateTime,
     ForeignKey,
     UniqueConstraint,
     Index,
+    text,
 )
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
 
+# Georgian has no Postgres stemmer: 'simple' (lowercase only) for Georgian
+# text, 'english' for the English body
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title_ge, '') || ' ' || coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(company_name, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(body_ge, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(body_en, '')), 'D')"
+)
+
+
 class Job(Base, UUIDMixin, TimestampMixin):
     """Job posting model with bilingual support."""
 
@@ -29,6 +42,44 @@ class Job(Base, UUIDMixin, TimestampMixin):
         Index("idx_jobs_company", "company_id"),
         Index("idx_jobs_published", "published_at"),
         Index("idx_jobs_has_salary", "has_salary", postgresql_where="has_salary = true"),
+        # Default listing order (external_id_num DESC NULLS LAST, id DESC) of
+        # active jobs, alone and behind the hot filters, so a page is an
+        # index range scan instead of a sort of the whole filtered set
+        Index(
+            "idx_jobs_active_sort",
+            text("external_id_num DESC NULLS LAST"), text("id DESC"),
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "idx_jobs_active_lid_sort",
+            "jobsge_lid", text("external_id_num DESC NULLS LAST"), text("id DESC"),
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "idx_jobs_active_cid_sort",
+            "jobsge_cid", text("external_id_num DESC NULLS LAST"), text("id DESC"),
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "idx_jobs_active_salary_sort",
+            text("external_id_num DESC NULLS LAST"), text("id DESC"),
+            postgresql_where=text("status = 'active' AND has_salary"),
+        ),
+        # Search (app/services/job_search.py): full text, and trigrams for
+        # substring/typo matches on titles and company
+        Index("idx_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_jobs_title_ge_trgm", "title_ge",
+            postgresql_using="gin", postgresql_ops={"title_ge": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_jobs_title_en_trgm", "title_en",
+            postgresql_using="gin", postgresql_ops={"title_en": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_jobs_company_name_trgm", "company_name",
+            postgresql_using="gin", postgresql_ops={"company_name": "gin_trgm_ops"},
+        ),
     )
 
     # Basic info (bilingual)
@@ -84,9 +135,22 @@ class Job(Base, UUIDMixin, TimestampMixin):
         String(100), default="manual", nullable=False
     )  # manual, jobs.ge, hr.ge, etc.
     external_id = Column(String(255), nullable=True)  # ID from source site
+    # Numeric external_id for sorting (NULL if not numeric), kept by Postgres
+    external_id_num = Column(
+        BigInteger,
+        Computed("CASE WHEN external_id ~ '^[0-9]{1,18}$' THEN external_id::bigint END", persisted=True),
+        nullable=True,
+    )
     source_url = Column(Text, nullable=True)  # Original job posting URL
     content_hash = Column(String(64), nullable=True)  # For detecting changes
 
+    # Full-text search document, kept by Postgres (titles/company weigh most)
+    search_vector = Column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+    )
+
     # Timestamps for parser tracking
     first_seen_at = Column(DateTime(timezone=True), nullable=True)
     last_seen_at = Column(DateTime(timezone=True), nullable=True)
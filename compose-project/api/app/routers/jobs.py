@@ -23,7 +23,7 @@ router = APIRouter()
     description="Get paginated list of jobs with optional filters. Supports jobs.ge style filters (cid/lid).",
 )
 async def list_jobs(
-    q: Optional[str] = Query(None, description="Search in title/company"),
+    q: Optional[str] = Query(None, description="Search in title/company/description (ranked, typo tolerant)"),
     category: Optional[str] = Query(None, description="Category slug"),
     cid: Optional[int] = Query(None, description="jobs.ge category ID (1-18)"),
     region: Optional[str] = Query(None, description="Region slug"),
@@ -34,9 +34,11 @@ async def list_jobs(
     status: Optional[str] = Query("active", description="Job status"),
     employment_type: Optional[str] = Query(None, description="Employment type"),
     remote_type: Optional[str] = Query(None, description="Remote type"),
-    sort: Optional[str] = Query("-external_id", description="Sort field (default: -external_id, same as jobs.ge)"),
+    sort: Optional[str] = Query(None, description="Sort field (default: -relevance with q, else -external_id, same as jobs.ge)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (infinite scroll)"),
+    include_total: bool = Query(True, description="Count matching jobs (total/pages)"),
     db: AsyncSession = Depends(get_db),
 ):
     """List jobs with pagination and filters.
@@ -44,6 +46,11 @@ async def list_jobs(
     Supports two filter styles:
     - Slug-based: category=it-programming, region=adjara
     - jobs.ge style: cid=6 (IT), lid=14 (Adjara)
+
+    Supports two paging styles:
+    - Offset: page=3&page_size=20
+    - Cursor: pass next_cursor of the previous response as cursor=...;
+      add include_total=false to skip counting
     """
     params = JobSearchParams(
         q=q,
@@ -60,9 +67,17 @@ async def list_jobs(
         sort=sort,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
     service = JobService(db)
-    return await service.list_jobs(params)
+    try:
+        return await service.list_jobs(params)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,  # "status" is the job status filter here
+            detail=str(e),
+        )
 
 
 @router.get(
@@ -13,13 +13,18 @@ class BaseSchema(BaseModel):
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Paginated response wrapper."""
+    """Paginated response wrapper.
+
+    total and pages are None when the count was skipped; next_cursor is
+    set by keyset-paginated lists while more items follow.
+    """
 
     items: list[T]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class MessageResponse(BaseModel):
@@ -185,6 +185,8 @@ class JobListItem(BaseSchema):
     # jobs.ge original filter values
     jobsge_cid: Optional[int] = None
     jobsge_lid: Optional[int] = None
+    # Highlighted body excerpt (only when searching with q)
+    snippet: Optional[str] = None
 
 
 class JobSearchParams(BaseModel):
@@ -206,6 +208,8 @@ class JobSearchParams(BaseModel):
     status: Optional[JobStatus] = Field("active", description="Job status")
     employment_type: Optional[EmploymentType] = None
     remote_type: Optional[RemoteType] = None
-    sort: Optional[str] = Field("-external_id", description="Sort field (prefix - for desc). Default: -external_id (same as jobs.ge)")
+    sort: Optional[str] = Field(None, description="Sort field (prefix - for desc). Default: -relevance with q, else -external_id (same as jobs.ge)")
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page (replaces page)")
+    include_total: bool = Field(True, description="Count matching jobs (total/pages)")
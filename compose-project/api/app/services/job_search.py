@@ -0,0 +1,57 @@
+"""Full-text and trigram search for the jobs list (q= parameter).
+
+Matching uses two index-backed paths, combined with OR (a BitmapOr in
+Postgres):
+
+- jobs.search_vector: a generated tsvector over the titles, company and
+  bodies (GIN index). Georgian text goes through the 'simple' config:
+  Postgres has no Georgian stemmer, and 'simple' only lowercases, which
+  folds Mtavruli capitals onto Mkhedruli. English body text is stemmed
+  with the 'english' config. Queries use websearch syntax ("python -senior",
+  "exact phrase") and are run through both configs.
+- Trigram (pg_trgm, GIN) indexes on title_ge, title_en and company_name.
+  These serve the substring ILIKE the endpoint has always done, plus word
+  similarity, so a typo in a title word still matches.
+
+Results rank by ts_rank_cd plus title word similarity, and each hit gets a
+highlighted snippet of its body.
+"""
+from sqlalchemy import Float, cast, func, literal, or_
+
+from app.models.job import Job
+
+SNIPPET_OPTIONS = "MaxFragments=1, MaxWords=30, MinWords=10, StartSel=<mark>, StopSel=</mark>"
+
+
+def ts_query(q: str):
+    """tsquery for q, matching both Georgian ('simple') and stemmed English terms."""
+    return func.websearch_to_tsquery("simple", q).op("||")(func.websearch_to_tsquery("english", q))
+
+
+def search_filter(q: str):
+    """WHERE clause matching q in titles, company and bodies."""
+    pattern = f"%{q}%"
+    return or_(
+        Job.search_vector.op("@@")(ts_query(q)),
+        Job.title_ge.ilike(pattern),
+        Job.title_en.ilike(pattern),
+        Job.company_name.ilike(pattern),
+        # q is word-similar to some word of the title (typo tolerance)
+        literal(q).op("<%")(Job.title_ge),
+        literal(q).op("<%")(Job.title_en),
+    )
+
+
+def relevance(q: str):
+    """Sort key for q: text rank plus how closely the title matches."""
+    title_similarity = func.greatest(
+        func.word_similarity(q, Job.title_ge),
+        func.coalesce(func.word_similarity(q, Job.title_en), 0),
+    )
+    return cast(func.ts_rank_cd(Job.search_vector, ts_query(q)) + title_similarity, Float)
+
+
+def snippet(q: str):
+    """Body excerpt around the matched terms, with <mark> highlights."""
+    body = func.concat_ws(" ", Job.body_ge, Job.body_en)
+    return func.ts_headline("simple", body, ts_query(q), SNIPPET_OPTIONS)
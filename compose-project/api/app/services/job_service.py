@@ -1,16 +1,160 @@
 """Job service for business logic."""
-from typing import Optional
+import base64
+import binascii
+import json
+import time
+from typing import Any, Optional
 from uuid import UUID
 from datetime import datetime, timezone
-from sqlalchemy import select, func, or_, desc, asc, cast, Integer
+from sqlalchemy import select, func, or_, and_, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from app.models.job import Job
 from app.models.category import Category
 from app.models.region import Region
-from app.schemas.job import JobCreate, JobUpdate, JobSearchParams
+from app.schemas.job import JobCreate, JobUpdate, JobSearchParams, JobListItem
+from app.schemas.category import CategoryListItem
+from app.schemas.region import RegionListItem
 from app.schemas.base import PaginatedResponse
+from app.core.config import settings
+from app.services import job_search
+
+# Region slugs to jobs.ge location IDs (lid parameter)
+REGION_SLUG_TO_LID = {
+    "tbilisi": 1,
+    "adjara": 14,
+    "batumi": 14,  # Batumi is in Adjara
+    "imereti": 8,
+    "kutaisi": 8,  # Kutaisi is in Imereti
+    "kakheti": 3,
+    "samegrelo": 13,
+    "zugdidi": 13,  # Zugdidi is in Samegrelo
+    "kvemo-kartli": 5,
+    "rustavi": 5,  # Rustavi is in Kvemo Kartli
+    "shida-kartli": 6,
+    "gori": 6,  # Gori is in Shida Kartli
+    "samtskhe-javakheti": 7,
+    "mtskheta-mtianeti": 4,
+    "racha-lechkhumi": 12,
+    "guria": 9,
+    "remote": 17,
+    "georgia": None,  # All of Georgia - no filter
+}
+
+# Map sort field names to columns
+SORT_COLUMNS = {
+    "external_id": Job.external_id_num,  # Numeric, served by idx_jobs_active_*_sort
+    "published_at": Job.published_at,
+    "created_at": Job.created_at,
+    "deadline_at": Job.deadline_at,
+    "title_ge": Job.title_ge,
+}
+DATETIME_SORTS = {"published_at", "created_at", "deadline_at"}
+BIGINT_MAX = 2**63 - 1
+
+# List rows are read as plain columns straight into JobListItem: no
+# body_ge/body_en, no ORM objects, and category/region from one join.
+# Aliased so the category/region filter subqueries aren't correlated to them.
+_ListCategory = aliased(Category, name="list_category")
+_ListRegion = aliased(Region, name="list_region")
+LIST_COLUMNS = [
+    *(getattr(Job, name) for name in JobListItem.model_fields if name not in ("category", "region", "snippet")),
+    *(getattr(_ListCategory, name).label(f"category__{name}") for name in CategoryListItem.model_fields),
+    *(getattr(_ListRegion, name).label(f"region__{name}") for name in RegionListItem.model_fields),
+]
+
+
+def _list_item(row) -> JobListItem:
+    """JobListItem from a LIST_COLUMNS row."""
+    values = {"category": {}, "region": {}}
+    for key, value in row._mapping.items():
+        relation, _, name = key.partition("__")
+        if name:
+            values[relation][name] = value
+        else:
+            values[key] = value
+    for relation in ("category", "region"):
+        if values[relation]["id"] is None:  # Outer join found nothing
+            values[relation] = None
+    return JobListItem.model_validate(values)
+
+
+# Params that change the count (everything but sorting and paging)
+COUNT_KEY_FIELDS = {
+    "q", "category", "cid", "region", "lid", "location", "has_salary",
+    "is_vip", "status", "employment_type", "remote_type",
+}
+COUNT_CACHE_SIZE = 1024
+_count_cache: dict = {}
+
+
+def clear_count_cache():
+    """Forget cached list totals (jobs changed)."""
+    _count_cache.clear()
+
+
+def encode_cursor(sort_field: str, value: Any, job_id: UUID) -> str:
+    """Opaque cursor pointing after the row with this sort value and id."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort_field, "v": value, "id": str(job_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_field: str) -> tuple:
+    """Sort value and job id of a cursor made for sort_field.
+
+    Raises:
+        ValueError: If the cursor is malformed or from another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort_field:
+            raise ValueError("cursor was issued for a different sort")
+        if not isinstance(payload["id"], str):
+            raise ValueError("invalid cursor id")
+        job_id = UUID(payload["id"])
+        value = _cursor_value(sort_field.lstrip("-"), payload["v"])
+    except (
+        binascii.Error, json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, AttributeError
+    ) as e:
+        raise ValueError("invalid cursor") from e
+    return value, job_id
+
+
+def _cursor_value(field_name: str, value: Any) -> Any:
+    """Check a cursor's sort value has the type of its sort column."""
+    if value is None:
+        return None
+    if field_name in DATETIME_SORTS:
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+    elif field_name == "external_id":
+        # bool is an int subclass; JSON true is not an id
+        if isinstance(value, int) and not isinstance(value, bool) and abs(value) <= BIGINT_MAX:
+            return value
+    elif field_name == "relevance":
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    elif field_name == "title_ge":
+        if isinstance(value, str) and "\x00" not in value:
+            return value
+    raise ValueError(f"invalid cursor value for {field_name}")
+
+
+def _seek(sort_column, value: Any, last_id: UUID, descending: bool):
+    """Rows after (value, last_id) in ORDER BY sort NULLS LAST, id."""
+    after = (lambda a, b: a < b) if descending else (lambda a, b: a > b)
+    if value is None:
+        # Already in the NULLS LAST tail: only the id decides
+        return and_(sort_column.is_(None), after(Job.id, last_id))
+    return or_(
+        after(sort_column, value),
+        and_(sort_column == value, after(Job.id, last_id)),
+        sort_column.is_(None),
+    )
 
 
 class JobService:
@@ -40,28 +184,113 @@ class JobService:
         return result.scalar_one_or_none()
 
     async def list_jobs(self, params: JobSearchParams) -> PaginatedResponse:
-        """List jobs with filters and pagination."""
-        query = select(Job).options(
-            selectinload(Job.category), selectinload(Job.region)
+        """List jobs with filters and pagination.
+
+        Pages by offset (page/page_size), or by keyset when params.cursor is
+        given: the query then seeks past the last (sort key, id) of the
+        previous page, so deep pages cost the same as the first one.
+
+        Raises:
+            ValueError: If the cursor is malformed or from another sort
+        """
+        query = (
+            select(*LIST_COLUMNS)
+            .outerjoin(_ListCategory, Job.category_id == _ListCategory.id)
+            .outerjoin(_ListRegion, Job.region_id == _ListRegion.id)
+        )
+        filters = self._build_filters(params)
+        if filters:
+            query = query.where(*filters)
+        if params.q:
+            query = query.add_columns(job_search.snippet(params.q).label("snippet"))
+
+        total = None
+        if params.include_total:
+            total = await self._count(filters, params)
+
+        # Apply sorting
+        # Default: best match first when searching, else external_id DESC
+        # (same as jobs.ge); id breaks ties so keyset pages never skip or
+        # repeat rows
+        sort_field = params.sort or ("-relevance" if params.q else "-external_id")
+        descending = sort_field.startswith("-")
+        field_name = sort_field.lstrip("-")
+        if field_name == "relevance" and params.q:
+            sort_column = job_search.relevance(params.q)
+        else:
+            if field_name not in SORT_COLUMNS:
+                field_name = "external_id"
+            sort_column = SORT_COLUMNS[field_name]
+        sort_field = f"-{field_name}" if descending else field_name
+
+        order = desc if descending else asc
+        query = query.add_columns(sort_column.label("sort_key")).order_by(
+            order(sort_column).nulls_last(), order(Job.id)
+        )
+
+        # Apply pagination
+        if params.cursor:
+            value, last_id = decode_cursor(params.cursor, sort_field)
+            query = query.where(_seek(sort_column, value, last_id, descending))
+        else:
+            query = query.offset((params.page - 1) * params.page_size)
+        query = query.limit(params.page_size + 1)
+
+        # Execute
+        result = await self.db.execute(query)
+        rows = result.all()
+        has_more = len(rows) > params.page_size
+        rows = rows[:params.page_size]
+
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(sort_field, rows[-1].sort_key, rows[-1].id)
+
+        pages = None
+        if total is not None:
+            pages = (total + params.page_size - 1) // params.page_size
+
+        return PaginatedResponse(
+            items=[_list_item(row) for row in rows],
+            total=total,
+            page=params.page,
+            page_size=params.page_size,
+            pages=pages,
+            next_cursor=next_cursor,
         )
 
-        # Apply filters
+    async def _count(self, filters: list, params: JobSearchParams) -> int:
+        """Count the filtered jobs, reusing a count from the last minute.
+
+        Totals only drift when the worker writes, so paging through a
+        listing doesn't repeat the count(*) on every request.
+        """
+        key = params.model_dump_json(include=COUNT_KEY_FIELDS)
+        now = time.monotonic()
+        cached = _count_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        count_query = select(func.count()).select_from(Job).where(*filters)
+        total_result = await self.db.execute(count_query)
+        total = total_result.scalar_one()
+
+        if len(_count_cache) >= COUNT_CACHE_SIZE:
+            _count_cache.clear()
+        _count_cache[key] = (now + settings.COUNT_CACHE_SECONDS, total)
+        return total
+
+    def _build_filters(self, params: JobSearchParams) -> list:
+        """WHERE clauses for the search params."""
         filters = []
 
         # Status filter (default: active)
         if params.status:
             filters.append(Job.status == params.status)
 
-        # Search query (in title and company name)
+        # Search query (titles, company and bodies; see job_search)
         if params.q:
-            search_term = f"%{params.q}%"
-            filters.append(
-                or_(
-                    Job.title_ge.ilike(search_term),
-                    Job.title_en.ilike(search_term),
-                    Job.company_name.ilike(search_term),
-                )
-            )
+            filters.append(job_search.search_filter(params.q))
 
         # Category filter (by slug)
         if params.category:
@@ -75,26 +304,6 @@ class JobService:
         # Region filter (by slug)
         # Maps region slugs to jobs.ge location IDs (lid parameter)
         # Based on jobsge_config.py JOBSGE_REGIONS mapping
-        REGION_SLUG_TO_LID = {
-            "tbilisi": 1,
-            "adjara": 14,
-            "batumi": 14,  # Batumi is in Adjara
-            "imereti": 8,
-            "kutaisi": 8,  # Kutaisi is in Imereti
-            "kakheti": 3,
-            "samegrelo": 13,
-            "zugdidi": 13,  # Zugdidi is in Samegrelo
-            "kvemo-kartli": 5,
-            "rustavi": 5,  # Rustavi is in Kvemo Kartli
-            "shida-kartli": 6,
-            "gori": 6,  # Gori is in Shida Kartli
-            "samtskhe-javakheti": 7,
-            "mtskheta-mtianeti": 4,
-            "racha-lechkhumi": 12,
-            "guria": 9,
-            "remote": 17,
-            "georgia": None,  # All of Georgia - no filter
-        }
         if params.region:
             lid_for_region = REGION_SLUG_TO_LID.get(params.region)
             if lid_for_region is not None:
@@ -128,52 +337,7 @@ class JobService:
         if params.remote_type:
             filters.append(Job.remote_type == params.remote_type)
 
-        if filters:
-            query = query.where(*filters)
-
-        # Count total before pagination
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply sorting
-        # Default: sort by external_id DESC (same as jobs.ge)
-        sort_field = params.sort or "-external_id"
-        descending = sort_field.startswith("-")
-        field_name = sort_field.lstrip("-")
-
-        # Map sort field names to columns
-        sort_columns = {
-            "external_id": cast(Job.external_id, Integer),  # Cast to int for numeric sort
-            "published_at": Job.published_at,
-            "created_at": Job.created_at,
-            "deadline_at": Job.deadline_at,
-            "title_ge": Job.title_ge,
-        }
-
-        sort_column = sort_columns.get(field_name, cast(Job.external_id, Integer))
-        if descending:
-            query = query.order_by(desc(sort_column).nulls_last())
-        else:
-            query = query.order_by(asc(sort_column).nulls_last())
-
-        # Apply pagination
-        offset = (params.page - 1) * params.page_size
-        query = query.offset(offset).limit(params.page_size)
-
-        # Execute
-        result = await self.db.execute(query)
-        jobs = result.scalars().all()
-
-        pages = (total + params.page_size - 1) // params.page_size
-
-        return PaginatedResponse(
-            items=list(jobs),
-            total=total,
-            page=params.page,
-            page_size=params.page_size,
-            pages=pages,
-        )
+        return filters
 
     async def create_job(self, data: JobCreate) -> Job:
         """Create a new job."""
@@ -0,0 +1,62 @@
+"""Add numeric external_id sort column and listing indexes
+
+The public jobs list sorts by external_id numerically (newest jobs.ge
+listing first). Sorting by CAST(external_id AS INTEGER) can't use an
+index, so every request sorted the whole filtered set.
+
+- external_id_num: external_id as BIGINT (NULL if not numeric), a stored
+  generated column maintained by Postgres - writers don't change
+- Partial indexes on active jobs in listing order
+  (external_id_num DESC NULLS LAST, id DESC): unfiltered, by jobsge_lid,
+  by jobsge_cid and with salary
+
+Revision ID: 20260121_000001
+Revises: 20260120_000001
+Create Date: 2026-01-21
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260121_000001'
+down_revision = '20260120_000001'
+branch_labels = None
+depends_on = None
+
+SORT_KEY = [sa.text('external_id_num DESC NULLS LAST'), sa.text('id DESC')]
+ACTIVE = sa.text("status = 'active'")
+
+
+def upgrade() -> None:
+    op.add_column(
+        'jobs',
+        sa.Column(
+            'external_id_num',
+            sa.BigInteger(),
+            sa.Computed("CASE WHEN external_id ~ '^[0-9]{1,18}$' THEN external_id::bigint END", persisted=True),
+            nullable=True,
+            comment='Numeric external_id for sorting (NULL if not numeric)',
+        )
+    )
+
+    op.create_index('idx_jobs_active_sort', 'jobs', SORT_KEY, postgresql_where=ACTIVE)
+    op.create_index(
+        'idx_jobs_active_lid_sort', 'jobs', ['jobsge_lid', *SORT_KEY], postgresql_where=ACTIVE
+    )
+    op.create_index(
+        'idx_jobs_active_cid_sort', 'jobs', ['jobsge_cid', *SORT_KEY], postgresql_where=ACTIVE
+    )
+    op.create_index(
+        'idx_jobs_active_salary_sort', 'jobs', SORT_KEY,
+        postgresql_where=sa.text("status = 'active' AND has_salary"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_active_salary_sort', 'jobs')
+    op.drop_index('idx_jobs_active_cid_sort', 'jobs')
+    op.drop_index('idx_jobs_active_lid_sort', 'jobs')
+    op.drop_index('idx_jobs_active_sort', 'jobs')
+    op.drop_column('jobs', 'external_id_num')
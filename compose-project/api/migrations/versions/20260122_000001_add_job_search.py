@@ -0,0 +1,62 @@
+"""Add full-text and trigram search for jobs
+
+Search (q=) was ILIKE '%q%' over titles and company, a sequential scan.
+
+- search_vector: stored generated tsvector over titles (weight A),
+  company (B), Georgian body (C, 'simple' config - Postgres has no
+  Georgian stemmer) and English body (D, 'english' config), GIN-indexed
+- pg_trgm GIN indexes on title_ge, title_en and company_name for
+  substring and word-similarity (typo) matches
+
+Revision ID: 20260122_000001
+Revises: 20260121_000001
+Create Date: 2026-01-22
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers
+revision = '20260122_000001'
+down_revision = '20260121_000001'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title_ge, '') || ' ' || coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(company_name, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(body_ge, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(body_en, '')), 'D')"
+)
+TRIGRAM_COLUMNS = ['title_ge', 'title_en', 'company_name']
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.add_column(
+        'jobs',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+            comment='Full-text search document (titles, company, bodies)',
+        )
+    )
+    op.create_index('idx_jobs_search_vector', 'jobs', ['search_vector'], postgresql_using='gin')
+
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'idx_jobs_{column}_trgm', 'jobs', [column],
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(TRIGRAM_COLUMNS):
+        op.drop_index(f'idx_jobs_{column}_trgm', 'jobs')
+    op.drop_index('idx_jobs_search_vector', 'jobs')
+    op.drop_column('jobs', 'search_vector')
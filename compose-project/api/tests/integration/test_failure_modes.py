@@ -103,6 +103,13 @@ class TestAPIFailureModes:
 
         assert response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_pagination_invalid_cursor(self, client: AsyncClient):
+        """Test error for a cursor that wasn't issued by the API."""
+        response = await client.get("/api/v1/jobs?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_filter_invalid_status(self, client: AsyncClient):
         """Test handling of invalid status filter."""
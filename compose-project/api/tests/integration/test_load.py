@@ -98,6 +98,38 @@ class TestLargeDataset:
         assert len(data["items"]) == 10
         assert data["page"] == 5
 
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_large_dataset(
+        self, client: AsyncClient, db_session: AsyncSession, sample_category: Category
+    ):
+        """Test cursor pages cover every record exactly once, in order."""
+        for i in range(45):
+            job = Job(
+                title_ge=f"ვაკანსია {i}",
+                body_ge=f"აღწერა {i}",
+                category_id=sample_category.id,
+                status="active",
+                parsed_from="cursor-test",
+                external_id=str(700000 + i),
+                content_hash=f"hash-{i}",
+            )
+            db_session.add(job)
+        await db_session.commit()
+
+        seen = []
+        url = "/api/v1/jobs?page_size=10&include_total=false"
+        response = await client.get(url)
+        while True:
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            seen.extend(job["external_id"] for job in data["items"])
+            if not data["next_cursor"]:
+                break
+            response = await client.get(f"{url}&cursor={data['next_cursor']}")
+
+        assert seen == [str(700000 + i) for i in reversed(range(45))]
+
     @pytest.mark.asyncio
     async def test_filter_large_dataset(
         self, client: AsyncClient, db_session: AsyncSession, sample_category: Category
@@ -0,0 +1,97 @@
+"""Query plan regression tests.
+
+The hot listing queries must be served by their indexes in listing order.
+Sequential scans are disabled while explaining, so the small test tables
+still show whether an index *can* serve the query.
+"""
+import re
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Job, Category
+
+
+async def explain_request(client: AsyncClient, db_engine, db_session: AsyncSession, url: str) -> str:
+    """EXPLAIN the listing query the API runs for url."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "ORDER BY" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        response = await client.get(url)
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", capture)
+    assert response.status_code == 200
+
+    statement, parameters = statements[-1]
+    connection = await db_session.connection()
+    await connection.execute(text("SET enable_seqscan = off"))
+    try:
+        result = await connection.exec_driver_sql("EXPLAIN " + statement, parameters)
+        return "\n".join(row[0] for row in result)
+    finally:
+        await connection.execute(text("RESET enable_seqscan"))
+
+
+def has_sort(plan: str) -> bool:
+    """Whether the plan sorts rows (beyond reading an index in order)."""
+    return re.search(r"(^|->  )(Incremental )?Sort  \(", plan, re.MULTILINE) is not None
+
+
+class TestListingPlans:
+    """Test listing queries use the listing-order indexes."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def jobs(self, db_session: AsyncSession, sample_category: Category):
+        for i in range(40):
+            db_session.add(Job(
+                title_ge=f"ვაკანსია {i}",
+                body_ge=f"აღწერა {i}",
+                category_id=sample_category.id,
+                status="active" if i % 5 else "inactive",
+                parsed_from="jobs.ge",
+                external_id=str(600000 + i),
+                jobsge_lid=14 if i % 2 else 1,
+                jobsge_cid=6 if i % 3 else 2,
+                has_salary=i % 4 == 0,
+            ))
+        await db_session.commit()
+        await db_session.execute(text("ANALYZE jobs"))
+
+    @pytest.mark.asyncio
+    async def test_lid_listing_uses_index(self, client: AsyncClient, db_engine, db_session: AsyncSession):
+        """Test /api/v1/jobs?lid=14 is an index scan in listing order."""
+        plan = await explain_request(client, db_engine, db_session, "/api/v1/jobs?lid=14")
+
+        assert "Index Scan using idx_jobs_active_lid_sort" in plan, plan
+        assert not has_sort(plan), plan
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url, index", [
+        ("/api/v1/jobs", "idx_jobs_active_sort"),
+        ("/api/v1/jobs?cid=6", "idx_jobs_active_cid_sort"),
+        ("/api/v1/jobs?has_salary=true", "idx_jobs_active_salary_sort"),
+    ])
+    async def test_hot_filters_use_index(
+        self, client: AsyncClient, db_engine, db_session: AsyncSession, url: str, index: str
+    ):
+        """Test the other hot filter combinations have their index."""
+        plan = await explain_request(client, db_engine, db_session, url)
+
+        assert f"Index Scan using {index}" in plan, plan
+        assert not has_sort(plan), plan
+
+    @pytest.mark.asyncio
+    async def test_search_uses_indexes(self, client: AsyncClient, db_engine, db_session: AsyncSession):
+        """Test q= is answered from the full-text and trigram indexes."""
+        plan = await explain_request(client, db_engine, db_session, "/api/v1/jobs?q=ვაკანსია")
+
+        assert "idx_jobs_search_vector" in plan, plan
+        assert "idx_jobs_title_ge_trgm" in plan, plan
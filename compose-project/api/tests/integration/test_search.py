@@ -0,0 +1,90 @@
+"""Tests for job search (q= on /api/v1/jobs)."""
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Job, Category
+
+
+@pytest_asyncio.fixture
+async def search_jobs(db_session: AsyncSession, sample_category: Category) -> None:
+    """A few jobs with distinct titles, companies and bodies."""
+    jobs = [
+        ("Python დეველოპერი", "Python Developer", "Tech LLC", "ვეძებთ პროგრამისტს.", "Backend services in Django."),
+        ("ბუღალტერი", "Accountant", "Finance Group", "ბუღალტრული აღრიცხვა.", "We need an accountant with Python skills."),
+        ("მზარეული", "Cook", "Batumi Restaurant", "სამზარეულოს თანამშრომელი.", None),
+    ]
+    for i, (title_ge, title_en, company, body_ge, body_en) in enumerate(jobs):
+        db_session.add(Job(
+            title_ge=title_ge,
+            title_en=title_en,
+            company_name=company,
+            body_ge=body_ge,
+            body_en=body_en,
+            category_id=sample_category.id,
+            status="active",
+            parsed_from="search-test",
+            external_id=str(500000 + i),
+        ))
+    await db_session.commit()
+
+
+async def search(client: AsyncClient, q: str) -> list:
+    response = await client.get("/api/v1/jobs", params={"q": q})
+    assert response.status_code == 200
+    return response.json()["items"]
+
+
+@pytest.mark.usefixtures("search_jobs")
+class TestSearch:
+    """Test full-text and trigram matching, ranking and snippets."""
+
+    @pytest.mark.asyncio
+    async def test_georgian_title(self, client: AsyncClient):
+        """Test a Georgian title word matches."""
+        items = await search(client, "ბუღალტერი")
+
+        assert [item["title_en"] for item in items] == ["Accountant"]
+
+    @pytest.mark.asyncio
+    async def test_substring_of_company(self, client: AsyncClient):
+        """Test the old substring behaviour on company names still holds."""
+        items = await search(client, "Restaur")
+
+        assert [item["title_en"] for item in items] == ["Cook"]
+
+    @pytest.mark.asyncio
+    async def test_body_match_ranks_below_title_match(self, client: AsyncClient):
+        """Test body matches are found but title matches rank first."""
+        items = await search(client, "python")
+
+        assert [item["title_en"] for item in items] == ["Python Developer", "Accountant"]
+
+    @pytest.mark.asyncio
+    async def test_english_stemming(self, client: AsyncClient):
+        """Test English body words match other forms of the word."""
+        items = await search(client, "accountants")
+
+        assert "Accountant" in [item["title_en"] for item in items]
+
+    @pytest.mark.asyncio
+    async def test_typo_in_title(self, client: AsyncClient):
+        """Test a misspelt title word still finds the job."""
+        items = await search(client, "Develper")
+
+        assert "Python Developer" in [item["title_en"] for item in items]
+
+    @pytest.mark.asyncio
+    async def test_snippet_highlights_match(self, client: AsyncClient):
+        """Test search results carry a highlighted body excerpt."""
+        items = await search(client, "Django")
+
+        assert "<mark>Django</mark>" in items[0]["snippet"]
+
+    @pytest.mark.asyncio
+    async def test_no_snippet_without_query(self, client: AsyncClient):
+        """Test plain listings don't compute snippets."""
+        response = await client.get("/api/v1/jobs")
+
+        assert all(item["snippet"] is None for item in response.json()["items"])
@@ -0,0 +1,139 @@
+"""Unit tests for the job list query helpers."""
+import base64
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.services.job_service import LIST_COLUMNS, _list_item, decode_cursor, encode_cursor
+
+JOB_ID = uuid4()
+
+
+def raw_cursor(payload) -> str:
+    """A cursor with an arbitrary (possibly crafted) JSON payload."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+class TestCursor:
+    """Test keyset pagination cursors."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the sort value and id it was made from."""
+        job_id = uuid4()
+        cursor = encode_cursor("-external_id", 712345, job_id)
+
+        assert decode_cursor(cursor, "-external_id") == (712345, job_id)
+
+    def test_datetime_round_trip(self):
+        """Test datetime sort values survive the JSON payload."""
+        job_id = uuid4()
+        published = datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc)
+        cursor = encode_cursor("published_at", published, job_id)
+
+        assert decode_cursor(cursor, "published_at") == (published, job_id)
+
+    def test_null_sort_value(self):
+        """Test cursors into the NULLS LAST tail."""
+        job_id = uuid4()
+        cursor = encode_cursor("-deadline_at", None, job_id)
+
+        assert decode_cursor(cursor, "-deadline_at") == (None, job_id)
+
+    def test_other_sort_rejected(self):
+        """Test a cursor can't be reused with a different sort."""
+        cursor = encode_cursor("-external_id", 712345, uuid4())
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "published_at")
+
+    @pytest.mark.parametrize(
+        "cursor, sort_field",
+        [
+            ("not-a-cursor", "-external_id"),
+            ("e30", "-external_id"),
+            ("!!!", "-external_id"),
+            (raw_cursor([]), "-external_id"),
+            (raw_cursor({"s": "-external_id", "v": 1, "id": 123}), "-external_id"),
+            (raw_cursor({"s": "-external_id", "v": 1, "id": "not-a-uuid"}), "-external_id"),
+            (raw_cursor({"s": "-external_id", "v": "abc", "id": str(JOB_ID)}), "-external_id"),
+            (raw_cursor({"s": "-external_id", "v": "712345", "id": str(JOB_ID)}), "-external_id"),
+            (raw_cursor({"s": "-external_id", "v": 1.5, "id": str(JOB_ID)}), "-external_id"),
+            (raw_cursor({"s": "-external_id", "v": True, "id": str(JOB_ID)}), "-external_id"),
+            (raw_cursor({"s": "-external_id", "v": 2**63, "id": str(JOB_ID)}), "-external_id"),
+            (raw_cursor({"s": "-relevance", "v": "high", "id": str(JOB_ID)}), "-relevance"),
+            (raw_cursor({"s": "title_ge", "v": 5, "id": str(JOB_ID)}), "title_ge"),
+            (raw_cursor({"s": "title_ge", "v": "a\u0000b", "id": str(JOB_ID)}), "title_ge"),
+            (raw_cursor({"s": "published_at", "v": 1700000000, "id": str(JOB_ID)}), "published_at"),
+            (raw_cursor({"s": "published_at", "v": "yesterday", "id": str(JOB_ID)}), "published_at"),
+            (raw_cursor({"s": "published_at", "v": ["2026-01-15"], "id": str(JOB_ID)}), "published_at"),
+        ],
+    )
+    def test_malformed_rejected(self, cursor, sort_field):
+        """Test garbage cursors, and values of the wrong type for the sort, raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, sort_field)
+
+    @pytest.mark.parametrize(
+        "sort_field, value",
+        [("-relevance", 0.42), ("-relevance", 1), ("title_ge", "Python დეველოპერი")],
+    )
+    def test_sort_values_accepted(self, sort_field, value):
+        """Test each sort's own value type decodes."""
+        cursor = encode_cursor(sort_field, value, JOB_ID)
+
+        assert decode_cursor(cursor, sort_field) == (value, JOB_ID)
+
+
+class FakeRow:
+    """Result row stand-in exposing _mapping."""
+
+    def __init__(self, mapping: dict):
+        self._mapping = mapping
+
+
+def list_row(**overrides) -> FakeRow:
+    """A LIST_COLUMNS row for a job without category or region."""
+    mapping = {column.key: None for column in LIST_COLUMNS}
+    mapping.update(
+        id=uuid4(), external_id="712345", title_ge="Python დეველოპერი", remote_type="onsite",
+        has_salary=False, salary_currency="GEL", is_vip=False, status="active", parsed_from="jobs.ge",
+    )
+    mapping.update(overrides)
+    return FakeRow(mapping)
+
+
+class TestListItem:
+    """Test list rows map onto JobListItem without ORM objects."""
+
+    def test_no_body_columns(self):
+        """Test the list projection leaves out the job bodies."""
+        keys = {column.key for column in LIST_COLUMNS}
+
+        assert "body_ge" not in keys
+        assert "body_en" not in keys
+
+    def test_joined_names(self):
+        """Test category and region come from the joined columns."""
+        category_id, region_id = uuid4(), uuid4()
+        row = list_row(**{
+            "category__id": category_id, "category__name_ge": "IT", "category__slug": "it",
+            "category__is_active": True,
+            "region__id": region_id, "region__level": 2, "region__name_ge": "აჭარა",
+            "region__slug": "adjara", "region__is_active": True,
+        })
+
+        item = _list_item(row)
+
+        assert item.category.id == category_id
+        assert item.category.slug == "it"
+        assert item.region.slug == "adjara"
+        assert item.title_ge == "Python დეველოპერი"
+
+    def test_missing_relations(self):
+        """Test an outer join miss becomes None, not an empty object."""
+        item = _list_item(list_row())
+
+        assert item.category is None
+        assert item.region is None
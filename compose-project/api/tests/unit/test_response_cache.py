@@ -0,0 +1,119 @@
+"""Unit tests for the public endpoint response cache."""
+import time
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.core import response_cache
+from app.core.response_cache import ResponseCache
+
+
+def make_app(cache: ResponseCache) -> tuple:
+    """App with a counted jobs list, a region list and an admin write."""
+    app = FastAPI()
+    calls = {"jobs": 0, "regions": 0}
+
+    @app.middleware("http")
+    async def cache_middleware(request: Request, call_next):
+        return await response_cache.handle(cache, request, call_next)
+
+    @app.get("/api/v1/jobs")
+    async def jobs(page: int = 1):
+        calls["jobs"] += 1
+        return {"page": page, "calls": calls["jobs"]}
+
+    @app.get("/api/v1/regions")
+    async def regions():
+        calls["regions"] += 1
+        return {"calls": calls["regions"]}
+
+    @app.post("/api/v1/admin/jobs")
+    async def create_job():
+        return {"ok": True}
+
+    return app, calls
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    return ResponseCache(max_entries=10, ttl=60)
+
+
+@pytest_asyncio.fixture
+async def cache_client(cache: ResponseCache):
+    app, calls = make_app(cache)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        ac.calls = calls
+        yield ac
+
+
+class TestResponseCache:
+    """Test caching, revalidation and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_second_request_is_served_from_cache(self, cache_client: AsyncClient):
+        """Test a repeated request doesn't reach the endpoint."""
+        first = await cache_client.get("/api/v1/jobs?page=1&lid=14")
+        second = await cache_client.get("/api/v1/jobs?lid=14&page=1")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+        assert cache_client.calls["jobs"] == 1
+        assert second.headers["Cache-Control"].startswith("public, max-age=")
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_gets_304(self, cache_client: AsyncClient):
+        """Test a client holding the current ETag gets no body."""
+        first = await cache_client.get("/api/v1/regions")
+        response = await cache_client.get("/api/v1/regions", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == first.headers["ETag"]
+
+    @pytest.mark.asyncio
+    async def test_deep_pages_and_cursors_bypass_cache(self, cache_client: AsyncClient):
+        """Test only the first job list pages are cached."""
+        for _ in range(2):
+            await cache_client.get("/api/v1/jobs?page=50")
+            await cache_client.get("/api/v1/jobs?cursor=abc")
+
+        assert cache_client.calls["jobs"] == 4
+
+    @pytest.mark.asyncio
+    async def test_tag_invalidation(self, cache_client: AsyncClient, cache: ResponseCache):
+        """Test jobs_changed drops job lists but keeps regions."""
+        await cache_client.get("/api/v1/jobs")
+        await cache_client.get("/api/v1/regions")
+
+        assert cache.invalidate("jobs") == 1
+        await cache_client.get("/api/v1/jobs")
+        await cache_client.get("/api/v1/regions")
+
+        assert cache_client.calls == {"jobs": 2, "regions": 1}
+
+    @pytest.mark.asyncio
+    async def test_admin_write_invalidates_everything(self, cache_client: AsyncClient, cache: ResponseCache):
+        """Test a successful admin write empties the cache."""
+        await cache_client.get("/api/v1/jobs")
+        await cache_client.get("/api/v1/regions")
+        await cache_client.post("/api/v1/admin/jobs")
+
+        assert len(cache) == 0
+
+    def test_lru_and_ttl(self):
+        """Test least recently used and expired entries are dropped."""
+        cache = ResponseCache(max_entries=2, ttl=60)
+        cache.put(("/a", ""), b"a", "application/json", set())
+        cache.put(("/b", ""), b"b", "application/json", set())
+        cache.get(("/a", ""))
+        cache.put(("/c", ""), b"c", "application/json", set())
+
+        assert cache.get(("/b", "")) is None
+        assert cache.get(("/a", "")).body == b"a"
+
+        cache.get(("/c", "")).expires_at = time.monotonic() - 1
+        assert cache.get(("/c", "")) is None
@@ -1,10 +1,16 @@
 """Base adapter interface for job parsers."""
+import asyncio
 from abc import ABC, abstractmethod
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, AsyncIterator
+from typing import Awaitable, Callable, Deque, Iterable, Iterator, Optional, List, AsyncIterator, Union
 from uuid import UUID
 
+from . import metrics
+from .config import get_config
+from .seen_index import SeenIndex
+
 
 @dataclass
 class JobData:
@@ -63,12 +69,70 @@ class JobData:
     raw_data: dict = field(default_factory=dict)
 
 
+# Error messages kept verbatim per run (the rest are only counted by kind),
+# and the longest message kept
+MAX_KEPT_ERRORS = 100
+MAX_ERROR_LENGTH = 500
+
+
+class ErrorLog:
+    """Bounded record of a run's errors.
+
+    Keeps the last MAX_KEPT_ERRORS messages and counts every error by kind
+    ("list:HTTPClientError", ...), so a misbehaving source can't grow worker
+    memory or the parse_jobs.errors column. Each error is also handed to
+    the sink (the runner's telemetry) as it happens.
+    """
+
+    def __init__(self, sink: Optional[Callable[[str, str], None]] = None, keep: int = MAX_KEPT_ERRORS):
+        """Initialize an empty log.
+
+        Args:
+            sink: Called with (kind, message) for every error
+            keep: Number of recent messages kept
+        """
+        self.sink = sink
+        self.recent: Deque[str] = deque(maxlen=keep)
+        self.counts: Counter = Counter()
+
+    def append(self, message: str, kind: str = "error"):
+        """Record one error."""
+        message = message[:MAX_ERROR_LENGTH]
+        self.recent.append(message)
+        self.counts[kind] += 1
+        if self.sink:
+            self.sink(kind, message)
+
+    def extend(self, other: Union["ErrorLog", Iterable[str]]):
+        """Merge another run's errors (already seen by that run's sink)."""
+        if isinstance(other, ErrorLog):
+            self.recent.extend(other.recent)
+            self.counts.update(other.counts)
+        else:
+            for message in other:
+                self.append(message)
+
+    def summary(self) -> List[str]:
+        """Kept messages, led by the counts per kind if any were dropped."""
+        total = len(self)
+        if total <= len(self.recent):
+            return list(self.recent)
+        kinds = ", ".join(f"{kind}: {count}" for kind, count in self.counts.most_common())
+        return [f"{total} errors ({kinds}); last {len(self.recent)} kept", *self.recent]
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.recent)
+
+
 @dataclass
 class ParseResult:
     """Result of a parsing operation."""
 
     jobs: List[JobData] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
+    errors: ErrorLog = field(default_factory=ErrorLog)
     total_found: int = 0
     pages_parsed: int = 0
 
@@ -96,6 +160,26 @@ class BaseAdapter(ABC):
     rate_limit_delay: float = 1.0  # Seconds between requests
     max_pages: int = 100  # Maximum pages to parse per run
 
+    # Incremental run: only new/changed listings, stop paginating at the
+    # first fully known page. Adapters that can't tell ignore it.
+    incremental: bool = False
+
+    # Listings already crawled in this sweep; the runner shares one index
+    # across all adapters of a run/batch. None = fresh index per run().
+    seen_index: Optional[SeenIndex] = None
+
+    # Detail pages fetched concurrently by the default run()/stream().
+    # None = CRAWL_CONCURRENCY.
+    max_concurrency: Optional[int] = None
+
+    # Receives (kind, message) for each error of a run as it happens; the
+    # runner streams them to the parse job's telemetry
+    error_sink: Optional[Callable[[str, str], None]] = None
+
+    def new_result(self) -> ParseResult:
+        """Empty ParseResult whose errors go to error_sink."""
+        return ParseResult(errors=ErrorLog(self.error_sink))
+
     @abstractmethod
     async def discover_job_urls(self, region: Optional[str] = None) -> AsyncIterator[str]:
         """Discover job listing URLs to parse.
@@ -139,31 +223,118 @@ class BaseAdapter(ABC):
         """
         pass
 
-    async def run(self, region: Optional[str] = None) -> ParseResult:
+    async def run(
+        self,
+        region: Optional[str] = None,
+        on_job_parsed: Optional[Callable[[JobData], Awaitable[str]]] = None,
+        on_jobs_seen: Optional[Callable[[list], Awaitable[None]]] = None,
+    ) -> ParseResult:
         """Execute a full parsing run.
 
         This is the main entry point for running the parser.
-        Default implementation iterates through discover_job_urls
-        and parses each job.
+        Default implementation consumes stream(): job URLs are discovered
+        while up to max_concurrency of them are parsed in parallel.
 
         Args:
             region: Optional region filter
+            on_job_parsed: Optional async callback called for each parsed job.
+                          If provided, jobs are NOT collected in result.jobs
+                          (memory stays flat). Calls are never concurrent.
+            on_jobs_seen: Accepted for interface compatibility; the default
+                          run has no list-page context to report
 
         Returns:
-            ParseResult with all parsed jobs and statistics
+            ParseResult with parsed jobs (unless on_job_parsed is given)
+            and statistics
         """
-        result = ParseResult()
+        result = self.new_result()
+
+        async for job in self.stream(region, result):
+            if on_job_parsed:
+                await on_job_parsed(job)
+            else:
+                result.jobs.append(job)
+
+        return result
 
-        async for url in self.discover_job_urls(region):
-            result.total_found += 1
+    async def stream(
+        self,
+        region: Optional[str] = None,
+        result: Optional[ParseResult] = None,
+    ) -> AsyncIterator[JobData]:
+        """Yield parsed jobs as they complete.
+
+        A producer iterates discover_job_urls() and starts parse_job() for
+        each URL, with at most max_concurrency parses in flight; finished
+        jobs are handed over through a bounded queue, so a slow consumer
+        slows fetching down instead of buffering jobs. Jobs arrive in
+        completion order.
+
+        Args:
+            region: Optional region filter
+            result: ParseResult to record total_found and errors in
+
+        Yields:
+            JobData for every successfully parsed job
+
+        Raises:
+            Whatever discover_job_urls() raised, after in-flight jobs
+            have been yielded
+        """
+        if result is None:
+            result = self.new_result()
+        concurrency = max(1, self.max_concurrency or get_config().crawl_concurrency)
+        slots = asyncio.Semaphore(concurrency)
+        parsed: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        finished = object()
+        discovery_error: List[BaseException] = []
+
+        async def parse(url: str):
             try:
                 job = await self.parse_job(url)
                 if job:
-                    result.jobs.append(job)
+                    await parsed.put(job)
             except Exception as e:
-                result.errors.append(f"Error parsing {url}: {str(e)}")
+                result.errors.append(f"Error parsing {url}: {str(e)}", kind=f"detail:{type(e).__name__}")
+            finally:
+                slots.release()
 
-        return result
+        async def produce():
+            tasks = set()
+            try:
+                async for url in self.discover_job_urls(region):
+                    result.total_found += 1
+                    await slots.acquire()
+                    task = asyncio.create_task(parse(url))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                if tasks:
+                    await asyncio.gather(*tasks)
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                raise
+            except Exception as e:
+                discovery_error.append(e)
+                if tasks:
+                    await asyncio.gather(*tasks)
+            await parsed.put(finished)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                job = await parsed.get()
+                metrics.set_queue_depth("adapter_stream", parsed.qsize())
+                if job is finished:
+                    break
+                yield job
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+        if discovery_error:
+            raise discovery_error[0]
 
     def extract_external_id(self, url: str) -> Optional[str]:
         """Extract external ID from URL.
@@ -44,6 +44,11 @@ class ParserConfig:
     not_seen_days_to_inactive: int = field(
         default_factory=lambda: int(os.getenv("NOT_SEEN_DAYS_TO_INACTIVE", "7"))
     )
+    # Scheduled runs are incremental; a full sweep (which refreshes
+    # last_seen_at and deactivates unseen jobs) runs this often
+    full_sweep_hours: int = field(
+        default_factory=lambda: int(os.getenv("FULL_SWEEP_HOURS", "24"))
+    )
 
     # Rate limiting
     rate_limit_delay: float = field(
@@ -56,6 +61,56 @@ class ParserConfig:
         default_factory=lambda: float(os.getenv("REQUEST_TIMEOUT", "30.0"))
     )
 
+    # Crawl concurrency and per-host politeness budget
+    # (empty HOST_REQUESTS_PER_SECOND = derive from adapter's rate_limit_delay)
+    crawl_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("CRAWL_CONCURRENCY", "4"))
+    )
+    host_requests_per_second: Optional[float] = field(
+        default_factory=lambda: float(os.getenv("HOST_REQUESTS_PER_SECOND")) if os.getenv("HOST_REQUESTS_PER_SECOND") else None
+    )
+    host_request_burst: float = field(
+        default_factory=lambda: float(os.getenv("HOST_REQUEST_BURST", "1"))
+    )
+    # Seconds after which a run skips optional work (English pages) and
+    # finishes the Georgian crawl (empty = no budget)
+    crawl_budget_seconds: Optional[float] = field(
+        default_factory=lambda: float(os.getenv("CRAWL_BUDGET_SECONDS")) if os.getenv("CRAWL_BUDGET_SECONDS") else None
+    )
+    # Fetch English versions of job pages (only where one is likely to exist)
+    english_enrichment: bool = field(
+        default_factory=lambda: os.getenv("ENGLISH_ENRICHMENT", "true").lower() == "true"
+    )
+    # Adapt each host's budget to its responses (AIMD): up to
+    # HOST_MAX_REQUESTS_PER_SECOND (empty = 4x the budget) while fast, down
+    # on 429/503 or rising latency
+    adaptive_rate: bool = field(
+        default_factory=lambda: os.getenv("ADAPTIVE_RATE", "true").lower() == "true"
+    )
+    host_max_requests_per_second: Optional[float] = field(
+        default_factory=lambda: float(os.getenv("HOST_MAX_REQUESTS_PER_SECOND")) if os.getenv("HOST_MAX_REQUESTS_PER_SECOND") else None
+    )
+
+    # Parsed jobs written per INSERT ... ON CONFLICT batch
+    upsert_batch_size: int = field(
+        default_factory=lambda: int(os.getenv("UPSERT_BATCH_SIZE", "50"))
+    )
+
+    # HTML parsing process pool (empty = one worker per core, 0 = parse
+    # inline on the event loop)
+    parse_workers: Optional[int] = field(
+        default_factory=lambda: int(os.getenv("PARSE_WORKERS")) if os.getenv("PARSE_WORKERS") else None
+    )
+
+    # Parse job bookkeeping: progress/item writes, and pause/stop flag
+    # polling when LISTEN/NOTIFY is unavailable
+    progress_flush_seconds: float = field(
+        default_factory=lambda: float(os.getenv("PROGRESS_FLUSH_SECONDS", "1.0"))
+    )
+    control_refresh_seconds: float = field(
+        default_factory=lambda: float(os.getenv("CONTROL_REFRESH_SECONDS", "1.0"))
+    )
+
     # Parsing limits
     max_pages_per_run: int = field(
         default_factory=lambda: int(os.getenv("MAX_PAGES_PER_RUN", "100"))
@@ -74,6 +129,20 @@ class ParserConfig:
         ]
     )
 
+    # Detail page cache (conditional requests, skip unchanged listings)
+    detail_cache_enabled: bool = field(
+        default_factory=lambda: os.getenv("DETAIL_CACHE_ENABLED", "true").lower() == "true"
+    )
+    detail_cache_path: str = field(
+        default_factory=lambda: os.getenv("DETAIL_CACHE_PATH", "/app/cache/detail_cache.db")
+    )
+    detail_cache_refresh_hours: int = field(
+        default_factory=lambda: int(os.getenv("DETAIL_CACHE_REFRESH_HOURS", "24"))
+    )
+    detail_cache_max_age_days: int = field(
+        default_factory=lambda: int(os.getenv("DETAIL_CACHE_MAX_AGE_DAYS", "30"))
+    )
+
     # Regions to parse (empty or "all" means no filter - get all jobs)
     regions: List[str] = field(
         default_factory=lambda: _parse_regions(os.getenv("PARSE_REGIONS", "all"))
@@ -86,6 +155,11 @@ class ParserConfig:
         ]
     )
 
+    # Prometheus /metrics port (empty = metrics off)
+    metrics_port: Optional[int] = field(
+        default_factory=lambda: int(os.getenv("METRICS_PORT")) if os.getenv("METRICS_PORT") else None
+    )
+
     # Debug
     debug: bool = field(
         default_factory=lambda: os.getenv("DEBUG", "false").lower() == "true"
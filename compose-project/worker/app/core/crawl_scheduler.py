@@ -0,0 +1,324 @@
+"""Crawl scheduling: per-host request budgets and a prioritized worker pool.
+
+- TokenBucket / HostRateLimiter enforce a requests-per-second budget per host,
+  shared by every HTTPClient in the process (parallel region runs included).
+- AdaptiveRate moves each host's budget AIMD-style: up while responses stay
+  fast, halved on 429/503 or rising latency, paused for Retry-After.
+- CrawlScheduler runs list-page and detail-page tasks from a priority
+  frontier with a bounded number of concurrent workers, so list discovery and
+  detail parsing overlap while the host budget stays saturated.
+"""
+import asyncio
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import structlog
+
+from . import metrics
+from .config import get_config
+
+logger = structlog.get_logger()
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: float):
+        """Change the refill rate (tokens accrued so far are kept)."""
+        self._refill()
+        self.rate = rate
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the next `seconds` (e.g. Retry-After)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available and take them."""
+        async with self._lock:
+            while True:
+                paused = self._paused_until - time.monotonic()
+                if paused > 0:
+                    await asyncio.sleep(paused)
+                    continue
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class AdaptiveRate:
+    """AIMD control of one host's request rate.
+
+    Every healthy response adds a small step to the rate, up to max_rate.
+    A 429/503, or recent latency well above its running baseline, halves
+    it (down to a floor), at most once per cooldown so a burst of slow
+    responses counts as one congestion signal.
+    """
+
+    INCREASE_STEP = 0.05  # fraction of the base rate added per healthy response
+    DECREASE_FACTOR = 0.5
+    MIN_FRACTION = 0.1  # floor, as a fraction of the base rate
+    LATENCY_FACTOR = 2.0  # recent/baseline latency ratio that signals congestion
+    WARMUP_SAMPLES = 5
+    DECREASE_COOLDOWN = 2.0  # seconds
+
+    def __init__(self, bucket: TokenBucket, base_rate: float, max_rate: float):
+        """Initialize controller.
+
+        Args:
+            bucket: Token bucket whose rate is controlled
+            base_rate: Configured requests per second (starting point)
+            max_rate: Ceiling for the rate
+        """
+        self.bucket = bucket
+        self.base_rate = base_rate
+        self.max_rate = max(max_rate, base_rate)
+        self.min_rate = base_rate * self.MIN_FRACTION
+        self._recent: Optional[float] = None  # fast EWMA of latency
+        self._baseline: Optional[float] = None  # slow EWMA of latency
+        self._samples = 0
+        self._last_decrease = float("-inf")
+
+    @property
+    def rate(self) -> float:
+        """Current requests-per-second budget."""
+        return self.bucket.rate
+
+    def on_response(self, status_code: int, latency: Optional[float] = None) -> Optional[str]:
+        """Adjust the rate for one response.
+
+        Returns:
+            Reason if the rate was decreased, else None
+        """
+        if status_code in (429, 503):
+            return self._decrease(f"status_{status_code}")
+        if latency is None or status_code >= 400:
+            return None
+
+        self._samples += 1
+        if self._recent is None:
+            self._recent = self._baseline = latency
+        else:
+            self._recent = 0.3 * latency + 0.7 * self._recent
+            self._baseline = 0.02 * latency + 0.98 * self._baseline
+
+        if self._samples >= self.WARMUP_SAMPLES and self._recent > self.LATENCY_FACTOR * self._baseline:
+            return self._decrease("latency")
+        self.bucket.set_rate(min(self.max_rate, self.rate + self.base_rate * self.INCREASE_STEP))
+        return None
+
+    def _decrease(self, reason: str) -> Optional[str]:
+        now = time.monotonic()
+        if now - self._last_decrease < self.DECREASE_COOLDOWN:
+            return None
+        self._last_decrease = now
+        self.bucket.set_rate(max(self.min_rate, self.rate * self.DECREASE_FACTOR))
+        return reason
+
+
+class HostRateLimiter:
+    """Token bucket per host, optionally AIMD-controlled."""
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        burst: float = 1.0,
+        adaptive: bool = False,
+        max_rate: Optional[float] = None,
+        max_rate_factor: float = 4.0,
+    ):
+        """Initialize limiter.
+
+        Args:
+            default_rate: Requests per second for hosts without explicit rate
+            burst: Bucket capacity per host
+            adaptive: Adjust each host's rate from observed responses
+            max_rate: Ceiling for adaptive rates (None = max_rate_factor
+                      times the host's configured rate)
+            max_rate_factor: See max_rate
+        """
+        self.default_rate = default_rate
+        self.burst = burst
+        self.adaptive = adaptive
+        self.max_rate = max_rate
+        self.max_rate_factor = max_rate_factor
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._controllers: Dict[str, AdaptiveRate] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.default_rate, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _controller(self, host: str, base_rate: float) -> AdaptiveRate:
+        controller = self._controllers.get(host)
+        if controller is None or controller.base_rate != base_rate:
+            bucket = self._bucket(host)
+            bucket.set_rate(base_rate)
+            controller = AdaptiveRate(bucket, base_rate, self.max_rate or base_rate * self.max_rate_factor)
+            self._controllers[host] = controller
+        return controller
+
+    def set_rate(self, host: str, rate: float):
+        """Set requests-per-second budget for a host.
+
+        With adaptive control this is the base rate; an adapted rate is kept
+        across runs as long as the base rate doesn't change.
+        """
+        if self.adaptive:
+            self._controller(host, rate)
+        else:
+            self._bucket(host).set_rate(rate)
+
+    def get_rate(self, host: str) -> float:
+        """Get current requests-per-second budget for a host."""
+        return self._bucket(host).rate
+
+    def rates(self) -> Dict[str, float]:
+        """Current requests-per-second budget of every host seen."""
+        return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+    async def acquire(self, url: str):
+        """Wait for a request slot for the URL's host."""
+        await self._bucket(urlparse(url).hostname or "").acquire()
+
+    def observe(
+        self,
+        url: str,
+        status_code: int,
+        latency: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ):
+        """Feed back one response for the URL's host.
+
+        Args:
+            url: Requested URL
+            status_code: Response status
+            latency: Seconds the request took
+            retry_after: Server-requested pause (Retry-After), honored even
+                         without adaptive control
+        """
+        host = urlparse(url).hostname or ""
+        if retry_after:
+            self._bucket(host).pause(retry_after)
+        if not self.adaptive:
+            return
+
+        controller = self._controllers.get(host) or self._controller(host, self._bucket(host).rate)
+        reason = controller.on_response(status_code, latency)
+        if reason:
+            logger.info(
+                "host_rate_decreased",
+                host=host,
+                rate=round(controller.rate, 3),
+                reason=reason,
+                retry_after=retry_after,
+            )
+
+
+_host_rate_limiter: Optional[HostRateLimiter] = None
+
+
+def get_host_rate_limiter() -> HostRateLimiter:
+    """Get the process-wide host rate limiter."""
+    global _host_rate_limiter
+    if _host_rate_limiter is None:
+        config = get_config()
+        _host_rate_limiter = HostRateLimiter(
+            default_rate=config.host_requests_per_second or 1.0,
+            burst=config.host_request_burst,
+            adaptive=config.adaptive_rate,
+            max_rate=config.host_max_requests_per_second,
+        )
+    return _host_rate_limiter
+
+
+class CrawlScheduler:
+    """Bounded worker pool over a priority frontier of crawl tasks.
+
+    Lower priority values run first; tasks with equal priority run in
+    submission order. Tasks may submit further tasks while running.
+    Exceptions in tasks are logged and swallowed, except cancellation,
+    which stops the whole crawl and propagates from run().
+    """
+
+    def __init__(self, concurrency: int = 4):
+        """Initialize scheduler.
+
+        Args:
+            concurrency: Number of concurrent workers
+        """
+        self.concurrency = max(1, concurrency)
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+
+    def submit(self, priority: int, func: Callable[..., Awaitable[Any]], *args):
+        """Add a task to the frontier.
+
+        Args:
+            priority: Task priority (lower runs first)
+            func: Async function to run
+            *args: Arguments for func
+        """
+        self._queue.put_nowait((priority, next(self._sequence), func, args))
+        metrics.set_queue_depth("crawl_frontier", self._queue.qsize())
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks waiting in the frontier."""
+        return self._queue.qsize()
+
+    async def _worker(self):
+        while True:
+            _, _, func, args = await self._queue.get()
+            metrics.set_queue_depth("crawl_frontier", self._queue.qsize())
+            try:
+                await func(*args)
+            except Exception as e:
+                logger.warning("crawl_task_failed", task=func.__name__, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def run(self):
+        """Run until the frontier is drained.
+
+        Raises:
+            asyncio.CancelledError: If a task was cancelled (e.g. job stopped)
+        """
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        drained = asyncio.create_task(self._queue.join())
+        try:
+            done, _ = await asyncio.wait([drained, *workers], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not drained:
+                    # Workers only finish by cancellation - re-raise it
+                    task.result()
+        finally:
+            drained.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(drained, *workers, return_exceptions=True)
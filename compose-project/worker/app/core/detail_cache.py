@@ -0,0 +1,224 @@
+"""Persistent detail-page cache for conditional fetching.
+
+Stores, per (source, external_id, language), the validators returned by the
+source (ETag / Last-Modified), a digest of the page body and the parsed
+payload. It also remembers the list-page signature last seen for each job,
+so adapters can skip a detail fetch entirely when the listing row has not
+changed since the previous run, and whether postings (per job and per
+company) turned out to have a distinct English version.
+
+The cache lives in a local SQLite file so it survives worker restarts
+without adding load to the main PostgreSQL database.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import structlog
+
+from .config import get_config
+
+logger = structlog.get_logger()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS detail_pages (
+    source TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    digest TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (source, external_id, lang)
+);
+CREATE TABLE IF NOT EXISTS list_signatures (
+    source TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (source, external_id)
+);
+CREATE TABLE IF NOT EXISTS english_hints (
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    checked INTEGER NOT NULL,
+    differed INTEGER NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (source, key)
+);
+"""
+
+
+def body_digest(text: str) -> str:
+    """Compute SHA-256 digest of a response body."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedPage:
+    """A cached detail page entry."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: str
+    payload: dict
+    fetched_at: float
+
+    def age_seconds(self) -> float:
+        """Seconds since the page was last fetched or revalidated."""
+        return time.time() - self.fetched_at
+
+
+class DetailCache:
+    """SQLite-backed cache of job detail pages and list signatures."""
+
+    def __init__(self, path: str):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Path to the SQLite file, or ":memory:" for a throwaway cache
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get_page(self, source: str, external_id: str, lang: str) -> Optional[CachedPage]:
+        """Get a cached detail page."""
+        row = self._conn.execute(
+            "SELECT etag, last_modified, digest, payload, fetched_at FROM detail_pages "
+            "WHERE source = ? AND external_id = ? AND lang = ?",
+            (source, external_id, lang),
+        ).fetchone()
+        if not row:
+            return None
+        return CachedPage(
+            etag=row[0],
+            last_modified=row[1],
+            digest=row[2],
+            payload=json.loads(row[3]),
+            fetched_at=row[4],
+        )
+
+    def put_page(
+        self,
+        source: str,
+        external_id: str,
+        lang: str,
+        digest: str,
+        payload: dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store a freshly fetched and parsed detail page."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO detail_pages "
+            "(source, external_id, lang, etag, last_modified, digest, payload, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                source, external_id, lang, etag, last_modified, digest,
+                json.dumps(payload, ensure_ascii=False), time.time(),
+            ),
+        )
+
+    def touch_page(
+        self,
+        source: str,
+        external_id: str,
+        lang: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Mark a cached page as revalidated (304 or identical body)."""
+        self._conn.execute(
+            "UPDATE detail_pages SET fetched_at = ?, "
+            "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+            "WHERE source = ? AND external_id = ? AND lang = ?",
+            (time.time(), etag, last_modified, source, external_id, lang),
+        )
+
+    def get_signature(self, source: str, external_id: str) -> Optional[str]:
+        """Get the list-page signature recorded for a job."""
+        row = self._conn.execute(
+            "SELECT signature FROM list_signatures WHERE source = ? AND external_id = ?",
+            (source, external_id),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_signature(self, source: str, external_id: str, signature: str):
+        """Record the list-page signature for a job."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO list_signatures (source, external_id, signature, seen_at) "
+            "VALUES (?, ?, ?, ?)",
+            (source, external_id, signature, time.time()),
+        )
+
+    def get_english_hint(self, source: str, key: str) -> Optional[Tuple[int, int]]:
+        """Get (pages checked, pages with distinct English) for a job or company key."""
+        row = self._conn.execute(
+            "SELECT checked, differed FROM english_hints WHERE source = ? AND key = ?",
+            (source, key),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def record_english(self, source: str, key: str, differed: bool):
+        """Count one English page check for a key ("job:<id>" or "company:<name>")."""
+        self._conn.execute(
+            "INSERT INTO english_hints (source, key, checked, differed, seen_at) "
+            "VALUES (?, ?, 1, ?, ?) "
+            "ON CONFLICT (source, key) DO UPDATE SET checked = checked + 1, "
+            "differed = differed + excluded.differed, seen_at = excluded.seen_at",
+            (source, key, int(differed), time.time()),
+        )
+
+    def prune(self, max_age_days: int) -> int:
+        """Remove entries not fetched or seen within max_age_days.
+
+        English hints age out too, so skipped companies are checked again.
+
+        Returns:
+            Number of rows removed
+        """
+        cutoff = time.time() - max_age_days * 86400
+        pages = self._conn.execute("DELETE FROM detail_pages WHERE fetched_at < ?", (cutoff,))
+        signatures = self._conn.execute("DELETE FROM list_signatures WHERE seen_at < ?", (cutoff,))
+        hints = self._conn.execute("DELETE FROM english_hints WHERE seen_at < ?", (cutoff,))
+        return pages.rowcount + signatures.rowcount + hints.rowcount
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+_shared_cache: Optional[DetailCache] = None
+
+
+def get_detail_cache() -> Optional[DetailCache]:
+    """Get the process-wide detail cache, or None if disabled/unavailable."""
+    global _shared_cache
+
+    config = get_config()
+    if not config.detail_cache_enabled:
+        return None
+
+    if _shared_cache is None:
+        try:
+            _shared_cache = DetailCache(config.detail_cache_path)
+            logger.info("detail_cache_opened", path=config.detail_cache_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("detail_cache_unavailable", path=config.detail_cache_path, error=str(e))
+            return None
+
+    return _shared_cache
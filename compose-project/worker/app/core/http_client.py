@@ -1,7 +1,11 @@
 """HTTP client with retry logic and rate limiting."""
 import asyncio
 import random
-from typing import Optional, Dict, Any
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional, Dict, Any
 import httpx
 from tenacity import (
     retry,
@@ -10,6 +14,24 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 (httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from . import metrics
+
+if TYPE_CHECKING:
+    from .crawl_scheduler import HostRateLimiter
+
+
+# Statuses that mean "slow down": backed off and retried
+RATE_LIMIT_STATUSES = (429, 503)
+
+# Longest Retry-After honored, in seconds
+MAX_RETRY_AFTER = 300.0
+
 
 class HTTPClientError(Exception):
     """Base exception for HTTP client errors."""
@@ -19,6 +41,43 @@ class HTTPClientError(Exception):
         self.status_code = status_code
 
 
+class RateLimitedError(HTTPClientError):
+    """The server answered 429/503; the request is retried after backing off."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds.
+
+    Returns:
+        Seconds to wait (capped at MAX_RETRY_AFTER), or None if absent/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+@dataclass
+class ConditionalResponse:
+    """Result of a conditional GET request."""
+
+    not_modified: bool
+    text: Optional[str] = None
+    content: Optional[bytes] = None  # raw body, for parsing off the event loop
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
 class HTTPClient:
     """Async HTTP client with retry logic, rate limiting, and error handling."""
 
@@ -37,6 +96,11 @@ class HTTPClient:
         max_retries: int = 3,
         headers: Optional[Dict[str, str]] = None,
         proxy: Optional[str] = None,
+        rate_limiter: Optional["HostRateLimiter"] = None,
+        http2: bool = False,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 30.0,
     ):
         """Initialize HTTP client.
 
@@ -46,13 +110,28 @@ class HTTPClient:
             max_retries: Maximum retry attempts
             headers: Additional headers to include
             proxy: Proxy URL (optional)
+            rate_limiter: Shared per-host rate limiter. When set, it replaces
+                         the per-client rate_limit_delay sleep.
+            http2: Negotiate HTTP/2 where the server supports it (needs the
+                   h2 package; falls back to HTTP/1.1 keep-alive without it)
+            max_connections: Connection pool size (None = httpx default)
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept
         """
         self.timeout = timeout
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
         self._last_request_time = 0.0
+        self._not_before = 0.0  # Retry-After deadline (without rate_limiter)
         self._headers = {**self.DEFAULT_HEADERS, **(headers or {})}
         self._proxy = proxy
+        self._rate_limiter = rate_limiter
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._limits = httpx.Limits(
+            max_connections=max_connections or 100,
+            max_keepalive_connections=max_keepalive_connections or max_connections or 20,
+            keepalive_expiry=keepalive_expiry,
+        )
         self._client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
@@ -62,6 +141,8 @@ class HTTPClient:
             follow_redirects=True,
             headers=self._headers,
             proxy=self._proxy,
+            http2=self._http2,
+            limits=self._limits,
         )
         return self
 
@@ -71,9 +152,16 @@ class HTTPClient:
             await self._client.aclose()
             self._client = None
 
-    async def _rate_limit(self):
+    async def _rate_limit(self, url: str):
         """Apply rate limiting between requests."""
+        if self._rate_limiter:
+            await self._rate_limiter.acquire(url)
+            return
+
         current_time = asyncio.get_event_loop().time()
+        if current_time < self._not_before:
+            await asyncio.sleep(self._not_before - current_time)
+            current_time = asyncio.get_event_loop().time()
         elapsed = current_time - self._last_request_time
         if elapsed < self.rate_limit_delay:
             # Add small random jitter to avoid patterns
@@ -81,10 +169,23 @@ class HTTPClient:
             await asyncio.sleep(self.rate_limit_delay - elapsed + jitter)
         self._last_request_time = asyncio.get_event_loop().time()
 
+    def _observe(self, url: str, response: httpx.Response, latency: float):
+        """Report a response to metrics and the rate limiter (latency, 429/503, Retry-After)."""
+        metrics.observe_fetch(url, response.status_code, latency)
+        retry_after = None
+        if response.status_code in RATE_LIMIT_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+        if self._rate_limiter:
+            self._rate_limiter.observe(url, response.status_code, latency, retry_after)
+        elif retry_after:
+            deadline = asyncio.get_event_loop().time() + retry_after
+            self._not_before = max(self._not_before, deadline)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError, RateLimitedError)),
     )
     async def get(
         self,
@@ -100,26 +201,33 @@ class HTTPClient:
             headers: Additional headers
 
         Returns:
-            HTTP response
+            HTTP response (304 responses are returned, not raised)
 
         Raises:
-            HTTPClientError: On HTTP errors
+            RateLimitedError: On 429/503 once retries are exhausted
+            HTTPClientError: On other HTTP errors
         """
         if not self._client:
             raise RuntimeError("HTTPClient must be used as async context manager")
 
-        await self._rate_limit()
+        await self._rate_limit(url)
 
         try:
+            started = time.monotonic()
             response = await self._client.get(url, params=params, headers=headers)
+            self._observe(url, response, time.monotonic() - started)
+            if response.status_code == 304:
+                return response
             response.raise_for_status()
             return response
         except httpx.HTTPStatusError as e:
-            raise HTTPClientError(
+            error_class = RateLimitedError if e.response.status_code in RATE_LIMIT_STATUSES else HTTPClientError
+            raise error_class(
                 f"HTTP error {e.response.status_code}: {e.response.text[:200]}",
                 status_code=e.response.status_code,
             ) from e
         except httpx.RequestError as e:
+            metrics.observe_fetch(url, "error", time.monotonic() - started)
             raise HTTPClientError(f"Request error: {str(e)}") from e
 
     async def get_text(
@@ -142,6 +250,59 @@ class HTTPClient:
         response.encoding = encoding
         return response.text
 
+    async def get_bytes(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Get the raw response body (e.g. for a ParseExecutor).
+
+        Args:
+            url: URL to request
+            params: Query parameters
+
+        Returns:
+            Response body bytes
+        """
+        response = await self.get(url, params=params)
+        return response.content
+
+    async def get_conditional(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        encoding: str = "utf-8",
+    ) -> ConditionalResponse:
+        """GET with If-None-Match / If-Modified-Since validators.
+
+        Args:
+            url: URL to request
+            etag: ETag from a previous response
+            last_modified: Last-Modified from a previous response
+            encoding: Text encoding
+
+        Returns:
+            ConditionalResponse with body text unless the server answered 304
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = await self.get(url, headers=headers or None)
+        result = ConditionalResponse(
+            not_modified=response.status_code == 304,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        if not result.not_modified:
+            response.encoding = encoding
+            result.text = response.text
+            result.content = response.content
+        return result
+
     async def get_json(
         self,
         url: str,
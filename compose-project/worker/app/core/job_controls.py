@@ -0,0 +1,227 @@
+"""Pause/stop control channel for running parse jobs.
+
+The parse_jobs row stays the source of truth for should_pause /
+should_stop / status. Whoever changes it (admin API, runner control
+methods) also sends ``NOTIFY parse_job_control`` with the job id, and the
+worker's JobControlListener wakes the matching JobControlCache, which
+re-reads the row. The runner reads the cached action before every parsed
+job and awaits it while paused; the row is only polled as a slow safety
+net, or at CONTROL_REFRESH_SECONDS when LISTEN is unavailable. If the
+listener connection drops mid-run, the subscribed caches are re-read and
+switched to CONTROL_REFRESH_SECONDS until the listener reconnects.
+"""
+import asyncio
+import json
+from typing import Awaitable, Callable, Dict, Optional, Set
+from uuid import UUID
+
+import asyncpg
+import structlog
+from sqlalchemy.engine import make_url
+
+logger = structlog.get_logger()
+
+CONTROL_CHANNEL = "parse_job_control"
+
+# Refresh interval while notifications are being received; only a safety
+# net for a lost notification or a dropped listener connection.
+SAFETY_REFRESH_SECONDS = 30.0
+
+# Delay between reconnect attempts after the listener connection drops.
+RECONNECT_SECONDS = 5.0
+
+
+def control_payload(job_id: UUID, action: str) -> str:
+    """NOTIFY payload announcing a control change for a job."""
+    return json.dumps({"job_id": str(job_id), "action": action})
+
+
+class JobControlCache:
+    """Control action for one parse job, kept current in memory."""
+
+    def __init__(self, fetch: Callable[[], Awaitable[str]], interval: float = 1.0):
+        """Initialize control cache.
+
+        Args:
+            fetch: Coroutine returning the current action
+                ('continue', 'pause', 'paused' or 'stop')
+            interval: Seconds between background refreshes
+        """
+        self._fetch = fetch
+        self.interval = interval
+        self.action = "continue"
+        self._updated = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._pending_refresh: Optional[asyncio.Task] = None
+        self._stale = False
+
+    async def refresh(self) -> str:
+        """Re-read the action now and wake anyone waiting for it."""
+        self.action = await self._fetch()
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+        return self.action
+
+    async def wait_for_update(self) -> str:
+        """Wait for the next refresh and return the action it read."""
+        await self._updated.wait()
+        return self.action
+
+    def notify(self):
+        """Schedule a refresh (called when a control notification arrives)."""
+        # A refresh already in flight may have read the row before this
+        # change, so it is repeated until no notification is outstanding.
+        self._stale = True
+        if self._pending_refresh is None or self._pending_refresh.done():
+            self._pending_refresh = asyncio.create_task(self._refresh_while_stale())
+
+    def set_interval(self, interval: float):
+        """Change the refresh interval, restarting a pending wait."""
+        self.interval = interval
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            self._task = asyncio.create_task(self._run())
+
+    async def start(self):
+        """Load the current action and start background refreshes."""
+        await self.refresh()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Stop background refreshes."""
+        for task in (self._task, self._pending_refresh):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._pending_refresh = None
+
+    async def _safe_refresh(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning("job_controls_refresh_failed", error=str(e))
+
+    async def _refresh_while_stale(self):
+        while self._stale:
+            self._stale = False
+            await self._safe_refresh()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self._safe_refresh()
+
+
+class JobControlListener:
+    """LISTENs on the control channel and wakes subscribed job caches."""
+
+    def __init__(self, database_url: str, fallback_interval: float = 1.0):
+        """Initialize listener.
+
+        Args:
+            database_url: SQLAlchemy URL of the database (any async driver)
+            fallback_interval: Cache refresh interval while not listening
+        """
+        self._dsn = make_url(database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self.fallback_interval = fallback_interval
+        self._conn = None
+        self._subscribers: Dict[str, Set[JobControlCache]] = {}
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    @property
+    def refresh_interval(self) -> float:
+        """Refresh interval for job caches given the connection state."""
+        return SAFETY_REFRESH_SECONDS if self.connected else self.fallback_interval
+
+    async def start(self) -> bool:
+        """Connect and LISTEN (no-op if already listening).
+
+        Returns:
+            True if notifications are being received
+        """
+        if self.connected:
+            return True
+
+        try:
+            self._conn = await asyncpg.connect(self._dsn)
+            self._conn.add_termination_listener(self._on_terminated)
+            await self._conn.add_listener(CONTROL_CHANNEL, self._on_notify)
+        except Exception as e:
+            logger.warning("job_control_listen_failed", error=str(e))
+            self._conn = None
+            return False
+
+        logger.info("job_control_listening", channel=CONTROL_CHANNEL)
+        return True
+
+    async def close(self):
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+        self._reconnect_task = None
+
+        if self.connected:
+            # A deliberate close is not a dropped connection
+            self._conn.remove_termination_listener(self._on_terminated)
+            await self._conn.close()
+        self._conn = None
+
+    def subscribe(self, job_id: UUID, cache: JobControlCache):
+        self._subscribers.setdefault(str(job_id), set()).add(cache)
+
+    def unsubscribe(self, job_id: UUID, cache: JobControlCache):
+        caches = self._subscribers.get(str(job_id))
+        if caches is not None:
+            caches.discard(cache)
+            if not caches:
+                del self._subscribers[str(job_id)]
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            job_id = str(UUID(json.loads(payload)["job_id"]))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("job_control_bad_payload", payload=payload)
+            return
+
+        for cache in self._subscribers.get(job_id, ()):
+            cache.notify()
+
+    def _wake_all(self):
+        """Re-read every subscribed cache at the current refresh interval."""
+        interval = self.refresh_interval
+        for caches in self._subscribers.values():
+            for cache in caches:
+                cache.set_interval(interval)
+                cache.notify()
+
+    def _on_terminated(self, connection):
+        if connection is not self._conn:
+            return
+        logger.warning("job_control_listener_disconnected")
+        self._conn = None
+
+        # Notifications may have been missed and no more will arrive, so the
+        # running jobs poll their rows until LISTEN is back.
+        self._wake_all()
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self):
+        while self._subscribers and not self.connected:
+            await asyncio.sleep(RECONNECT_SECONDS)
+            if await self.start():
+                self._wake_all()
@@ -0,0 +1,223 @@
+"""Batched job upserts.
+
+A batch of parsed jobs is resolved with one ``external_id = ANY(:ids)``
+query, classified row by row exactly as the per-job upsert would classify
+it (new / updated / skipped), and written with two statements:
+
+- ``INSERT ... ON CONFLICT (parsed_from, external_id) DO UPDATE ...
+  WHERE content_hash IS DISTINCT FROM excluded.content_hash`` for new and
+  changed jobs;
+- one executemany ``UPDATE`` refreshing ``last_seen_at`` (and location /
+  jobs.ge ids) for unchanged jobs.
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import structlog
+from sqlalchemy import DateTime, Integer, String, any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
+from app.models.job import Job
+
+from .base_adapter import JobData
+from .utils import compute_content_hash
+
+logger = structlog.get_logger()
+
+# Columns rewritten when a job's content changes. Matches the fields the
+# per-job upsert assigns on update; category, source_url and the
+# employment/remote/featured flags are only set on insert.
+_CONTENT_COLUMNS = (
+    "title_ge",
+    "title_en",
+    "body_ge",
+    "body_en",
+    "company_name",
+    "location",
+    "has_salary",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "published_at",
+    "deadline_at",
+    "is_vip",
+    "content_hash",
+    "last_seen_at",
+)
+
+
+@dataclass
+class BatchPlan:
+    """Classification and write rows for one batch of jobs."""
+
+    # (result, skip_reason) per input job, in input order
+    results: List[Tuple[str, Optional[str]]] = field(default_factory=list)
+    # Insert rows keyed by external_id (last content-changing version wins)
+    upserts: Dict[str, dict] = field(default_factory=dict)
+    # Parameters for the last_seen UPDATE, one per unchanged job
+    touches: List[dict] = field(default_factory=list)
+
+
+def plan_batch(
+    jobs: Sequence[JobData],
+    existing_hashes: Dict[str, Optional[str]],
+    get_category_id: Callable[[Optional[str]], Optional[UUID]],
+    source_name: str,
+    now: datetime,
+    existing_categories: Optional[Dict[str, Optional[UUID]]] = None,
+) -> BatchPlan:
+    """Classify a batch and build the rows to write.
+
+    Jobs are classified in order, so a job repeated within the batch is
+    treated as if the earlier copy had already been committed.
+
+    Args:
+        jobs: Parsed jobs in callback order
+        existing_hashes: external_id -> content_hash of rows already stored
+        get_category_id: Category slug -> category ID (None if unavailable)
+        source_name: Source the jobs were parsed from
+        now: Timestamp for first_seen_at/last_seen_at
+        existing_categories: external_id -> category_id of rows already
+            stored. The conflict update keeps the stored category, but the
+            insert row still needs a valid one (the column is NOT NULL).
+
+    Returns:
+        BatchPlan with per-job results and statement parameters
+    """
+    plan = BatchPlan()
+    known = dict(existing_hashes)
+    category_ids: Dict[str, UUID] = {
+        external_id: category_id
+        for external_id, category_id in (existing_categories or {}).items()
+        if category_id
+    }
+
+    for job in jobs:
+        content_hash = compute_content_hash(job.title_ge, job.body_ge, job.company_name)
+        external_id = job.external_id
+
+        if external_id in known:
+            if known[external_id] == content_hash:
+                plan.results.append(("skipped", "unchanged_content"))
+                plan.touches.append({
+                    "b_source": source_name,
+                    "b_external_id": external_id,
+                    "b_now": now,
+                    "b_location": job.location or None,
+                    "b_cid": job.jobsge_cid,
+                    "b_lid": job.jobsge_lid,
+                })
+                continue
+            result = "updated"
+        else:
+            result = "new"
+
+        category_id = category_ids.get(external_id) or get_category_id(job.category_slug)
+        if not category_id:
+            logger.warning(
+                "no_category_available",
+                external_id=external_id,
+                category_slug=job.category_slug,
+            )
+            plan.results.append(("skipped", "no_category"))
+            continue
+        category_ids[external_id] = category_id
+
+        known[external_id] = content_hash
+        plan.results.append((result, None))
+        plan.upserts.pop(external_id, None)
+        plan.upserts[external_id] = _insert_row(job, content_hash, category_id, source_name, now)
+
+    return plan
+
+
+def _insert_row(
+    job: JobData,
+    content_hash: str,
+    category_id: UUID,
+    source_name: str,
+    now: datetime,
+) -> dict:
+    """Column values for inserting a job."""
+    return {
+        "id": uuid.uuid4(),
+        "title_ge": job.title_ge,
+        "title_en": job.title_en,
+        "body_ge": job.body_ge,
+        "body_en": job.body_en,
+        "company_name": job.company_name,
+        "location": job.location,
+        "remote_type": job.remote_type,
+        "employment_type": job.employment_type,
+        "has_salary": job.has_salary,
+        "salary_min": job.salary_min,
+        "salary_max": job.salary_max,
+        "salary_currency": job.salary_currency,
+        "salary_period": job.salary_period,
+        "published_at": job.published_at,
+        "deadline_at": job.deadline_at,
+        "is_vip": job.is_vip,
+        "is_featured": job.is_featured,
+        "parsed_from": source_name,
+        "external_id": job.external_id,
+        "source_url": job.source_url,
+        "content_hash": content_hash,
+        "category_id": category_id,
+        "status": "active",
+        "first_seen_at": now,
+        "last_seen_at": now,
+        "jobsge_cid": job.jobsge_cid,
+        "jobsge_lid": job.jobsge_lid,
+    }
+
+
+def build_existing_query(source_name: str, external_ids: Sequence[str]):
+    """SELECT external_id, content_hash, category_id for the batch in one round trip."""
+    return select(Job.external_id, Job.content_hash, Job.category_id).where(
+        Job.parsed_from == source_name,
+        Job.external_id == any_(
+            bindparam("external_ids", value=list(external_ids), type_=ARRAY(String))
+        ),
+    )
+
+
+def build_upsert_statement(rows: Sequence[dict]):
+    """INSERT new jobs, updating existing ones only when content changed."""
+    stmt = insert(Job).values(list(rows))
+    excluded = stmt.excluded
+    set_ = {name: excluded[name] for name in _CONTENT_COLUMNS}
+    set_.update(
+        status="active",
+        jobsge_cid=func.coalesce(excluded.jobsge_cid, Job.jobsge_cid),
+        jobsge_lid=func.coalesce(excluded.jobsge_lid, Job.jobsge_lid),
+        updated_at=func.now(),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[Job.parsed_from, Job.external_id],
+        set_=set_,
+        where=Job.content_hash.is_distinct_from(excluded.content_hash),
+    )
+
+
+def build_touch_statement():
+    """UPDATE last_seen_at (and non-empty metadata) of unchanged jobs.
+
+    Executed with a list of ``BatchPlan.touches`` parameters.
+    """
+    jobs = Job.__table__
+    return (
+        update(jobs)
+        .where(
+            jobs.c.parsed_from == bindparam("b_source"),
+            jobs.c.external_id == bindparam("b_external_id"),
+        )
+        .values(
+            last_seen_at=bindparam("b_now", type_=DateTime(timezone=True)),
+            location=func.coalesce(bindparam("b_location", type_=String), jobs.c.location),
+            jobsge_cid=func.coalesce(bindparam("b_cid", type_=Integer), jobs.c.jobsge_cid),
+            jobsge_lid=func.coalesce(bindparam("b_lid", type_=Integer), jobs.c.jobsge_lid),
+        )
+    )
@@ -0,0 +1,90 @@
+"""Compiled multi-pattern substring matcher.
+
+KeywordMatcher finds which of a fixed set of keywords occur in a text in a
+single pass over it, with the same result as testing ``keyword in text``
+for each keyword in turn.
+
+The keywords are compiled once into an Aho-Corasick automaton with its
+failure links folded into a flat transition table, so a scan costs one list
+lookup per character however many keywords there are. The automaton runs
+over a one-byte projection of the text (the low byte of each UTF-16 code
+unit): iterating bytes is several times cheaper in CPython than iterating
+Georgian characters, which are not cached single-character strings. The
+projection can only add matches, never lose one, so the few candidates it
+reports are confirmed against the real text.
+"""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+
+def _project(text: str) -> bytes:
+    """Low byte of every UTF-16 code unit of text."""
+    return text.encode("utf-16-le", "surrogatepass")[::2]
+
+
+class KeywordMatcher:
+    """Finds all keywords occurring in a text with one scan."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """Compile the matcher.
+
+        Args:
+            keywords: Literal substrings to look for (case-sensitive;
+                lowercase keywords and text beforehand if needed)
+        """
+        self.keywords: List[str] = sorted({k for k in keywords if k})
+
+        # Trie over the projected keywords
+        goto: List[Dict[int, int]] = [{}]
+        ends: List[Set[str]] = [set()]
+        for keyword in self.keywords:
+            state = 0
+            for byte in _project(keyword):
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    ends.append(set())
+                    goto[state][byte] = nxt
+                state = nxt
+            ends[state].add(keyword)
+
+        # Breadth-first: failure links, inherited outputs and full transition
+        # rows (a state's moves default to those of its failure state)
+        fail = [0] * len(goto)
+        rows: List[List[int]] = [[goto[0].get(byte, 0) for byte in range(256)]] + [[] for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            row = list(rows[fail[state]])
+            for byte, child in goto[state].items():
+                row[byte] = child
+                fail[child] = rows[fail[state]][byte] if state else 0
+                queue.append(child)
+            rows[state] = row
+            ends[state] |= ends[fail[state]]
+
+        # Renumber so states with output come last (one comparison per
+        # character tells whether to collect), and pre-multiply state ids by
+        # 256 so the next state is delta[state + byte].
+        order = [0] + sorted(range(1, len(goto)), key=lambda s: bool(ends[s]))
+        new_id = {old: new for new, old in enumerate(order)}
+        self._delta: List[int] = [new_id[target] * 256 for old in order for target in rows[old]]
+        silent = sum(1 for old in order if not ends[old])
+        self._first_output = silent * 256
+        self._out: List[Optional[FrozenSet[str]]] = [
+            frozenset(ends[old]) if ends[old] else None for old in order
+        ]
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur in text."""
+        candidates: Set[str] = set()
+        delta = self._delta
+        out = self._out
+        first_output = self._first_output
+        state = 0
+        for byte in _project(text):
+            state = delta[state + byte]
+            if state >= first_output:
+                candidates |= out[state >> 8]
+        return {keyword for keyword in candidates if keyword in text}
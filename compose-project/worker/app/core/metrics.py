@@ -0,0 +1,132 @@
+"""Prometheus metrics for the crawl hot path.
+
+Disabled unless METRICS_PORT is set (and prometheus_client is installed):
+every recording function then returns after one global check, so the
+hooks in HTTPClient, ParseExecutor, CrawlScheduler and ParserRunner cost
+next to nothing. start_metrics_server() creates the metrics and serves
+them on http://0.0.0.0:METRICS_PORT/metrics.
+"""
+from typing import Optional
+from urllib.parse import urlparse
+
+import structlog
+
+try:
+    import prometheus_client
+    from prometheus_client.core import GaugeMetricFamily
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # optional dependency
+    prometheus_client = None
+    PROMETHEUS_AVAILABLE = False
+
+logger = structlog.get_logger()
+
+# Fetches are network round trips; parses and batch upserts are shorter
+_FETCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_PARSE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+_UPSERT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class _Metrics:
+    """The worker's metrics, registered in their own registry."""
+
+    def __init__(self):
+        self.registry = prometheus_client.CollectorRegistry()
+        self.fetch_seconds = prometheus_client.Histogram(
+            "worker_http_fetch_seconds", "HTTP fetch latency",
+            ["host", "status"], buckets=_FETCH_BUCKETS, registry=self.registry,
+        )
+        self.parse_seconds = prometheus_client.Histogram(
+            "worker_parse_cpu_seconds", "CPU time spent parsing one page",
+            ["page_type"], buckets=_PARSE_BUCKETS, registry=self.registry,
+        )
+        self.upsert_seconds = prometheus_client.Histogram(
+            "worker_db_upsert_seconds", "Latency of one batched job upsert (with commit)",
+            ["source"], buckets=_UPSERT_BUCKETS, registry=self.registry,
+        )
+        self.queue_depth = prometheus_client.Gauge(
+            "worker_queue_depth", "Items waiting between pipeline stages",
+            ["stage"], registry=self.registry,
+        )
+        self.jobs = prometheus_client.Counter(
+            "worker_jobs", "Parsed jobs by write result (new/updated/skipped/failed)",
+            ["source", "result"], registry=self.registry,
+        )
+        self.registry.register(_HostRateCollector())
+
+
+class _HostRateCollector:
+    """Current per-host request rate of the shared HostRateLimiter, read at scrape time."""
+
+    def collect(self):
+        from .crawl_scheduler import get_host_rate_limiter
+
+        family = GaugeMetricFamily(
+            "worker_host_request_rate", "Current request budget per host (requests/second)",
+            labels=["host"],
+        )
+        for host, rate in get_host_rate_limiter().rates().items():
+            family.add_metric([host], rate)
+        yield family
+
+
+_metrics: Optional[_Metrics] = None
+
+
+def start_metrics_server(port: Optional[int]) -> bool:
+    """Create the metrics and serve /metrics on port.
+
+    Returns:
+        True if metrics are being served
+    """
+    global _metrics
+    if not port:
+        return False
+    if not PROMETHEUS_AVAILABLE:
+        logger.warning("metrics_unavailable", reason="prometheus_client not installed")
+        return False
+    if _metrics is None:
+        _metrics = _Metrics()
+        prometheus_client.start_http_server(port, registry=_metrics.registry)
+        logger.info("metrics_server_started", port=port)
+    return True
+
+
+def enabled() -> bool:
+    """Check if metrics are being recorded."""
+    return _metrics is not None
+
+
+def observe_fetch(url: str, status: object, seconds: float):
+    """Record one HTTP request (status: code, or "error" if none came back)."""
+    if _metrics is None:
+        return
+    _metrics.fetch_seconds.labels(urlparse(url).hostname or "", str(status)).observe(seconds)
+
+
+def observe_parse(page_type: str, cpu_seconds: float):
+    """Record the CPU time of parsing one page."""
+    if _metrics is None:
+        return
+    _metrics.parse_seconds.labels(page_type).observe(cpu_seconds)
+
+
+def observe_upsert(source: str, seconds: float):
+    """Record one batched upsert."""
+    if _metrics is None:
+        return
+    _metrics.upsert_seconds.labels(source).observe(seconds)
+
+
+def set_queue_depth(stage: str, depth: int):
+    """Record how many items wait before a pipeline stage."""
+    if _metrics is None:
+        return
+    _metrics.queue_depth.labels(stage).set(depth)
+
+
+def count_job(source: str, result: str):
+    """Count one written (or failed) job."""
+    if _metrics is None:
+        return
+    _metrics.jobs.labels(source, result).inc()
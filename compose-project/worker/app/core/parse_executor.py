@@ -0,0 +1,114 @@
+"""Process pool for CPU-bound HTML parsing.
+
+lxml/BeautifulSoup extraction holds the GIL, so parsing on the event loop
+stalls every in-flight request and DB callback. Adapters hand raw page
+bytes to the shared ParseExecutor instead; a pool of PARSE_WORKERS
+processes turns them into plain dicts / JobData while the loop keeps
+fetching. PARSE_WORKERS=0 parses inline, as before.
+
+Functions run in the pool must be module-level (picklable) and take and
+return picklable values.
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
+
+import structlog
+
+from . import metrics
+from .config import get_config
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+def decode_html(html: Union[str, bytes], encoding: str = "utf-8") -> str:
+    """Page bytes as text, decoded the way HTTPClient.get_text does."""
+    if isinstance(html, bytes):
+        return html.decode(encoding, errors="replace")
+    return html
+
+
+def _timed(func: Callable[..., T], *args: Any) -> Tuple[T, float]:
+    """Run func(*args) and also return the CPU time it took (in the worker)."""
+    started = time.process_time()
+    result = func(*args)
+    return result, time.process_time() - started
+
+
+class ParseExecutor:
+    """Runs parse functions in a process pool (or inline if workers == 0)."""
+
+    def __init__(self, workers: int):
+        """Initialize the executor. The pool starts on first use.
+
+        Args:
+            workers: Pool size; 0 parses inline on the event loop
+        """
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run func(*args) in the pool and await its result.
+
+        A crashed pool (e.g. a worker killed for memory) is discarded and
+        the call is retried inline; the next call starts a fresh pool.
+        With metrics on, the parse CPU time is recorded per function.
+        """
+        if metrics.enabled():
+            result, cpu_seconds = await self._run(_timed, func, *args)
+            metrics.observe_parse(getattr(func, "__name__", str(func)), cpu_seconds)
+            return result
+        return await self._run(func, *args)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.workers <= 0:
+            return func(*args)
+
+        if self._pool is None:
+            # spawn: never fork a process that has an event loop and threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("parse_pool_started", workers=self.workers)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+        except BrokenProcessPool:
+            logger.warning("parse_pool_broken", func=getattr(func, "__name__", str(func)))
+            self.shutdown(wait=False)
+            return func(*args)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the pool's worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+_shared_executor: Optional[ParseExecutor] = None
+
+
+def get_parse_executor() -> ParseExecutor:
+    """Get the process-wide parse executor."""
+    global _shared_executor
+    if _shared_executor is None:
+        workers = get_config().parse_workers
+        if workers is None:
+            workers = os.cpu_count() or 1
+        _shared_executor = ParseExecutor(workers)
+    return _shared_executor
+
+
+def shutdown_parse_executor():
+    """Stop the process-wide parse executor, if it was started."""
+    global _shared_executor
+    if _shared_executor is not None:
+        _shared_executor.shutdown()
+        _shared_executor = None
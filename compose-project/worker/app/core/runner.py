@@ -10,15 +10,33 @@ from datetime import datetime, timezone
 from typing import Callable, Dict, List, Optional, Type
 from uuid import UUID
 import structlog
-from sqlalchemy import select, update, and_
+from sqlalchemy import String, any_, bindparam, func, select, text, update, and_
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+from . import metrics
 from .base_adapter import BaseAdapter, JobData, ParseResult
 from .config import ParserConfig
+from .job_controls import (
+    CONTROL_CHANNEL,
+    JobControlCache,
+    JobControlListener,
+    control_payload,
+)
+from .job_upsert import build_existing_query, build_touch_statement, build_upsert_statement, plan_batch
+from .seen_index import SeenIndex
+from .telemetry import ParseTelemetry
 from .utils import compute_content_hash
 
 logger = structlog.get_logger()
 
+# NOTIFY channel telling API processes that jobs changed (payload: source),
+# so they drop cached list/stats responses
+JOBS_CHANGED_CHANNEL = "jobs_changed"
+
+# Crawl modes for run_source/run_all
+RUN_MODES = ("full", "incremental")
+
 
 class ParseJobLogger:
     """Helper class for logging to parse_job_logs table."""
@@ -89,6 +107,14 @@ class ParserRunner:
         self._default_category_id: Optional[UUID] = None
         self._current_parse_job_id: Optional[UUID] = None
         self._active_jobs: Dict[UUID, dict] = {}  # Track active jobs for control
+        self._control_listener = JobControlListener(
+            config.database_url, config.control_refresh_seconds
+        )
+
+    async def close(self):
+        """Stop listening for job controls and release database connections."""
+        await self._control_listener.close()
+        await self._engine.dispose()
 
     async def ensure_tables_exist(self):
         """Ensure all parse tracking tables exist."""
@@ -117,6 +143,7 @@ class ParserRunner:
                 return False
 
             job.should_pause = True
+            await self._notify_control(session, job_id, "pause")
             await session.commit()
             logger.info("job_pause_signaled", job_id=str(job_id))
             return True
@@ -143,6 +170,7 @@ class ParserRunner:
             job.should_pause = False
             job.resumed_at = datetime.now(timezone.utc)
             job.paused_at = None
+            await self._notify_control(session, job_id, "resume")
             await session.commit()
             logger.info("job_resumed", job_id=str(job_id))
             return True
@@ -162,6 +190,7 @@ class ParserRunner:
 
             job.should_stop = True
             job.status = "stopping"
+            await self._notify_control(session, job_id, "stop")
             await session.commit()
             logger.info("job_stop_signaled", job_id=str(job_id))
             return True
@@ -182,12 +211,39 @@ class ParserRunner:
             job.status = "cancelled"
             job.completed_at = datetime.now(timezone.utc)
             job.should_stop = True
+            await self._notify_control(session, job_id, "cancel")
             await session.commit()
             logger.info("job_cancelled", job_id=str(job_id))
             return True
 
+    async def _notify_control(self, session: AsyncSession, job_id: UUID, action: str):
+        """Queue a control notification, delivered when the session commits."""
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CONTROL_CHANNEL, "payload": control_payload(job_id, action)},
+        )
+
+    async def _notify_jobs_changed(self, session: AsyncSession, source_name: str):
+        """Queue a jobs_changed notification, delivered when the session commits."""
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": JOBS_CHANGED_CHANNEL, "payload": source_name},
+        )
+
+    async def _announce_jobs_changed(self, source_name: str):
+        """Send jobs_changed now; a failure only leaves API caches to expire."""
+        try:
+            async with self._session_maker() as session:
+                await self._notify_jobs_changed(session, source_name)
+                await session.commit()
+        except Exception as e:
+            logger.warning("jobs_changed_notify_failed", source=source_name, error=str(e))
+
     async def _check_job_controls(self, job_id: UUID) -> str:
-        """Check if job should pause or stop. Returns action: 'continue', 'pause', 'stop'."""
+        """Check if job should pause or stop.
+
+        Returns action: 'continue', 'pause', 'paused' (waiting for resume) or 'stop'.
+        """
         from app.models.parse_job import ParseJob
 
         async with self._session_maker() as session:
@@ -206,9 +262,16 @@ class ParserRunner:
                 return "stop"
             if should_pause:
                 return "pause"
+            if status == "paused":
+                return "paused"
             return "continue"
 
-    async def _handle_pause(self, job_id: UUID, job_logger: ParseJobLogger):
+    async def _handle_pause(
+        self,
+        job_id: UUID,
+        job_logger: ParseJobLogger,
+        controls: JobControlCache,
+    ) -> str:
         """Handle pause state - wait until resumed or stopped."""
         from app.models.parse_job import ParseJob
 
@@ -228,23 +291,16 @@ class ParserRunner:
         await job_logger.info("Job paused")
         logger.info("job_paused", job_id=str(job_id))
 
-        # Wait for resume or stop
-        while True:
-            await asyncio.sleep(2)
-            action = await self._check_job_controls(job_id)
+        # Wait for resume or stop; the control cache is refreshed when a
+        # control notification arrives
+        action = await controls.refresh()
+        while action in ("pause", "paused"):
+            action = await controls.wait_for_update()
 
-            if action == "stop":
-                return "stop"
-            if action == "continue":
-                # Job was resumed
-                async with self._session_maker() as session:
-                    result = await session.execute(
-                        select(ParseJob.status).where(ParseJob.id == job_id)
-                    )
-                    status = result.scalar_one_or_none()
-                    if status == "running":
-                        await job_logger.info("Job resumed")
-                        return "continue"
+        if action == "stop":
+            return "stop"
+        await job_logger.info("Job resumed")
+        return "continue"
 
     # =========================================================================
     # MAIN PARSING METHODS
@@ -255,8 +311,9 @@ class ParserRunner:
         regions: Optional[List[str]] = None,
         job_type: str = "scheduled",
         triggered_by: str = "system",
+        mode: str = "full",
     ) -> Dict[str, ParseResult]:
-        """Run all enabled parsers."""
+        """Run all enabled parsers ("full" sweep or "incremental")."""
         results = {}
         regions = regions or self.config.regions
 
@@ -271,11 +328,13 @@ class ParserRunner:
                     regions,
                     job_type=job_type,
                     triggered_by=triggered_by,
+                    mode=mode,
                 )
                 results[source_name] = result
             except Exception as e:
                 logger.error("parser_failed", source=source_name, error=str(e))
-                results[source_name] = ParseResult(errors=[str(e)])
+                results[source_name] = ParseResult()
+                results[source_name].errors.append(str(e), kind="run")
 
         return results
 
@@ -289,6 +348,8 @@ class ParserRunner:
         target_region: Optional[str] = None,
         target_category: Optional[str] = None,
         batch_id: Optional[UUID] = None,
+        mode: str = "full",
+        seen_index: Optional[SeenIndex] = None,
     ) -> ParseResult:
         """Run a parser source with full progress tracking and job control.
 
@@ -301,21 +362,32 @@ class ParserRunner:
             target_region: Single region for this job (for batch jobs)
             target_category: Single category for this job (for batch jobs)
             batch_id: Parent batch ID if part of multi-job run
+            mode: "full" visits every listing (refreshing last_seen_at);
+                "incremental" only fetches new/changed listings and stops
+                paginating at the first fully known page
+            seen_index: Listings already crawled in this sweep, shared with
+                the other jobs of a batch (a fresh index if None)
 
         Returns:
             ParseResult with statistics
         """
         if source_name not in self.adapters:
             raise ValueError(f"Unknown source: {source_name}")
+        if mode not in RUN_MODES:
+            raise ValueError(f"Unknown run mode: {mode}")
 
         adapter_class = self.adapters[source_name]
         regions = regions or self.config.regions
+        # Shared by the per-region adapters: a cross-listed job is fetched once
+        if seen_index is None:
+            seen_index = SeenIndex()
 
         logger.info(
             "parser_run_started",
             source=source_name,
             regions=regions,
             job_type=job_type,
+            mode=mode,
         )
 
         # Create parse job record
@@ -323,7 +395,7 @@ class ParserRunner:
             source_name=source_name,
             job_type=job_type,
             triggered_by=triggered_by,
-            config={"regions": regions, "categories": categories},
+            config={"regions": regions, "categories": categories, "mode": mode},
             target_region=target_region,
             target_category=target_category,
             batch_id=batch_id,
@@ -337,6 +409,7 @@ class ParserRunner:
         combined_result = ParseResult()
         stats = {"new": 0, "updated": 0, "skipped": 0, "failed": 0}
         skip_reasons: Dict[str, int] = {}  # Count skip reasons
+        announced_writes = 0  # new + updated when jobs_changed was last sent
 
         async with self._session_maker() as session:
             if not self._category_cache:
@@ -354,114 +427,175 @@ class ParserRunner:
                 "categories": categories,
             })
 
-            # Create callback for instant job insertion with full tracking
-            async def on_job_parsed(job: JobData, region: str = None, category: str = None, page: int = None) -> str:
-                """Insert job and track with detailed item records."""
-                nonlocal stats, skip_reasons
-                start_time = time.time()
+            # Item records and progress are written in the background;
+            # pause/stop flags are served from memory.
+            telemetry = ParseTelemetry(
+                self._session_maker, parse_job_id, self.config.progress_flush_seconds
+            )
+            telemetry.start()
+            await self._control_listener.start()
+            controls = JobControlCache(
+                lambda: self._check_job_controls(parse_job_id),
+                self._control_listener.refresh_interval,
+            )
+            self._control_listener.subscribe(parse_job_id, controls)
+            await controls.start()
+
+            # Parsed jobs are buffered and written in batches of
+            # upsert_batch_size: (job, item, start_time) per entry.
+            pending: List[tuple] = []
+
+            def record_result(job: JobData, item: dict, start_time: float, result: str, skip_reason: Optional[str]):
+                """Count a written job and queue its item record."""
+                stats[result] += 1
+                metrics.count_job(source_name, result)
+                if skip_reason:
+                    skip_reasons[skip_reason] = skip_reasons.get(skip_reason, 0) + 1
+
+                telemetry.record_item(
+                    **item,
+                    status="completed" if result != "failed" else "failed",
+                    result=result,
+                    skip_reason=skip_reason,
+                    completed_at=datetime.now(timezone.utc),
+                    processing_ms=int((time.time() - start_time) * 1000),
+                )
 
-                # Check for pause/stop
-                action = await self._check_job_controls(parse_job_id)
-                if action == "pause":
-                    result = await self._handle_pause(parse_job_id, job_logger)
-                    if result == "stop":
-                        raise asyncio.CancelledError("Job stopped")
-                elif action == "stop":
-                    raise asyncio.CancelledError("Job stopped")
+            async def record_failure(job: JobData, item: dict, error: Exception):
+                """Count a job that could not be written."""
+                logger.warning(
+                    "job_insert_failed",
+                    external_id=job.external_id,
+                    error=str(error),
+                )
+                stats["failed"] += 1
+                metrics.count_job(source_name, "failed")
 
-                # Create item record
-                item_id = await self._create_parse_item(
-                    parse_job_id,
+                telemetry.record_item(
+                    **item,
+                    status="failed",
+                    result="failed",
+                    error_message=str(error),
+                    completed_at=datetime.now(timezone.utc),
+                )
+
+                await job_logger.error(
+                    f"Failed to insert job: {str(error)}",
                     external_id=job.external_id,
-                    url=job.source_url,
-                    title=job.title_ge[:200] if job.title_ge else None,
-                    region=region or job_logger.current_region,
-                    category=category or job_logger.current_category,
-                    page=page,
                 )
 
+            async def flush_pending():
+                """Write buffered jobs in one batch and update progress."""
+                if not pending:
+                    return
+                batch = pending[:]
+                pending.clear()
+                metrics.set_queue_depth("upsert_pending", 0)
+                total_before = sum(stats.values())
+
                 try:
-                    result, skip_reason = await self._upsert_job_with_reason(
-                        session, job, source_name
+                    started = time.monotonic()
+                    results = await self._upsert_jobs_batch(
+                        session, [job for job, _, _ in batch], source_name
                     )
-                    stats[result] += 1
-
-                    if skip_reason:
-                        skip_reasons[skip_reason] = skip_reasons.get(skip_reason, 0) + 1
-
                     await session.commit()
+                    metrics.observe_upsert(source_name, time.monotonic() - started)
+                except Exception as e:
+                    # Retry row by row so one bad job doesn't fail the batch
+                    logger.warning("job_batch_insert_failed", size=len(batch), error=str(e))
+                    await session.rollback()
+                    for job, item, start_time in batch:
+                        try:
+                            result, skip_reason = await self._upsert_job_with_reason(
+                                session, job, source_name
+                            )
+                            await session.commit()
+                        except Exception as row_error:
+                            await session.rollback()
+                            await record_failure(job, item, row_error)
+                        else:
+                            record_result(job, item, start_time, result, skip_reason)
+                else:
+                    for (job, item, start_time), (result, skip_reason) in zip(batch, results):
+                        record_result(job, item, start_time, result, skip_reason)
+
+                # Update job progress
+                last_job = batch[-1][0]
+                telemetry.update_progress(
+                    processed=sum(stats.values()),
+                    new=stats["new"],
+                    updated=stats["updated"],
+                    skipped=stats["skipped"],
+                    failed=stats["failed"],
+                    current_item=last_job.title_ge[:100] if last_job.title_ge else last_job.external_id,
+                )
 
-                    # Update item record
-                    processing_ms = int((time.time() - start_time) * 1000)
-                    await self._update_parse_item(
-                        item_id,
-                        status="completed" if result != "failed" else "failed",
-                        result=result,
-                        skip_reason=skip_reason,
-                        processing_ms=processing_ms,
+                # Log every 10 jobs
+                total = sum(stats.values())
+                if total // 10 > total_before // 10:
+                    await job_logger.info(
+                        f"Progress: {total} processed ({stats['new']} new, {stats['updated']} updated, {stats['skipped']} skipped)",
+                        details={"stats": stats, "skip_reasons": skip_reasons},
                     )
-
-                    # Update job progress
-                    await self._update_parse_job_progress(
-                        parse_job_id,
-                        processed=sum(stats.values()),
+                    logger.info(
+                        "parse_progress",
+                        job_id=str(parse_job_id),
+                        total=total,
                         new=stats["new"],
                         updated=stats["updated"],
-                        skipped=stats["skipped"],
-                        failed=stats["failed"],
-                        current_item=job.title_ge[:100] if job.title_ge else job.external_id,
                     )
 
-                    # Log every 10 jobs
-                    total = sum(stats.values())
-                    if total % 10 == 0:
-                        await job_logger.info(
-                            f"Progress: {total} processed ({stats['new']} new, {stats['updated']} updated, {stats['skipped']} skipped)",
-                            details={"stats": stats, "skip_reasons": skip_reasons},
-                        )
-                        logger.info(
-                            "parse_progress",
-                            job_id=str(parse_job_id),
-                            total=total,
-                            new=stats["new"],
-                            updated=stats["updated"],
-                        )
-
-                    return result
-
-                except Exception as e:
-                    logger.warning(
-                        "job_insert_failed",
-                        external_id=job.external_id,
-                        error=str(e),
-                    )
-                    await session.rollback()
-                    stats["failed"] += 1
-
-                    await self._update_parse_item(
-                        item_id,
-                        status="failed",
-                        result="failed",
-                        error_message=str(e),
-                    )
+            # Create callback for job insertion with full tracking
+            async def on_job_parsed(job: JobData, region: str = None, category: str = None, page: int = None) -> str:
+                """Track the job and queue it for the next batch write."""
+                start_time = time.time()
 
-                    await job_logger.error(
-                        f"Failed to insert job: {str(e)}",
-                        external_id=job.external_id,
-                    )
+                # Check for pause/stop
+                action = controls.action
+                if action == "pause":
+                    result = await self._handle_pause(parse_job_id, job_logger, controls)
+                    if result == "stop":
+                        raise asyncio.CancelledError("Job stopped")
+                elif action == "stop":
+                    raise asyncio.CancelledError("Job stopped")
 
-                    return "failed"
+                # Item record, queued with its result once the batch is written
+                item = {
+                    "external_id": job.external_id,
+                    "url": job.source_url,
+                    "title": job.title_ge[:200] if job.title_ge else None,
+                    "region": region or job_logger.current_region,
+                    "category": category or job_logger.current_category,
+                    "page": page,
+                    "started_at": datetime.now(timezone.utc),
+                }
+
+                pending.append((job, item, start_time))
+                metrics.set_queue_depth("upsert_pending", len(pending))
+                if len(pending) >= self.config.upsert_batch_size:
+                    await flush_pending()
+                return "queued"
+
+            async def on_jobs_seen(seen: List[tuple]):
+                """Refresh last_seen_at for the listings of one list page."""
+                await self._mark_jobs_seen(source_name, [external_id for external_id, _, _ in seen])
+
+            async def close_background():
+                """Stop control refreshes and write remaining telemetry."""
+                self._control_listener.unsubscribe(parse_job_id, controls)
+                await controls.close()
+                await telemetry.close()
 
             try:
                 # Run parser
                 regions_to_parse = regions if regions else [None]
                 for region in regions_to_parse:
                     # Check for stop
-                    action = await self._check_job_controls(parse_job_id)
+                    action = await controls.refresh()
                     if action == "stop":
                         raise asyncio.CancelledError("Job stopped")
                     elif action == "pause":
-                        result = await self._handle_pause(parse_job_id, job_logger)
+                        result = await self._handle_pause(parse_job_id, job_logger, controls)
                         if result == "stop":
                             raise asyncio.CancelledError("Job stopped")
 
@@ -475,12 +609,21 @@ class ParserRunner:
                     await job_logger.info(f"Starting region: {region or 'all'}")
 
                     adapter = adapter_class()
+                    adapter.incremental = mode == "incremental"
+                    adapter.seen_index = seen_index
+                    adapter.error_sink = telemetry.record_error
 
                     # Wrap the callback to include region context
                     async def region_callback(job: JobData) -> str:
                         return await on_job_parsed(job, region=region)
 
-                    result = await adapter.run(region, on_job_parsed=region_callback)
+                    result = await adapter.run(
+                        region, on_job_parsed=region_callback, on_jobs_seen=on_jobs_seen
+                    )
+                    await flush_pending()
+                    if stats["new"] + stats["updated"] > announced_writes:
+                        announced_writes = stats["new"] + stats["updated"]
+                        await self._announce_jobs_changed(source_name)
                     combined_result.errors.extend(result.errors)
                     combined_result.pages_parsed += result.pages_parsed
 
@@ -490,6 +633,7 @@ class ParserRunner:
                     )
 
                 combined_result.total_found = sum(stats.values())
+                await close_background()
 
                 # Mark job as complete
                 await self._update_parse_job(
@@ -503,7 +647,7 @@ class ParserRunner:
                     skipped_items=stats["skipped"],
                     new_items=stats["new"],
                     updated_items=stats["updated"],
-                    errors=combined_result.errors if combined_result.errors else None,
+                    errors=combined_result.errors.summary() or None,
                     current_region=None,
                     current_category=None,
                     current_item=None,
@@ -521,6 +665,7 @@ class ParserRunner:
                         "failed": stats["failed"],
                         "skip_reasons": skip_reasons,
                         "errors": len(combined_result.errors),
+                        "error_types": dict(combined_result.errors.counts),
                     },
                 )
 
@@ -539,6 +684,11 @@ class ParserRunner:
             except asyncio.CancelledError:
                 # Job was stopped - perform cleanup then re-raise
                 # IMPORTANT: CancelledError must be re-raised to properly propagate cancellation
+                # Jobs parsed before the stop are still written
+                await flush_pending()
+                if stats["new"] + stats["updated"] > announced_writes:
+                    await self._announce_jobs_changed(source_name)
+                await close_background()
                 await self._update_parse_job(
                     parse_job_id,
                     status="cancelled",
@@ -550,6 +700,7 @@ class ParserRunner:
                 raise  # Re-raise CancelledError after cleanup
 
             except Exception as e:
+                await close_background()
                 await self._update_parse_job(
                     parse_job_id,
                     status="failed",
@@ -619,6 +770,8 @@ class ParserRunner:
                     result, skip_reason = await self._upsert_job_with_reason(
                         session, job_data, source_name
                     )
+                    if result in ("new", "updated"):
+                        await self._notify_jobs_changed(session, source_name)
                     await session.commit()
 
                     await self._update_parse_job(
@@ -728,6 +881,10 @@ class ParserRunner:
             await session.execute(stmt)
             await session.commit()
 
+        # One seen index for the whole batch, so jobs listed in several
+        # regions are fetched by only one of the batch's jobs
+        seen_index = SeenIndex()
+
         # Run jobs
         if mode == "parallel":
             # Run all jobs in parallel
@@ -741,6 +898,7 @@ class ParserRunner:
                         triggered_by=triggered_by,
                         target_region=job_config["target_region"],
                         batch_id=batch_id,
+                        seen_index=seen_index,
                     )
                 )
                 tasks.append(task)
@@ -765,6 +923,7 @@ class ParserRunner:
                         triggered_by=triggered_by,
                         target_region=job_config["target_region"],
                         batch_id=batch_id,
+                        seen_index=seen_index,
                     )
                     completed += 1
                 except Exception as e:
@@ -853,102 +1012,6 @@ class ParserRunner:
             await session.execute(stmt)
             await session.commit()
 
-    async def _update_parse_job_progress(
-        self,
-        job_id: UUID,
-        processed: int,
-        new: int,
-        updated: int,
-        skipped: int,
-        failed: int = 0,
-        current_item: Optional[str] = None,
-    ):
-        """Update parse job progress counters."""
-        from app.models.parse_job import ParseJob
-
-        async with self._session_maker() as session:
-            values = {
-                "processed_items": processed,
-                "successful_items": new + updated,
-                "new_items": new,
-                "updated_items": updated,
-                "skipped_items": skipped,
-                "failed_items": failed,
-            }
-            if current_item:
-                values["current_item"] = current_item[:200]
-
-            stmt = (
-                update(ParseJob)
-                .where(ParseJob.id == job_id)
-                .values(**values)
-            )
-            await session.execute(stmt)
-            await session.commit()
-
-    async def _create_parse_item(
-        self,
-        job_id: UUID,
-        external_id: str,
-        url: str,
-        title: Optional[str] = None,
-        region: Optional[str] = None,
-        category: Optional[str] = None,
-        page: Optional[int] = None,
-    ) -> UUID:
-        """Create a parse job item record."""
-        from app.models.parse_job import ParseJobItem
-
-        async with self._session_maker() as session:
-            item = ParseJobItem(
-                job_id=job_id,
-                external_id=external_id,
-                url=url,
-                title=title,
-                region=region,
-                category=category,
-                page=page,
-                status="parsing",
-                started_at=datetime.now(timezone.utc),
-            )
-            session.add(item)
-            await session.commit()
-            await session.refresh(item)
-            return item.id
-
-    async def _update_parse_item(
-        self,
-        item_id: UUID,
-        status: str,
-        result: str,
-        skip_reason: Optional[str] = None,
-        error_message: Optional[str] = None,
-        processing_ms: Optional[int] = None,
-    ):
-        """Update a parse job item record."""
-        from app.models.parse_job import ParseJobItem
-
-        async with self._session_maker() as session:
-            values = {
-                "status": status,
-                "result": result,
-                "completed_at": datetime.now(timezone.utc),
-            }
-            if skip_reason:
-                values["skip_reason"] = skip_reason
-            if error_message:
-                values["error_message"] = error_message
-            if processing_ms:
-                values["processing_ms"] = processing_ms
-
-            stmt = (
-                update(ParseJobItem)
-                .where(ParseJobItem.id == item_id)
-                .values(**values)
-            )
-            await session.execute(stmt)
-            await session.commit()
-
     async def get_current_job_progress(self) -> Optional[dict]:
         """Get progress of currently running parse job."""
         if not self._current_parse_job_id:
@@ -985,6 +1048,50 @@ class ParserRunner:
             return self._category_cache[slug]
         return self._default_category_id
 
+    async def _upsert_jobs_batch(
+        self,
+        session: AsyncSession,
+        jobs: List[JobData],
+        source_name: str,
+    ) -> List[tuple]:
+        """Upsert a batch of jobs and return (result, skip_reason) per job.
+
+        Classification matches calling _upsert_job_with_reason for each job
+        in order; the writes take three statements for the whole batch.
+        The caller commits.
+        """
+        existing = (
+            await session.execute(
+                build_existing_query(source_name, {job.external_id for job in jobs})
+            )
+        ).all()
+        plan = plan_batch(
+            jobs,
+            {row.external_id: row.content_hash for row in existing},
+            self._get_category_id,
+            source_name,
+            datetime.now(timezone.utc),
+            existing_categories={row.external_id: row.category_id for row in existing},
+        )
+
+        if plan.upserts:
+            await session.execute(build_upsert_statement(list(plan.upserts.values())))
+        if plan.touches:
+            await session.execute(build_touch_statement(), plan.touches)
+
+        for job, (result, _) in zip(jobs, plan.results):
+            if result == "new":
+                logger.info(
+                    "job_inserted",
+                    external_id=job.external_id,
+                    title=job.title_ge[:50] if job.title_ge else "",
+                    category=job.category_slug,
+                    cid=job.jobsge_cid,
+                    lid=job.jobsge_lid,
+                )
+
+        return plan.results
+
     async def _upsert_job_with_reason(
         self,
         session: AsyncSession,
@@ -1101,8 +1208,36 @@ class ParserRunner:
             )
             return ("new", None)
 
+    async def _mark_jobs_seen(self, source_name: str, external_ids: List[str]) -> int:
+        """Bump last_seen_at of listed jobs without touching their content.
+
+        Category/location ids are left to the detail upsert, which sees a
+        cross-listed job once per run instead of once per list page.
+        """
+        from app.models.job import Job
+
+        async with self._session_maker() as session:
+            stmt = (
+                update(Job)
+                .where(
+                    Job.parsed_from == source_name,
+                    Job.external_id == any_(
+                        bindparam("external_ids", value=external_ids, type_=ARRAY(String))
+                    ),
+                )
+                .values(last_seen_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount
+
     async def deactivate_not_seen(self) -> int:
-        """Deactivate jobs not seen within configured days."""
+        """Deactivate jobs not seen within configured days.
+
+        Only meaningful after a full sweep: incremental runs don't refresh
+        last_seen_at of listings they skip.
+        """
         from datetime import timedelta
         cutoff = datetime.now(timezone.utc) - timedelta(days=self.config.not_seen_days_to_inactive)
 
@@ -1119,6 +1254,8 @@ class ParserRunner:
                 .values(status="inactive")
             )
             result = await session.execute(stmt)
+            if result.rowcount:
+                await self._notify_jobs_changed(session, "deactivate_not_seen")
             await session.commit()
 
             count = result.rowcount
@@ -0,0 +1,73 @@
+"""Run-scoped index of job listings already crawled.
+
+One SeenIndex is shared by every adapter of a sweep (all regions of a
+run, all jobs of a batch), so a job cross-listed in several categories or
+regions has its detail page fetched once. Numeric external ids, which is
+what jobs.ge and hr.ge use, are kept in a sorted array('q') at 8 bytes
+each; anything else falls back to a plain set.
+"""
+from array import array
+from bisect import bisect_left
+from typing import Set, Union
+
+# New ids are buffered in a set and merged into the sorted array in bulk,
+# so inserts stay cheap without giving up the compact representation.
+_MERGE_THRESHOLD = 4096
+
+
+class SeenIndex:
+    """Set of external ids with a compact sorted-array backing store."""
+
+    def __init__(self):
+        self._sorted = array("q")
+        self._pending: Set[int] = set()
+        self._other: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._pending) + len(self._other)
+
+    def __contains__(self, key: Union[int, str]) -> bool:
+        number = _as_int(key)
+        if number is None:
+            return str(key) in self._other
+        if number in self._pending:
+            return True
+        i = bisect_left(self._sorted, number)
+        return i < len(self._sorted) and self._sorted[i] == number
+
+    def add(self, key: Union[int, str]) -> bool:
+        """Add a key.
+
+        Returns:
+            True if the key was not in the index yet
+        """
+        if key in self:
+            return False
+        number = _as_int(key)
+        if number is None:
+            self._other.add(str(key))
+            return True
+        self._pending.add(number)
+        if len(self._pending) >= _MERGE_THRESHOLD:
+            self._merge()
+        return True
+
+    def _merge(self):
+        merged = sorted(self._sorted.tolist() + list(self._pending))
+        self._sorted = array("q", merged)
+        self._pending.clear()
+
+
+def _as_int(key: Union[int, str]):
+    """Key as a 64-bit int, or None if it isn't a plain decimal id."""
+    if isinstance(key, int):
+        number = key
+    elif isinstance(key, str) and key.isdigit() and key.isascii():
+        number = int(key)
+        if str(number) != key:
+            return None  # keep "007" distinct from "7"
+    else:
+        return None
+    if -(2 ** 63) <= number < 2 ** 63:
+        return number
+    return None
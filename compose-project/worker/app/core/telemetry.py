@@ -0,0 +1,153 @@
+"""Background writer for parse job bookkeeping.
+
+Item records and progress counters used to cost several transactions per
+parsed job. ParseTelemetry takes them off the crawl path: completed item
+rows are queued and bulk-inserted, and progress updates are coalesced so
+the parse_jobs row is written at most once per flush interval. Errors are
+written as parse_job_logs rows, a bounded number per flush.
+"""
+import asyncio
+import uuid
+from collections import Counter
+from typing import List, Optional
+from uuid import UUID
+
+import structlog
+from sqlalchemy import insert, update
+
+from . import metrics
+
+logger = structlog.get_logger()
+
+# Error log rows written per flush; beyond that errors are only counted
+MAX_ERRORS_PER_FLUSH = 50
+
+
+class ParseTelemetry:
+    """Queue-fed writer for one parse job's items and progress."""
+
+    def __init__(self, session_maker, job_id: UUID, flush_interval: float = 1.0):
+        """Initialize telemetry writer.
+
+        Args:
+            session_maker: Async session factory
+            job_id: Parse job the items and progress belong to
+            flush_interval: Seconds between writes
+        """
+        self._session_maker = session_maker
+        self.job_id = job_id
+        self.flush_interval = flush_interval
+        self._items: asyncio.Queue = asyncio.Queue()
+        self._progress: Optional[dict] = None
+        self._errors: List[dict] = []
+        self._errors_dropped: Counter = Counter()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background writer."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def record_item(self, **values):
+        """Queue a finished ParseJobItem row (column values)."""
+        values.setdefault("id", uuid.uuid4())
+        values["job_id"] = self.job_id
+        self._items.put_nowait(values)
+        metrics.set_queue_depth("telemetry_items", self._items.qsize())
+
+    def record_error(self, kind: str, message: str):
+        """Queue an error log row (matches BaseAdapter.error_sink)."""
+        if len(self._errors) >= MAX_ERRORS_PER_FLUSH:
+            self._errors_dropped[kind] += 1
+            return
+        self._errors.append({
+            "id": uuid.uuid4(),
+            "job_id": self.job_id,
+            "level": "error",
+            "message": message,
+            "details": {"kind": kind},
+        })
+
+    def update_progress(
+        self,
+        processed: int,
+        new: int,
+        updated: int,
+        skipped: int,
+        failed: int = 0,
+        current_item: Optional[str] = None,
+    ):
+        """Set the latest progress counters; only the newest is written."""
+        values = {
+            "processed_items": processed,
+            "successful_items": new + updated,
+            "new_items": new,
+            "updated_items": updated,
+            "skipped_items": skipped,
+            "failed_items": failed,
+        }
+        if current_item:
+            values["current_item"] = current_item[:200]
+        self._progress = values
+
+    async def close(self):
+        """Stop the writer after writing everything still queued."""
+        self._closing.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        else:
+            await self._flush()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._closing.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self._flush()
+            if self._closing.is_set():
+                return
+
+    async def _flush(self):
+        """Write queued items, errors and pending progress in one transaction."""
+        from app.models.parse_job import ParseJob, ParseJobItem, ParseJobLog
+
+        items = []
+        while not self._items.empty():
+            items.append(self._items.get_nowait())
+        progress, self._progress = self._progress, None
+        errors, self._errors = self._errors, []
+        if self._errors_dropped:
+            dropped, self._errors_dropped = self._errors_dropped, Counter()
+            errors.append({
+                "id": uuid.uuid4(),
+                "job_id": self.job_id,
+                "level": "error",
+                "message": f"{sum(dropped.values())} more errors not logged",
+                "details": {"dropped": dict(dropped)},
+            })
+        if not items and not errors and progress is None:
+            return
+
+        try:
+            async with self._session_maker() as session:
+                if items:
+                    await session.execute(insert(ParseJobItem), items)
+                if errors:
+                    await session.execute(insert(ParseJobLog), errors)
+                if progress is not None:
+                    await session.execute(
+                        update(ParseJob).where(ParseJob.id == self.job_id).values(**progress)
+                    )
+                await session.commit()
+        except Exception as e:
+            # Bookkeeping must never fail the crawl
+            logger.warning(
+                "telemetry_flush_failed",
+                job_id=str(self.job_id),
+                items_dropped=len(items),
+                errors_dropped=len(errors),
+                error=str(e),
+            )
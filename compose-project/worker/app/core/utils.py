@@ -2,9 +2,12 @@
 import hashlib
 import re
 from datetime import datetime
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from bs4 import BeautifulSoup
 
+from .keyword_matcher import KeywordMatcher
+
 
 def compute_content_hash(
     title: str,
@@ -27,6 +30,10 @@ def compute_content_hash(
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[^\w\s\u10A0-\u10FF]")
+
+
 def normalize_text(text: Optional[str]) -> str:
     """Normalize text for comparison and hashing.
 
@@ -46,18 +53,54 @@ def normalize_text(text: Optional[str]) -> str:
     # Convert to lowercase
     text = text.lower()
 
-    # Remove HTML tags if any
-    text = BeautifulSoup(text, "html.parser").get_text()
+    # Remove HTML tags if any. Without "<" (tags) or "&" (entities) the
+    # parser returns the text unchanged, so skip it on the hot path.
+    if "<" in text or "&" in text:
+        text = BeautifulSoup(text, "html.parser").get_text()
 
     # Normalize whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
 
     # Keep alphanumeric, Georgian characters, and spaces
-    text = re.sub(r"[^\w\s\u10A0-\u10FF]", "", text)
+    text = _NON_WORD_RE.sub("", text)
 
     return text
 
 
+# Salary-related keywords (Georgian and English)
+_SALARY_KEYWORDS = [
+    r'ხელფასი', r'salary', r'ანაზღაურება', r'compensation',
+    r'გასამრჯელო', r'pay', r'wage', r'income',
+    r'GEL', r'ლარი', r'\$', r'USD', r'€', r'EUR',
+]
+
+# Number near a salary keyword: first number (with optional thousands
+# separator) and an optional second one (range)
+_SALARY_KEYWORD_RE = re.compile(
+    r'(?:' + '|'.join(_SALARY_KEYWORDS) + r')'
+    r'[:\s]*'
+    r'(\d{1,3}(?:[,\s]?\d{3})*)'
+    r'(?:\s*[-–—]\s*(\d{1,3}(?:[,\s]?\d{3})*))?',
+    re.IGNORECASE,
+)
+
+# Reverse pattern: number followed by currency
+_SALARY_CURRENCY_RE = re.compile(
+    r'(\d{1,3}(?:[,\s]?\d{3})*)'
+    r'(?:\s*[-–—]\s*(\d{1,3}(?:[,\s]?\d{3})*))?'
+    r'\s*(?:GEL|ლარი|\$|USD|€|EUR)',
+    re.IGNORECASE,
+)
+
+_SALARY_NUMBER_RE = re.compile(r'\b(\d{3,5})\b')
+_FALLBACK_SALARY_KEYWORDS = ['ხელფასი', 'salary', 'ანაზღაურება', 'gel', 'ლარი']
+_DIGIT_RE = re.compile(r'\d')
+
+# Salary/date extraction sees the same strings many times per document
+# (parent, sibling and grandparent text of each date label)
+_EXTRACT_CACHE_SIZE = 4096
+
+
 def extract_salary(text: str) -> Tuple[Optional[int], Optional[int], str]:
     """Extract salary information from text.
 
@@ -77,30 +120,11 @@ def extract_salary(text: str) -> Tuple[Optional[int], Optional[int], str]:
     """
     if not text:
         return None, None, "GEL"
+    return _extract_salary(text)
 
-    # Salary-related keywords (Georgian and English)
-    salary_keywords = [
-        r'ხელფასი', r'salary', r'ანაზღაურება', r'compensation',
-        r'გასამრჯელო', r'pay', r'wage', r'income',
-        r'GEL', r'ლარი', r'\$', r'USD', r'€', r'EUR',
-    ]
-
-    # Build pattern to find salary context
-    # Look for numbers near salary keywords
-    salary_pattern = (
-        r'(?:' + '|'.join(salary_keywords) + r')'
-        r'[:\s]*'
-        r'(\d{1,3}(?:[,\s]?\d{3})*)'  # First number (with optional thousands separator)
-        r'(?:\s*[-–—]\s*(\d{1,3}(?:[,\s]?\d{3})*))?'  # Optional second number (range)
-    )
-
-    # Also try reverse pattern: number followed by currency
-    reverse_pattern = (
-        r'(\d{1,3}(?:[,\s]?\d{3})*)'
-        r'(?:\s*[-–—]\s*(\d{1,3}(?:[,\s]?\d{3})*))?'
-        r'\s*(?:GEL|ლარი|\$|USD|€|EUR)'
-    )
 
+@lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
+def _extract_salary(text: str) -> Tuple[Optional[int], Optional[int], str]:
     # Detect currency first
     currency = "GEL"
     if "$" in text or "USD" in text.upper():
@@ -108,11 +132,15 @@ def extract_salary(text: str) -> Tuple[Optional[int], Optional[int], str]:
     elif "€" in text or "EUR" in text.upper():
         currency = "EUR"
 
+    # Every pattern below needs a number
+    if not _DIGIT_RE.search(text):
+        return None, None, currency
+
     # Try to find salary with context
     text_lower = text.lower()
 
     # Try salary keyword pattern first
-    match = re.search(salary_pattern, text_lower, re.IGNORECASE)
+    match = _SALARY_KEYWORD_RE.search(text_lower)
     if match:
         num1 = int(match.group(1).replace(",", "").replace(" ", ""))
         num2 = int(match.group(2).replace(",", "").replace(" ", "")) if match.group(2) else num1
@@ -122,7 +150,7 @@ def extract_salary(text: str) -> Tuple[Optional[int], Optional[int], str]:
             return min(num1, num2), max(num1, num2), currency
 
     # Try reverse pattern (number + currency)
-    match = re.search(reverse_pattern, text, re.IGNORECASE)
+    match = _SALARY_CURRENCY_RE.search(text)
     if match:
         num1 = int(match.group(1).replace(",", "").replace(" ", ""))
         num2 = int(match.group(2).replace(",", "").replace(" ", "")) if match.group(2) else num1
@@ -133,12 +161,12 @@ def extract_salary(text: str) -> Tuple[Optional[int], Optional[int], str]:
 
     # Fallback: look for standalone salary-like numbers (3-5 digits, reasonable range)
     # But only if near a salary keyword
-    for keyword in ['ხელფასი', 'salary', 'ანაზღაურება', 'gel', 'ლარი']:
+    for keyword in _FALLBACK_SALARY_KEYWORDS:
         if keyword in text_lower:
             # Find numbers near this keyword (within 50 chars)
             keyword_pos = text_lower.find(keyword)
             context = text[max(0, keyword_pos - 30):keyword_pos + len(keyword) + 30]
-            numbers = re.findall(r'\b(\d{3,5})\b', context)
+            numbers = _SALARY_NUMBER_RE.findall(context)
             valid_numbers = [int(n) for n in numbers if 100 <= int(n) <= 50000]
             if valid_numbers:
                 if len(valid_numbers) == 1:
@@ -149,6 +177,35 @@ def extract_salary(text: str) -> Tuple[Optional[int], Optional[int], str]:
     return None, None, currency
 
 
+# Georgian month names
+_GE_MONTHS = {
+    "იანვარი": 1, "თებერვალი": 2, "მარტი": 3, "აპრილი": 4,
+    "მაისი": 5, "ივნისი": 6, "ივლისი": 7, "აგვისტო": 8,
+    "სექტემბერი": 9, "ოქტომბერი": 10, "ნოემბერი": 11, "დეკემბერი": 12,
+}
+
+# English month names
+_EN_MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12,
+}
+
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_DOT_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+# Per month: (name, number, "DD month YYYY" pattern, "DD month" pattern)
+_GE_MONTH_PATTERNS = [
+    (name, number, re.compile(rf"(\d{{1,2}})\s*{name}\s*(\d{{4}})"), re.compile(rf"(\d{{1,2}})\s*{name}"))
+    for name, number in _GE_MONTHS.items()
+]
+# Per month: (name, number, "Month DD, YYYY" pattern, "Month DD" pattern)
+_EN_MONTH_PATTERNS = [
+    (name, number, re.compile(rf"{name}\s+(\d{{1,2}}),?\s*(\d{{4}})"), re.compile(rf"{name}\s+(\d{{1,2}})"))
+    for name, number in _EN_MONTHS.items()
+]
+
+
 def extract_date(text: str, language: str = "ge") -> Optional[datetime]:
     """Extract date from text.
 
@@ -169,26 +226,17 @@ def extract_date(text: str, language: str = "ge") -> Optional[datetime]:
     """
     if not text:
         return None
+    return _extract_date(text.strip(), datetime.now().year)
 
-    text = text.strip()
-    current_year = datetime.now().year
 
-    # Georgian month names
-    ge_months = {
-        "იანვარი": 1, "თებერვალი": 2, "მარტი": 3, "აპრილი": 4,
-        "მაისი": 5, "ივნისი": 6, "ივლისი": 7, "აგვისტო": 8,
-        "სექტემბერი": 9, "ოქტომბერი": 10, "ნოემბერი": 11, "დეკემბერი": 12,
-    }
-
-    # English month names
-    en_months = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12,
-    }
+@lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
+def _extract_date(text: str, current_year: int) -> Optional[datetime]:
+    # Every format has a day number
+    if not _DIGIT_RE.search(text):
+        return None
 
     # Try ISO format (YYYY-MM-DD)
-    iso_match = re.search(r"(\d{4})-(\d{1,2})-(\d{1,2})", text)
+    iso_match = _ISO_DATE_RE.search(text)
     if iso_match:
         try:
             return datetime(
@@ -200,7 +248,7 @@ def extract_date(text: str, language: str = "ge") -> Optional[datetime]:
             pass
 
     # Try DD.MM.YYYY format
-    dot_match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
+    dot_match = _DOT_DATE_RE.search(text)
     if dot_match:
         try:
             return datetime(
@@ -212,10 +260,10 @@ def extract_date(text: str, language: str = "ge") -> Optional[datetime]:
             pass
 
     # Try Georgian format (DD month [YYYY])
-    for month_name, month_num in ge_months.items():
+    for month_name, month_num, with_year, without_year in _GE_MONTH_PATTERNS:
         if month_name in text:
             # First try with year
-            match = re.search(rf"(\d{{1,2}})\s*{month_name}\s*(\d{{4}})", text)
+            match = with_year.search(text)
             if match:
                 try:
                     return datetime(
@@ -227,7 +275,7 @@ def extract_date(text: str, language: str = "ge") -> Optional[datetime]:
                     pass
             else:
                 # Try without year (default to current year)
-                match = re.search(rf"(\d{{1,2}})\s*{month_name}", text)
+                match = without_year.search(text)
                 if match:
                     try:
                         return datetime(
@@ -240,10 +288,10 @@ def extract_date(text: str, language: str = "ge") -> Optional[datetime]:
 
     # Try English format
     text_lower = text.lower()
-    for month_name, month_num in en_months.items():
+    for month_name, month_num, with_year, without_year in _EN_MONTH_PATTERNS:
         if month_name in text_lower:
             # Try "Month DD, YYYY" first
-            match = re.search(rf"{month_name}\s+(\d{{1,2}}),?\s*(\d{{4}})", text_lower)
+            match = with_year.search(text_lower)
             if match:
                 try:
                     return datetime(
@@ -255,7 +303,7 @@ def extract_date(text: str, language: str = "ge") -> Optional[datetime]:
                     pass
             else:
                 # Try "Month DD" without year (default to current year)
-                match = re.search(rf"{month_name}\s+(\d{{1,2}})", text_lower)
+                match = without_year.search(text_lower)
                 if match:
                     try:
                         return datetime(
@@ -320,13 +368,193 @@ def detect_language(text: str) -> str:
     return "ge" if georgian_chars / total_alpha > 0.3 else "en"
 
 
+# Multi-word phrases, scored before single keywords.
+# These phrases help disambiguate (e.g., "sales consultant" should be sales, not customer-service)
+_CATEGORY_PHRASES = {
+    "it-programming": [
+        # IT Support/Engineer phrases - MUST come before customer-service
+        "it support", "it specialist", "it engineer", "it manager", "it admin",
+        "it სპეციალისტ", "it ინჟინერ", "it მხარდაჭერ", "it ადმინისტრატორ",
+        "it ქსელ",  # IT network
+        # Software/Dev phrases
+        "software engineer", "software developer", "web developer", "ვებ დეველოპერი",
+        "frontend developer", "backend developer", "fullstack developer", "full-stack developer",
+        "mobile developer", "ios developer", "android developer",
+        "data scientist", "data engineer", "data analyst",
+        "qa engineer", "devops engineer", "system administrator", "სისტემური ადმინისტრატორ",
+        "network engineer", "ml engineer", "ai engineer", "ai/ml",
+        "java developer", "python developer", "php developer", ".net developer",
+        "c# developer", "c++ developer", "ruby developer", "golang developer",
+        # Cloud/DevOps
+        "cloud engineer", "cloud architect", "devops", "სერვერ ადმინისტრატორ",
+    ],
+    "sales-marketing": [
+        "გაყიდვების კონსულტანტი", "გაყიდვების მენეჯერი", "გაყიდვების წარმომადგენელი",
+        "გაყიდვების სპეციალისტ",
+        "sales consultant", "sales manager", "sales representative", "sales specialist",
+        "მარკეტინგის მენეჯერი", "marketing manager", "digital marketing",
+        "brand manager", "pr manager", "smm manager", "seo specialist",
+    ],
+    "customer-service": [
+        # Note: "support" alone is ambiguous - IT support should go to IT
+        "customer service", "მომხმარებელთა მომსახურება", "მომხმარებელთა მხარდაჭერა",
+        "call center", "ქოლ ცენტრი",
+        "კლიენტთა მომსახურება",
+    ],
+    "hr-admin": [
+        "hr manager", "hr specialist", "ადამიანური რესურსები",
+        "office manager", "ოფის მენეჯერი",
+    ],
+}
+
+# Category keywords mapping - single words and short terms
+_CATEGORY_KEYWORDS = {
+    "it-programming": [
+        "developer", "programmer", "პროგრამისტი", "დეველოპერი",
+        "python", "javascript", "react", "node.js", "nodejs", "angular", "vue.js",
+        "devops", "ტესტერი", "machine learning",
+        "cybersecurity", "კიბერუსაფრთხოება",
+        "kotlin", "swift", "sql", "aws", "azure", "docker", "kubernetes",
+        # Additional IT terms
+        "backend", "frontend", "fullstack", "api", "database",
+        "linux", "windows server", "vmware", "networking",
+        "გრაფიკული", "photoshop", "figma",
+    ],
+    "sales-marketing": [
+        "გაყიდვები", "გაყიდვების", "sales",
+        "მარკეტინგი", "მარკეტინგის", "marketing",
+        "პიარი", "ექაუნთ მენეჯერი", "account manager",
+        "merchandiser", "მერჩენდაიზერი", "სავაჭრო",
+    ],
+    "finance-accounting": [
+        "finance", "ფინანსები", "ფინანსური", "accounting", "ბუღალტერია",
+        "accountant", "ბუღალტერი", "auditor", "აუდიტორი",
+        "საგადასახადო", "banker", "ბანკირი",
+        "კრედიტ", "სესხ", "ფინანსური ანალიტიკოსი",
+        "cashier", "მოლარე",
+    ],
+    "medicine-healthcare": [
+        "doctor", "ექიმი", "nurse", "ექთანი", "medical", "სამედიცინო",
+        "hospital", "საავადმყოფო", "clinic", "კლინიკა",
+        "pharmacy", "აფთიაქი", "pharmacist", "ფარმაცევტი",
+        "healthcare", "ჯანდაცვა", "dentist", "სტომატოლოგი",
+        "therapist", "თერაპევტი", "surgeon", "ქირურგი",
+        "psychologist", "ფსიქოლოგი", "laboratory", "ლაბორატორია",
+    ],
+    "education": [
+        "teacher", "მასწავლებელი", "tutor", "რეპეტიტორი",
+        "professor", "პროფესორი", "lecturer", "ლექტორი",
+        "განათლება", "school", "სკოლა",
+        "university", "უნივერსიტეტი", "trainer", "ტრენერი",
+        "instructor", "ინსტრუქტორი", "coach", "მწვრთნელი",
+    ],
+    "tourism-hospitality": [
+        "hotel", "სასტუმრო", "restaurant", "რესტორანი",
+        "tourism", "ტურიზმი", "travel", "მოგზაურობა",
+        "chef", "მზარეული", "cook",
+        "waiter", "მიმტანი", "bartender", "ბარმენი",
+        "receptionist", "რეცეფციონისტი", "housekeeping",
+        "კაფე", "cafe", "ბარი",
+    ],
+    "construction": [
+        "construction", "მშენებლობა", "builder", "მშენებელი",
+        "architect", "არქიტექტორი", "civil engineer", "სამოქალაქო ინჟინერი",
+        "electrician", "ელექტრიკოსი", "plumber", "სანტექნიკ",
+        "hvac", "კონდიციონერ", "welder", "შემდუღებელი",
+        "carpenter", "დურგალი",
+    ],
+    "logistics-transport": [
+        "driver", "მძღოლი", "logistics", "ლოჯისტიკა",
+        "transport", "ტრანსპორტი", "delivery", "მიტანა",
+        "courier", "კურიერი", "warehouse", "საწყობი",
+        "forklift", "შტაბელერი", "dispatcher", "დისპეტჩერი",
+        "expeditor", "ექსპედიტორი",
+    ],
+    "customer-service": [
+        "operator", "ოპერატორი",
+        # Note: "კონსულტანტი" removed - too generic, causes false positives
+    ],
+    "legal": [
+        "lawyer", "იურისტი", "attorney", "ადვოკატი",
+        "legal", "იურიდიული", "notary", "ნოტარიუსი",
+        "paralegal", "სამართლებრივი",
+    ],
+    "design-creative": [
+        # Media/journalism keywords (mapped here)
+        "journalist", "ჟურნალისტი", "editor", "რედაქტორი",
+        "reporter", "რეპორტერი", "copywriter", "კოპირაიტერი",
+        "content writer", "კონტენტ მენეჯერი", "media", "მედია",
+        "tv", "ტელე", "radio", "რადიო",
+        # Design keywords
+        "designer", "დიზაინერი", "graphic designer", "გრაფიკული დიზაინერი",
+        "ui/ux", "ux designer", "ui designer",
+        "creative", "კრეატიული", "art director",
+        "photographer", "ფოტოგრაფი", "videographer", "ვიდეოგრაფი",
+        "animator", "ანიმატორი", "illustrator", "ილუსტრატორი",
+    ],
+    "agriculture": [
+        "agriculture", "სოფლის მეურნეობა", "farming", "ფერმა",
+        "agronomist", "აგრონომი", "farmer", "ფერმერი",
+        "veterinary", "ვეტერინარ", "gardener", "მებაღე",
+    ],
+    "manufacturing": [
+        "manufacturing", "წარმოება", "production", "პროდუქცია",
+        "factory", "ქარხანა", "operator", "machine operator",
+        "quality control", "ხარისხის კონტროლი",
+        "assembly", "აწყობა", "packaging", "შეფუთვა",
+    ],
+    "hr-admin": [
+        # Security keywords (mapped here)
+        "security", "დაცვა", "guard", "მცველი",
+        "უსაფრთხოება", "security officer", "დაცვის თანამშრომელი",
+        # HR/Admin keywords
+        "recruiter", "რეკრუტერი",
+        "secretary", "მდივანი", "assistant", "ასისტენტი",
+        "administrator", "ადმინისტრატორი",
+    ],
+    # Cleaning jobs go to "other" category
+}
+
+# (title weight, body weight) per pass: a phrase in the title is very
+# confident, a phrase in the body moderately so; keywords count less.
+_PHRASE_WEIGHTS = (5, 2)
+_KEYWORD_WEIGHTS = (3, 1)
+
+
+def _build_category_index():
+    """Compile the category vocabulary into one matcher plus scoring table.
+
+    Each pattern maps to the (category, title weight, body weight, rank)
+    entries it contributes; a pattern listed twice scores twice, as before.
+    The rank reproduces the old tie-break order: categories scored by the
+    phrase pass come first, then those only the keyword pass scored.
+    """
+    entries: Dict[str, List[Tuple[str, int, int, int]]] = {}
+    rank = 0
+    for table, (title_weight, body_weight) in (
+        (_CATEGORY_PHRASES, _PHRASE_WEIGHTS),
+        (_CATEGORY_KEYWORDS, _KEYWORD_WEIGHTS),
+    ):
+        for category_slug, patterns in table.items():
+            for pattern in patterns:
+                entries.setdefault(pattern, []).append((category_slug, title_weight, body_weight, rank))
+            rank += 1
+    return KeywordMatcher(entries), entries
+
+
+_CATEGORY_MATCHER, _CATEGORY_ENTRIES = _build_category_index()
+
+
 def classify_category(title: str, body: str) -> Optional[str]:
     """Classify job into category based on keywords.
 
     Uses a scoring system - title matches are weighted higher than body matches.
-    Multi-word phrases are checked first to avoid partial matches.
+    Multi-word phrases score higher than single keywords.
     Returns the category with highest score, or "other" if no confident match.
 
+    All phrases and keywords are found in one pass over the title and one
+    over the body by a precompiled matcher.
+
     Args:
         title: Job title
         body: Job body
@@ -334,186 +562,22 @@ def classify_category(title: str, body: str) -> Optional[str]:
     Returns:
         Category slug (never None - returns "other" as fallback)
     """
-    title_lower = title.lower() if title else ""
-    body_lower = body.lower() if body else ""
-    combined = title_lower + " " + body_lower
-
-    # Multi-word phrases to check first (order matters - check before single words)
-    # These phrases help disambiguate (e.g., "sales consultant" should be sales, not customer-service)
-    phrase_categories = {
-        "it-programming": [
-            # IT Support/Engineer phrases - MUST come before customer-service
-            "it support", "it specialist", "it engineer", "it manager", "it admin",
-            "it სპეციალისტ", "it ინჟინერ", "it მხარდაჭერ", "it ადმინისტრატორ",
-            "it ქსელ",  # IT network
-            # Software/Dev phrases
-            "software engineer", "software developer", "web developer", "ვებ დეველოპერი",
-            "frontend developer", "backend developer", "fullstack developer", "full-stack developer",
-            "mobile developer", "ios developer", "android developer",
-            "data scientist", "data engineer", "data analyst",
-            "qa engineer", "devops engineer", "system administrator", "სისტემური ადმინისტრატორ",
-            "network engineer", "ml engineer", "ai engineer", "ai/ml",
-            "java developer", "python developer", "php developer", ".net developer",
-            "c# developer", "c++ developer", "ruby developer", "golang developer",
-            # Cloud/DevOps
-            "cloud engineer", "cloud architect", "devops", "სერვერ ადმინისტრატორ",
-        ],
-        "sales-marketing": [
-            "გაყიდვების კონსულტანტი", "გაყიდვების მენეჯერი", "გაყიდვების წარმომადგენელი",
-            "გაყიდვების სპეციალისტ",
-            "sales consultant", "sales manager", "sales representative", "sales specialist",
-            "მარკეტინგის მენეჯერი", "marketing manager", "digital marketing",
-            "brand manager", "pr manager", "smm manager", "seo specialist",
-        ],
-        "customer-service": [
-            # Note: "support" alone is ambiguous - IT support should go to IT
-            "customer service", "მომხმარებელთა მომსახურება", "მომხმარებელთა მხარდაჭერა",
-            "call center", "ქოლ ცენტრი",
-            "კლიენტთა მომსახურება",
-        ],
-        "hr-admin": [
-            "hr manager", "hr specialist", "ადამიანური რესურსები",
-            "office manager", "ოფის მენეჯერი",
-        ],
-    }
-
-    # Category keywords mapping - single words and short terms
-    categories = {
-        "it-programming": [
-            "developer", "programmer", "პროგრამისტი", "დეველოპერი",
-            "python", "javascript", "react", "node.js", "nodejs", "angular", "vue.js",
-            "devops", "ტესტერი", "machine learning",
-            "cybersecurity", "კიბერუსაფრთხოება",
-            "kotlin", "swift", "sql", "aws", "azure", "docker", "kubernetes",
-            # Additional IT terms
-            "backend", "frontend", "fullstack", "api", "database",
-            "linux", "windows server", "vmware", "networking",
-            "გრაფიკული", "photoshop", "figma",
-        ],
-        "sales-marketing": [
-            "გაყიდვები", "გაყიდვების", "sales",
-            "მარკეტინგი", "მარკეტინგის", "marketing",
-            "პიარი", "ექაუნთ მენეჯერი", "account manager",
-            "merchandiser", "მერჩენდაიზერი", "სავაჭრო",
-        ],
-        "finance-accounting": [
-            "finance", "ფინანსები", "ფინანსური", "accounting", "ბუღალტერია",
-            "accountant", "ბუღალტერი", "auditor", "აუდიტორი",
-            "საგადასახადო", "banker", "ბანკირი",
-            "კრედიტ", "სესხ", "ფინანსური ანალიტიკოსი",
-            "cashier", "მოლარე",
-        ],
-        "medicine-healthcare": [
-            "doctor", "ექიმი", "nurse", "ექთანი", "medical", "სამედიცინო",
-            "hospital", "საავადმყოფო", "clinic", "კლინიკა",
-            "pharmacy", "აფთიაქი", "pharmacist", "ფარმაცევტი",
-            "healthcare", "ჯანდაცვა", "dentist", "სტომატოლოგი",
-            "therapist", "თერაპევტი", "surgeon", "ქირურგი",
-            "psychologist", "ფსიქოლოგი", "laboratory", "ლაბორატორია",
-        ],
-        "education": [
-            "teacher", "მასწავლებელი", "tutor", "რეპეტიტორი",
-            "professor", "პროფესორი", "lecturer", "ლექტორი",
-            "განათლება", "school", "სკოლა",
-            "university", "უნივერსიტეტი", "trainer", "ტრენერი",
-            "instructor", "ინსტრუქტორი", "coach", "მწვრთნელი",
-        ],
-        "tourism-hospitality": [
-            "hotel", "სასტუმრო", "restaurant", "რესტორანი",
-            "tourism", "ტურიზმი", "travel", "მოგზაურობა",
-            "chef", "მზარეული", "cook",
-            "waiter", "მიმტანი", "bartender", "ბარმენი",
-            "receptionist", "რეცეფციონისტი", "housekeeping",
-            "კაფე", "cafe", "ბარი",
-        ],
-        "construction": [
-            "construction", "მშენებლობა", "builder", "მშენებელი",
-            "architect", "არქიტექტორი", "civil engineer", "სამოქალაქო ინჟინერი",
-            "electrician", "ელექტრიკოსი", "plumber", "სანტექნიკ",
-            "hvac", "კონდიციონერ", "welder", "შემდუღებელი",
-            "carpenter", "დურგალი",
-        ],
-        "logistics-transport": [
-            "driver", "მძღოლი", "logistics", "ლოჯისტიკა",
-            "transport", "ტრანსპორტი", "delivery", "მიტანა",
-            "courier", "კურიერი", "warehouse", "საწყობი",
-            "forklift", "შტაბელერი", "dispatcher", "დისპეტჩერი",
-            "expeditor", "ექსპედიტორი",
-        ],
-        "customer-service": [
-            "operator", "ოპერატორი",
-            # Note: "კონსულტანტი" removed - too generic, causes false positives
-        ],
-        "legal": [
-            "lawyer", "იურისტი", "attorney", "ადვოკატი",
-            "legal", "იურიდიული", "notary", "ნოტარიუსი",
-            "paralegal", "სამართლებრივი",
-        ],
-        "design-creative": [
-            # Media/journalism keywords (mapped here)
-            "journalist", "ჟურნალისტი", "editor", "რედაქტორი",
-            "reporter", "რეპორტერი", "copywriter", "კოპირაიტერი",
-            "content writer", "კონტენტ მენეჯერი", "media", "მედია",
-            "tv", "ტელე", "radio", "რადიო",
-            # Design keywords
-            "designer", "დიზაინერი", "graphic designer", "გრაფიკული დიზაინერი",
-            "ui/ux", "ux designer", "ui designer",
-            "creative", "კრეატიული", "art director",
-            "photographer", "ფოტოგრაფი", "videographer", "ვიდეოგრაფი",
-            "animator", "ანიმატორი", "illustrator", "ილუსტრატორი",
-        ],
-        "agriculture": [
-            "agriculture", "სოფლის მეურნეობა", "farming", "ფერმა",
-            "agronomist", "აგრონომი", "farmer", "ფერმერი",
-            "veterinary", "ვეტერინარ", "gardener", "მებაღე",
-        ],
-        "manufacturing": [
-            "manufacturing", "წარმოება", "production", "პროდუქცია",
-            "factory", "ქარხანა", "operator", "machine operator",
-            "quality control", "ხარისხის კონტროლი",
-            "assembly", "აწყობა", "packaging", "შეფუთვა",
-        ],
-        "hr-admin": [
-            # Security keywords (mapped here)
-            "security", "დაცვა", "guard", "მცველი",
-            "უსაფრთხოება", "security officer", "დაცვის თანამშრომელი",
-            # HR/Admin keywords
-            "recruiter", "რეკრუტერი",
-            "secretary", "მდივანი", "assistant", "ასისტენტი",
-            "administrator", "ადმინისტრატორი",
-        ],
-        # Cleaning jobs go to "other" category
-    }
-
-    scores = {}
-
-    # First pass: check multi-word phrases (higher priority)
-    for category_slug, phrases in phrase_categories.items():
-        score = scores.get(category_slug, 0)
-        for phrase in phrases:
-            if phrase in title_lower:
-                score += 5  # Phrase in title = very confident
-            elif phrase in body_lower:
-                score += 2  # Phrase in body = moderately confident
-        if score > 0:
-            scores[category_slug] = score
-
-    # Second pass: check single keywords
-    for category_slug, keywords in categories.items():
-        score = scores.get(category_slug, 0)
-        for keyword in keywords:
-            if keyword in title_lower:
-                score += 3  # Word in title
-            elif keyword in body_lower:
-                score += 1  # Word in body
-        if score > 0:
-            scores[category_slug] = score
+    title_hits = _CATEGORY_MATCHER.find(title.lower()) if title else set()
+    body_hits = _CATEGORY_MATCHER.find(body.lower()) if body else set()
+
+    scores: Dict[str, int] = {}
+    order: Dict[str, int] = {}
+    for pattern in title_hits | body_hits:
+        in_title = pattern in title_hits
+        for category_slug, title_weight, body_weight, rank in _CATEGORY_ENTRIES[pattern]:
+            scores[category_slug] = scores.get(category_slug, 0) + (title_weight if in_title else body_weight)
+            order[category_slug] = min(order.get(category_slug, rank), rank)
 
     if not scores:
         return "other"
 
-    # Get category with highest score
-    best_category = max(scores, key=scores.get)
+    # Highest score wins; ties go to the category scored first
+    best_category = min(scores, key=lambda slug: (-scores[slug], order[slug]))
     best_score = scores[best_category]
 
     # Require minimum score of 3 for confidence
@@ -522,3 +586,23 @@ def classify_category(title: str, body: str) -> Optional[str]:
         return "other"
 
     return best_category
+
+
+def classify_categories(jobs: Iterable[Tuple[str, str]]) -> List[str]:
+    """Classify many jobs at once.
+
+    Args:
+        jobs: (title, body) pairs
+
+    Returns:
+        Category slugs, in the same order as jobs
+    """
+    results: List[str] = []
+    seen: Dict[Tuple[str, str], str] = {}
+    for title, body in jobs:
+        key = (title or "", body or "")
+        category_slug = seen.get(key)
+        if category_slug is None:
+            category_slug = seen[key] = classify_category(*key)
+        results.append(category_slug)
+    return results
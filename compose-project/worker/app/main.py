@@ -8,6 +8,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import get_config
+from app.core.metrics import start_metrics_server
+from app.core.parse_executor import shutdown_parse_executor
 from app.core.runner import ParserRunner
 from app.core.logging import configure_logging, get_logger
 from app.tasks.analytics import (
@@ -37,6 +39,8 @@ class WorkerService:
         self.scheduler = AsyncIOScheduler()
         self.runner: ParserRunner | None = None
         self._shutdown_event = asyncio.Event()
+        self._run_lock = asyncio.Lock()  # Incremental runs and full sweeps never overlap
+        self._full_sweep_due = False  # A full sweep is waiting for the lock
 
     async def setup(self):
         """Initialize the worker service."""
@@ -77,16 +81,46 @@ class WorkerService:
             interval_minutes=self.config.parser_interval_minutes,
         )
 
-    async def run_parsers(self):
-        """Execute a full parsing run."""
+    async def run_parsers(self, mode: str = "incremental"):
+        """Execute a parsing run.
+
+        Args:
+            mode: "incremental" (new/changed listings only) or "full" sweep.
+                Only full sweeps refresh every job's last_seen_at, so only
+                they deactivate jobs that were not seen.
+
+        A full sweep is never dropped: it waits for a run in progress, and
+        an incremental run that gets the lock while a sweep is waiting runs
+        the sweep instead. An incremental run is dropped while another run
+        is in progress, since that run covers it.
+        """
         if not self.runner:
             logger.error("runner_not_initialized")
             return
 
-        logger.info("parsing_run_started", timestamp=datetime.now(timezone.utc).isoformat())
+        if mode == "full":
+            self._full_sweep_due = True
+            if self._run_lock.locked():
+                logger.info("full_sweep_queued", reason="run_in_progress")
+        elif self._run_lock.locked():
+            logger.info("parsing_run_skipped", mode=mode, reason="run_in_progress")
+            return
+
+        async with self._run_lock:
+            if self._full_sweep_due:
+                mode = "full"
+                self._full_sweep_due = False
+            elif mode == "full":
+                # An incremental run that got the lock first did the sweep
+                logger.info("parsing_run_skipped", mode=mode, reason="sweep_already_run")
+                return
+            await self._run_parsers(mode)
+
+    async def _run_parsers(self, mode: str):
+        logger.info("parsing_run_started", mode=mode, timestamp=datetime.now(timezone.utc).isoformat())
 
         try:
-            results = await self.runner.run_all()
+            results = await self.runner.run_all(mode=mode)
 
             for source, result in results.items():
                 logger.info(
@@ -98,28 +132,42 @@ class WorkerService:
                 )
 
             # Deactivate old jobs
-            deactivated = await self.runner.deactivate_not_seen()
-            if deactivated:
-                logger.info("old_jobs_deactivated", count=deactivated)
+            if mode == "full":
+                deactivated = await self.runner.deactivate_not_seen()
+                if deactivated:
+                    logger.info("old_jobs_deactivated", count=deactivated)
 
         except Exception as e:
             logger.error("parsing_run_failed", error=str(e), exc_info=True)
 
     def setup_scheduler(self):
         """Set up the job scheduler."""
-        # Schedule parsing runs
+        # Schedule incremental parsing runs
         self.scheduler.add_job(
             self.run_parsers,
             trigger=IntervalTrigger(minutes=self.config.parser_interval_minutes),
+            kwargs={"mode": "incremental"},
             id="parser_run",
             name="Parser Run",
             replace_existing=True,
             max_instances=1,
         )
 
-        # Run immediately on startup
+        # Schedule full sweeps (refresh last_seen_at, deactivate unseen jobs)
+        self.scheduler.add_job(
+            self.run_parsers,
+            trigger=IntervalTrigger(hours=self.config.full_sweep_hours),
+            kwargs={"mode": "full"},
+            id="parser_full_sweep",
+            name="Parser Full Sweep",
+            replace_existing=True,
+            max_instances=1,
+        )
+
+        # Full sweep immediately on startup
         self.scheduler.add_job(
             self.run_parsers,
+            kwargs={"mode": "full"},
             id="parser_run_immediate",
             name="Parser Run (Immediate)",
             next_run_time=datetime.now(),
@@ -166,6 +214,7 @@ class WorkerService:
         logger.info(
             "scheduler_configured",
             interval_minutes=self.config.parser_interval_minutes,
+            full_sweep_hours=self.config.full_sweep_hours,
             analytics_refresh_hours=4,
             weekly_report="Monday 8 AM",
         )
@@ -173,6 +222,7 @@ class WorkerService:
     async def start(self):
         """Start the worker service."""
         await self.setup()
+        start_metrics_server(self.config.metrics_port)
         self.setup_scheduler()
         self.scheduler.start()
 
@@ -185,6 +235,9 @@ class WorkerService:
         """Stop the worker service."""
         logger.info("worker_stopping")
         self.scheduler.shutdown(wait=True)
+        shutdown_parse_executor()
+        if self.runner:
+            await self.runner.close()
         self._shutdown_event.set()
         logger.info("worker_stopped")
 
@@ -45,7 +45,7 @@ class Job(Base, UUIDMixin, TimestampMixin):
     remote_type = Column(String(20), default="onsite", nullable=False)
 
     # Category
-    category_id = Column(UUID(as_uuid=True), nullable=True)
+    category_id = Column(UUID(as_uuid=True), nullable=False)
 
     # Employment details
     employment_type = Column(String(20), default="full_time", nullable=False)
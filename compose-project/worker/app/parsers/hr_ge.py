@@ -1,11 +1,15 @@
 """HR.ge parser adapter."""
 import re
 from datetime import datetime
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, List, Optional, Union
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 
-from app.core.base_adapter import BaseAdapter, JobData
+from app.core.base_adapter import BaseAdapter, JobData, ParseResult
+from app.core.config import get_config
+from app.core.crawl_scheduler import get_host_rate_limiter
 from app.core.http_client import HTTPClient
+from app.core.parse_executor import decode_html, get_parse_executor
 from app.core.utils import (
     clean_html,
     compute_content_hash,
@@ -20,6 +24,11 @@ class HrGeAdapter(BaseAdapter):
 
     HR.ge is one of the largest job boards in Georgia, featuring
     jobs from various sectors across the country.
+
+    The adapter owns one pooled, keep-alive (HTTP/2 where available)
+    HTTPClient for its lifetime, paced by the process-wide host rate
+    limiter: run() opens and closes it; standalone calls open it lazily and
+    the caller closes it with close() or `async with adapter:`.
     """
 
     source_name = "hr.ge"
@@ -59,38 +68,77 @@ class HrGeAdapter(BaseAdapter):
         "დიზაინი": "media-creative",
     }
 
+    def __init__(self):
+        self.client: Optional[HTTPClient] = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self) -> HTTPClient:
+        """Open the adapter's HTTP client, if not open yet."""
+        if self.client is None:
+            config = get_config()
+            rate_limiter = get_host_rate_limiter()
+            rate_limiter.set_rate(
+                urlparse(self.base_url).hostname,
+                config.host_requests_per_second or 1.0 / self.rate_limit_delay,
+            )
+            client = HTTPClient(
+                timeout=config.request_timeout,
+                rate_limit_delay=self.rate_limit_delay,
+                rate_limiter=rate_limiter,
+                http2=True,
+                max_connections=config.crawl_concurrency,
+            )
+            self.client = await client.__aenter__()
+        return self.client
+
+    async def close(self):
+        """Close the adapter's HTTP client and its connections."""
+        if self.client is not None:
+            client, self.client = self.client, None
+            await client.__aexit__(None, None, None)
+
+    async def run(self, region: Optional[str] = None, **kwargs) -> ParseResult:
+        """Execute a parsing run over one pooled client."""
+        async with self:
+            return await super().run(region, **kwargs)
+
     async def discover_job_urls(self, region: Optional[str] = None) -> AsyncIterator[str]:
         """Discover job URLs from list pages."""
-        async with HTTPClient(rate_limit_delay=self.rate_limit_delay) as client:
-            page = 1
-            while page <= self.max_pages:
-                jobs = await self.parse_list_page(page, region)
-                if not jobs:
-                    break
+        page = 1
+        while page <= self.max_pages:
+            jobs = await self.parse_list_page(page, region)
+            if not jobs:
+                break
 
-                for job in jobs:
-                    if "url" in job:
-                        yield job["url"]
+            for job in jobs:
+                if "url" in job:
+                    yield job["url"]
 
-                page += 1
+            page += 1
 
     async def parse_list_page(self, page: int, region: Optional[str] = None) -> List[dict]:
         """Parse a job list page from hr.ge."""
-        async with HTTPClient(rate_limit_delay=self.rate_limit_delay) as client:
-            try:
-                # HR.ge uses query parameters for filtering
-                url = f"{self.base_url}/vacancies"
-                params = {"page": page}
+        client = await self.open()
+        try:
+            # HR.ge uses query parameters for filtering
+            url = f"{self.base_url}/vacancies"
+            params = {"page": page}
 
-                # Add region filter if specified
-                if region and region in self.REGION_MAPPING:
-                    params["location"] = self.REGION_MAPPING[region]
+            # Add region filter if specified
+            if region and region in self.REGION_MAPPING:
+                params["location"] = self.REGION_MAPPING[region]
 
-                html = await client.get_text(url, params=params)
-                return self._extract_jobs_from_list(html)
+            html = await client.get_bytes(url, params=params)
+            return await get_parse_executor().run(parse_list_html, html, self.base_url)
 
-            except Exception:
-                return []
+        except Exception:
+            return []
 
     def _extract_jobs_from_list(self, html: str) -> List[dict]:
         """Extract job entries from list page HTML."""
@@ -159,14 +207,13 @@ class HrGeAdapter(BaseAdapter):
 
     async def parse_job(self, url: str) -> Optional[JobData]:
         """Parse a single job detail page from hr.ge."""
-        async with HTTPClient(rate_limit_delay=self.rate_limit_delay) as client:
-            try:
-                html = await client.get_text(url)
-                job_data = self._parse_detail_page(html, url)
-                return job_data
+        client = await self.open()
+        try:
+            html = await client.get_bytes(url)
+            return await get_parse_executor().run(parse_detail_html, html, url)
 
-            except Exception:
-                return None
+        except Exception:
+            return None
 
     def _parse_detail_page(self, html: str, url: str) -> Optional[JobData]:
         """Parse job details from a detail page."""
@@ -386,3 +433,18 @@ class HrGeAdapter(BaseAdapter):
                 return value
 
         return None
+
+
+# ParseExecutor entry points (module-level so they can run in the pool)
+
+
+def parse_list_html(html: Union[str, bytes], base_url: str = HrGeAdapter.base_url) -> List[dict]:
+    """Extract job entries from a list page's raw body."""
+    adapter = HrGeAdapter()
+    adapter.base_url = base_url
+    return adapter._extract_jobs_from_list(decode_html(html))
+
+
+def parse_detail_html(html: Union[str, bytes], url: str) -> Optional[JobData]:
+    """Parse a detail page's raw body into JobData."""
+    return HrGeAdapter()._parse_detail_page(decode_html(html), url)
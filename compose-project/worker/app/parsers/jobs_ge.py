@@ -6,21 +6,39 @@ filter parameters (cid for category, lid for location/region).
 Key features:
 - Category is KNOWN from URL parameter (cid), not guessed by keywords
 - Region is KNOWN from URL parameter (lid)
-- Iterates: Region → Category → Jobs (with pagination)
-- Deduplicates by source_url
+- Crawls Region × Category list pages and job details concurrently from a
+  priority frontier, within a shared per-host request budget
+- Deduplicates by job ID across categories, regions and (via the runner's
+  shared SeenIndex) all jobs of a sweep
+- Skips detail fetches for listings unchanged since the last run (detail cache)
+- Fetches English pages as a follow-up task queued right behind the job
+  details of the same list page, so each job is handed on while its page is
+  crawled: only for new/changed Georgian postings that may have a distinct
+  English version (learned per posting and per company in the detail cache),
+  and not at all once CRAWL_BUDGET_SECONDS is spent
+- Incremental mode: only new/changed listings; a category stops paginating at
+  the first page whose listings are all known (jobs.ge lists newest first)
+- Parses each page once with lxml (see jobsge_extract), in the shared
+  ParseExecutor process pool so parsing overlaps with fetching
 
 URL format: https://jobs.ge/ge/?cid={category_id}&lid={region_id}&page={page}
 """
+import asyncio
 import re
 import structlog
+from collections import Counter
 from datetime import datetime
-from typing import Awaitable, Callable, List, Optional, Set
+from typing import Awaitable, Callable, List, Optional, Tuple
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
 
 from app.core.base_adapter import BaseAdapter, JobData, ParseResult
+from app.core.config import get_config
+from app.core.crawl_scheduler import CrawlScheduler, get_host_rate_limiter
+from app.core.detail_cache import DetailCache, body_digest, get_detail_cache
 from app.core.http_client import HTTPClient
-from app.core.utils import clean_html, compute_content_hash, extract_date, extract_salary, classify_category
+from app.core.parse_executor import get_parse_executor
+from app.core.seen_index import SeenIndex
+from app.core.utils import compute_content_hash, classify_category, detect_language
 from app.parsers.jobsge_config import (
     JOBSGE_CATEGORIES,
     CategoryConfig,
@@ -29,21 +47,47 @@ from app.parsers.jobsge_config import (
     get_regions_by_slugs,
     get_all_categories,
 )
+from app.parsers.jobsge_extract import ListPage, parse_detail_page, parse_list_page
 
 
 logger = structlog.get_logger()
 
+# Crawl frontier priorities (lower runs first). Details drain before further
+# list pages are discovered, which keeps the frontier small.
+DETAIL_PRIORITY = 0
+LIST_PRIORITY = 1
+# English pages queue behind the details already in the frontier, ahead of
+# the next list page: a job waits for its English version, not for the
+# whole Georgian crawl.
+ENGLISH_PRIORITY = DETAIL_PRIORITY
+
+# Postings from a company without a distinct English version after this many
+# checks are assumed Georgian-only
+ENGLISH_COMPANY_SAMPLES = 3
+
+# Safety limit on pages per region/category
+MAX_PAGES_PER_CATEGORY = 50
+
+
+def _distinct_english(fields_ge: dict, fields_en: dict) -> Optional[dict]:
+    """English fields, or None if the /en/ page just repeats the Georgian posting."""
+    if (fields_en.get("title"), fields_en.get("body")) == (fields_ge.get("title"), fields_ge.get("body")):
+        return None
+    return fields_en
+
 
 class JobsGeAdapter(BaseAdapter):
     """Parser adapter for jobs.ge using native filter parameters.
 
     Strategy:
-    1. Iterate through each enabled region (starting with Adjara - lid=14)
-    2. For each region, iterate through all categories (cid=1 to cid=18)
-    3. Fetch jobs using filter URL: https://jobs.ge/ge/?cid={cid}&lid={lid}
+    1. Seed a list-page task for each enabled region × category (cid=1 to cid=18)
+    2. Fetch jobs using filter URL: https://jobs.ge/ge/?cid={cid}&lid={lid}
+    3. Each list page queues its job details and the next page (if any)
     4. Category and region are KNOWN from URL parameters
-    5. Handle pagination if multiple pages exist
-    6. Deduplicate by source_url (original job URL)
+    5. Deduplicate by job ID (each detail page is fetched once per sweep)
+
+    Tasks run on a CrawlScheduler with CRAWL_CONCURRENCY workers; the request
+    rate is bounded by the process-wide per-host token bucket.
 
     Example URLs:
     - IT jobs in Adjara: https://jobs.ge/ge/?cid=6&lid=14
@@ -56,17 +100,30 @@ class JobsGeAdapter(BaseAdapter):
     rate_limit_delay = 2.0
     user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
-    def __init__(self):
-        """Initialize the parser with category and region configs."""
+    def __init__(self, detail_cache: Optional[DetailCache] = None):
+        """Initialize the parser with category and region configs.
+
+        Args:
+            detail_cache: Detail page cache. If None, the shared cache is
+                         opened on run() (when enabled in config).
+        """
         self.categories = get_all_categories()
         self.regions = get_enabled_regions()
-        self._seen_urls: Set[str] = set()  # For deduplication within a run
+        self.detail_cache = detail_cache
+        self._seen = SeenIndex()  # Job IDs queued this run (or shared sweep)
         self._on_job_parsed: Optional[Callable[[JobData], Awaitable[str]]] = None
+        self._on_jobs_seen: Optional[Callable[[List[Tuple[str, int, int]]], Awaitable[None]]] = None
+        self._cache_stats: Counter = Counter()
+        self._jobs_found: Counter = Counter()  # (lid, cid) -> jobs parsed
+        self._callback_lock = asyncio.Lock()
+        self._scheduler: Optional[CrawlScheduler] = None
+        self._deadline: Optional[float] = None  # Loop time the crawl budget ends
 
     async def run(
         self,
         region: Optional[str] = None,
-        on_job_parsed: Optional[Callable[[JobData], Awaitable[str]]] = None
+        on_job_parsed: Optional[Callable[[JobData], Awaitable[str]]] = None,
+        on_jobs_seen: Optional[Callable[[List[Tuple[str, int, int]]], Awaitable[None]]] = None,
     ) -> ParseResult:
         """Execute full parsing run through region/category combinations.
 
@@ -77,13 +134,26 @@ class JobsGeAdapter(BaseAdapter):
             on_job_parsed: Optional async callback called for each parsed job.
                           If provided, jobs are NOT collected in result.jobs.
                           Callback receives JobData and should return status string.
+            on_jobs_seen: Optional async callback called once per list page
+                          with (external_id, cid, lid) of every listing on it,
+                          whether or not its detail page is fetched.
 
         Returns:
             ParseResult with statistics (jobs list empty if callback provided)
         """
-        result = ParseResult()
-        self._seen_urls.clear()
-        self._on_job_parsed = on_job_parsed  # Store for use in _parse_category
+        result = self.new_result()
+        self._seen = self.seen_index if self.seen_index is not None else SeenIndex()
+        self._on_job_parsed = on_job_parsed  # Store for use in crawl tasks
+        self._on_jobs_seen = on_jobs_seen
+        self._cache_stats = Counter()
+        self._jobs_found = Counter()
+
+        config = get_config()
+        if self.detail_cache is None:
+            self.detail_cache = get_detail_cache()
+        self._deadline = None
+        if config.crawl_budget_seconds:
+            self._deadline = asyncio.get_running_loop().time() + config.crawl_budget_seconds
 
         # Determine which regions to parse
         if region:
@@ -103,30 +173,49 @@ class JobsGeAdapter(BaseAdapter):
             logger.warning("no_regions_to_parse", requested=region)
             return result
 
+        if self.incremental and not self.detail_cache:
+            logger.warning("incremental_needs_detail_cache", fallback="full")
+
         logger.info(
             "parser_starting",
             regions=[r.name_en for r in regions_to_parse],
             categories=len(self.categories),
             instant_mode=on_job_parsed is not None,
+            incremental=self.incremental,
+        )
+
+        # Per-host politeness budget, shared with any parallel runs
+        rate_limiter = get_host_rate_limiter()
+        rate_limiter.set_rate(
+            self.source_domain,
+            config.host_requests_per_second or 1.0 / self.rate_limit_delay,
         )
 
         async with HTTPClient(
             rate_limit_delay=self.rate_limit_delay,
-            headers={"User-Agent": self.user_agent}
+            headers={"User-Agent": self.user_agent},
+            rate_limiter=rate_limiter,
         ) as client:
             self.client = client
+            self._scheduler = CrawlScheduler(config.crawl_concurrency)
 
             for region_config in regions_to_parse:
-                try:
-                    region_result = await self._parse_region(region_config)
-                    if not on_job_parsed:
-                        result.jobs.extend(region_result.jobs)
-                    result.errors.extend(region_result.errors)
-                    result.pages_parsed += region_result.pages_parsed
-                except Exception as e:
-                    error_msg = f"Error parsing region {region_config.name_en}: {str(e)}"
-                    logger.error("region_parse_failed", region=region_config.name_en, error=str(e))
-                    result.errors.append(error_msg)
+                logger.info("parsing_region", region=region_config.name_en, lid=region_config.lid)
+                for category in self.categories:
+                    self._scheduler.submit(
+                        LIST_PRIORITY, self._crawl_list_page, region_config, category, 1, result
+                    )
+
+            try:
+                await self._scheduler.run()
+            finally:
+                self._scheduler = None
+
+        for region_config in regions_to_parse:
+            self._log_region_completed(region_config)
+
+        if self.detail_cache:
+            self.detail_cache.prune(config.detail_cache_max_age_days)
 
         if not on_job_parsed:
             result.total_found = len(result.jobs)
@@ -134,124 +223,187 @@ class JobsGeAdapter(BaseAdapter):
             "parser_completed",
             pages_parsed=result.pages_parsed,
             errors=len(result.errors),
+            detail_cache=dict(self._cache_stats),
+            host_rate=round(rate_limiter.get_rate(self.source_domain), 3),
         )
 
         return result
 
-    async def _parse_region(self, region: RegionConfig) -> ParseResult:
-        """Parse all categories for a single region.
+    async def _crawl_list_page(
+        self,
+        region: RegionConfig,
+        category: CategoryConfig,
+        page: int,
+        result: ParseResult,
+    ):
+        """Fetch one list page, queue its job details and the next page.
 
         Args:
             region: Region configuration
-
-        Returns:
-            ParseResult for this region
+            category: Category configuration
+            page: Page number (1-indexed)
+            result: Run result to record pages/errors in
         """
-        result = ParseResult()
-        jobs_in_region = 0
+        # Build filter URL
+        url = self._build_filter_url(region.lid, category.cid, page)
 
-        logger.info("parsing_region", region=region.name_en, lid=region.lid)
+        try:
+            html = await self.client.get_bytes(url)
+            result.pages_parsed += 1
 
-        for category in self.categories:
-            try:
-                cat_result = await self._parse_category(region, category)
-                if not self._on_job_parsed:
-                    result.jobs.extend(cat_result.jobs)
-                jobs_in_region += cat_result.total_found
-                result.errors.extend(cat_result.errors)
-                result.pages_parsed += cat_result.pages_parsed
-
-                if cat_result.total_found > 0:
-                    logger.info(
-                        "category_completed",
-                        region=region.name_en,
-                        category=category.name_en,
-                        cid=category.cid,
-                        jobs_found=cat_result.total_found,
-                    )
-            except Exception as e:
-                error_msg = f"Error parsing {region.name_en}/{category.name_en}: {str(e)}"
-                logger.warning("category_parse_failed", region=region.name_en, category=category.name_en, error=str(e))
-                result.errors.append(error_msg)
+            # Extract job URLs (with listing row signatures) from list
+            entries, has_next_page = await get_parse_executor().run(
+                parse_list_page, html, self.base_url, page
+            )
 
-        logger.info(
-            "region_completed",
-            region=region.name_en,
-            lid=region.lid,
-            jobs_found=jobs_in_region,
-            categories_parsed=len(self.categories),
-        )
+            # If no jobs found on this page, stop pagination
+            if not entries:
+                return
 
-        return result
+            known_listings = 0
+            for job_url, signature in entries:
+                if self.incremental and self._is_known_listing(job_url, signature):
+                    known_listings += 1
+                    self._cache_stats["listing_known"] += 1
+                    continue
+                # Skip if already queued (within this run or sweep)
+                seen_key = self._extract_id_from_url(job_url) or job_url
+                if seen_key in self._seen:
+                    continue
+                self._seen.add(seen_key)
+                self._scheduler.submit(
+                    DETAIL_PRIORITY, self._crawl_job_detail, job_url, region, category, signature, result
+                )
+
+            if self._on_jobs_seen:
+                await self._report_seen(entries, region, category)
+
+            # Incremental: everything below a page whose listings all match
+            # a stored signature is older. Listings skipped only because they
+            # were already queued this run may be new, so they don't count.
+            if self.incremental and self.detail_cache and known_listings == len(entries):
+                logger.debug("incremental_stop", lid=region.lid, cid=category.cid, page=page)
+                return
+
+            # Check for next page
+            if page < MAX_PAGES_PER_CATEGORY and has_next_page:
+                self._scheduler.submit(
+                    LIST_PRIORITY, self._crawl_list_page, region, category, page + 1, result
+                )
 
-    async def _parse_category(
+        except Exception as e:
+            result.errors.append(f"Error fetching {url}: {str(e)}", kind=f"list:{type(e).__name__}")
+
+    async def _report_seen(self, entries: List[tuple], region: RegionConfig, category: CategoryConfig):
+        """Pass the listings of a page to the on_jobs_seen callback."""
+        seen = {}
+        for job_url, _ in entries:
+            external_id = self._extract_id_from_url(job_url)
+            if external_id:
+                seen[external_id] = (external_id, category.cid, region.lid)
+        if not seen:
+            return
+        try:
+            await self._on_jobs_seen(list(seen.values()))
+        except Exception as e:
+            # Detail crawling goes on; full sweeps catch up on last_seen
+            logger.warning("jobs_seen_callback_failed", count=len(seen), error=str(e))
+
+    async def _crawl_job_detail(
         self,
+        job_url: str,
         region: RegionConfig,
-        category: CategoryConfig
-    ) -> ParseResult:
-        """Parse all jobs for a specific region/category combination.
+        category: CategoryConfig,
+        signature: Optional[str],
+        result: ParseResult,
+    ):
+        """Parse one job and hand it on, or queue its English page first."""
+        try:
+            external_id = self._extract_id_from_url(job_url)
+            loaded = await self._load_detail_fields(job_url, external_id, signature)
+            if not loaded:
+                return
+
+            fields_ge, fields_en, fresh = loaded
+            if fresh and self._wants_english(external_id, fields_ge):
+                self._scheduler.submit(
+                    ENGLISH_PRIORITY, self._crawl_job_english,
+                    job_url, external_id, region, category, signature, fields_ge, result,
+                )
+                return
+
+            if fresh:
+                self._put_signature(external_id, signature)
+            job = self._build_job_data(job_url, external_id, region, category, fields_ge, fields_en)
+            await self._deliver(job, region, category, result)
+        except Exception as e:
+            result.errors.append(f"Error parsing job {job_url}: {str(e)}", kind=f"detail:{type(e).__name__}")
 
-        Handles pagination automatically by checking for next page links.
-        If on_job_parsed callback is set, calls it for each job immediately.
+    async def _crawl_job_english(
+        self,
+        job_url: str,
+        external_id: Optional[str],
+        region: RegionConfig,
+        category: CategoryConfig,
+        signature: Optional[str],
+        fields_ge: dict,
+        result: ParseResult,
+    ):
+        """Add the English version to a parsed job, then hand it on.
+
+        Past the crawl budget the job goes out Georgian-only; its listing
+        signature isn't stored, so the next run tries English again.
+        """
+        try:
+            fields_en = None
+            if self._budget_exhausted():
+                self._cache_stats["english_over_budget"] += 1
+            else:
+                fields_en = await self._fetch_english_fields(job_url, external_id, fields_ge)
+                self._put_signature(external_id, signature)
+            job = self._build_job_data(job_url, external_id, region, category, fields_ge, fields_en)
+            await self._deliver(job, region, category, result)
+        except Exception as e:
+            result.errors.append(f"Error parsing job {job_url}: {str(e)}", kind=f"detail:{type(e).__name__}")
 
-        Args:
-            region: Region configuration
-            category: Category configuration
+    async def _deliver(self, job: JobData, region: RegionConfig, category: CategoryConfig, result: ParseResult):
+        """Hand a job to the callback (or collect it).
 
-        Returns:
-            ParseResult for this category
+        Callbacks are serialized: the runner's callback shares one DB session.
         """
-        result = ParseResult()
-        page = 1
-        max_pages = 50  # Safety limit
-        jobs_found = 0
+        self._jobs_found[(region.lid, category.cid)] += 1
+        if self._on_job_parsed:
+            async with self._callback_lock:
+                await self._on_job_parsed(job)
+        else:
+            result.jobs.append(job)
 
-        while page <= max_pages:
-            # Build filter URL
-            url = self._build_filter_url(region.lid, category.cid, page)
+    def _budget_exhausted(self) -> bool:
+        """Check if the run is past CRAWL_BUDGET_SECONDS."""
+        return self._deadline is not None and asyncio.get_running_loop().time() >= self._deadline
 
-            try:
-                html = await self.client.get_text(url)
-                result.pages_parsed += 1
-
-                # Extract job URLs from list
-                job_urls = self._extract_job_urls(html)
-
-                # If no jobs found on this page, stop pagination
-                if not job_urls:
-                    break
-
-                # Parse each job
-                for job_url in job_urls:
-                    # Skip if already seen (within this run)
-                    if job_url in self._seen_urls:
-                        continue
-                    self._seen_urls.add(job_url)
-
-                    try:
-                        job = await self._parse_job_detail(job_url, region, category)
-                        if job:
-                            jobs_found += 1
-                            # If callback provided, call it immediately
-                            if self._on_job_parsed:
-                                await self._on_job_parsed(job)
-                            else:
-                                result.jobs.append(job)
-                    except Exception as e:
-                        result.errors.append(f"Error parsing job {job_url}: {str(e)}")
-
-                # Check for next page
-                if not self._has_next_page(html, page):
-                    break
-
-                page += 1
-
-            except Exception as e:
-                result.errors.append(f"Error fetching {url}: {str(e)}")
-                break
-
-        result.total_found = jobs_found
-        return result
+    def _log_region_completed(self, region: RegionConfig):
+        """Log per-category and total job counts for a region."""
+        jobs_in_region = 0
+        for category in self.categories:
+            jobs_found = self._jobs_found[(region.lid, category.cid)]
+            jobs_in_region += jobs_found
+            if jobs_found > 0:
+                logger.info(
+                    "category_completed",
+                    region=region.name_en,
+                    category=category.name_en,
+                    cid=category.cid,
+                    jobs_found=jobs_found,
+                )
+
+        logger.info(
+            "region_completed",
+            region=region.name_en,
+            lid=region.lid,
+            jobs_found=jobs_in_region,
+            categories_parsed=len(self.categories),
+        )
 
     def _build_filter_url(self, lid: int, cid: int, page: int = 1) -> str:
         """Build jobs.ge filter URL.
@@ -269,6 +421,17 @@ class JobsGeAdapter(BaseAdapter):
             url += f"&page={page}"
         return url
 
+    def _extract_job_entries(self, html: str) -> List[tuple]:
+        """Extract job detail URLs and listing signatures from list page.
+
+        Args:
+            html: HTML content of list page
+
+        Returns:
+            List of (absolute job URL, row signature) tuples (deduplicated)
+        """
+        return ListPage(html, self.base_url).entries
+
     def _extract_job_urls(self, html: str) -> List[str]:
         """Extract job detail URLs from list page.
 
@@ -278,33 +441,7 @@ class JobsGeAdapter(BaseAdapter):
         Returns:
             List of absolute job URLs (deduplicated)
         """
-        soup = BeautifulSoup(html, "lxml")
-        urls = []
-        seen_ids = set()
-
-        # Find all job links (href contains "id=" and is a job view)
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-
-            # Skip non-job links
-            if "id=" not in href:
-                continue
-
-            # Skip organization links, category links, etc.
-            if "org=" in href or "cid=" in href or "lid=" in href:
-                continue
-
-            # Extract job ID
-            match = re.search(r'[?&]id=(\d+)', href)
-            if match:
-                job_id = match.group(1)
-                if job_id not in seen_ids:
-                    seen_ids.add(job_id)
-                    # Build canonical URL
-                    full_url = f"{self.base_url}/ge/?view=jobs&id={job_id}"
-                    urls.append(full_url)
-
-        return urls
+        return [url for url, _ in self._extract_job_entries(html)]
 
     def _has_next_page(self, html: str, current_page: int) -> bool:
         """Check if there's a next page of results.
@@ -316,388 +453,290 @@ class JobsGeAdapter(BaseAdapter):
         Returns:
             True if next page exists
         """
-        soup = BeautifulSoup(html, "lxml")
-        next_page = current_page + 1
-
-        # Look for pagination links
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if f"page={next_page}" in href:
-                return True
-
-        return False
+        return ListPage(html, self.base_url).has_next_page(current_page)
 
     async def _parse_job_detail(
         self,
         url: str,
         region: RegionConfig,
-        category: CategoryConfig
+        category: CategoryConfig,
+        list_signature: Optional[str] = None,
     ) -> Optional[JobData]:
-        """Parse a single job detail page.
+        """Parse a single job detail page, with its English version if any.
+
+        With a detail cache, unchanged listings (same list_signature, cached
+        page fresher than DETAIL_CACHE_REFRESH_HOURS) are served from cache
+        without any request; otherwise pages are fetched conditionally.
 
         Args:
             url: Job detail URL (e.g., https://jobs.ge/ge/?view=jobs&id=693885)
             region: Region this job was found in (from filter)
             category: Category this job was found in (from filter)
+            list_signature: Listing row signature from the list page
 
         Returns:
             JobData or None if parsing failed
         """
         try:
-            # Fetch Georgian version
-            html_ge = await self.client.get_text(url)
-            soup_ge = BeautifulSoup(html_ge, "lxml")
-
-            # Extract title
-            title = self._extract_title(soup_ge)
-            if not title:
-                return None
-
-            # Extract body
-            body = self._extract_body(soup_ge)
-
-            # Extract company
-            company_name = self._extract_company(soup_ge)
-
-            # Extract dates
-            published_at = self._extract_published_date(soup_ge)
-            deadline_at = self._extract_deadline_date(soup_ge)
-
-            # Extract salary
-            salary_min, salary_max, salary_currency = self._extract_salary_info(soup_ge)
-
-            # Check VIP status
-            is_vip = self._check_vip_status(soup_ge)
-
             # Extract job ID for external_id
             external_id = self._extract_id_from_url(url)
 
-            # Fetch English version
-            title_en = None
-            body_en = None
-            try:
-                url_en = url.replace("/ge/", "/en/")
-                html_en = await self.client.get_text(url_en)
-                soup_en = BeautifulSoup(html_en, "lxml")
-                title_en = self._extract_title(soup_en)
-                body_en = self._extract_body(soup_en)
-            except Exception:
-                pass  # English version is optional
-
-            # Compute content hash for change detection
-            content_hash = compute_content_hash(title, body, company_name)
-
-            # Determine category: use keyword classification to verify/override filter category
-            # This handles cases where jobs appear in wrong category listings
-            filter_category_slug = category.our_slug
-            classified_category_slug = classify_category(title, body or "")
-
-            # Use classified category if it's confident (not "other") and differs from filter
-            # This prevents miscategorization from cross-listed or recommended jobs
-            final_category_slug = filter_category_slug
-            if classified_category_slug and classified_category_slug != "other":
-                if classified_category_slug != filter_category_slug:
-                    logger.debug(
-                        "category_override",
-                        title=title[:50] if title else "",
-                        filter_category=filter_category_slug,
-                        classified_category=classified_category_slug,
-                    )
-                    final_category_slug = classified_category_slug
-
-            return JobData(
-                # Required fields
-                external_id=external_id,
-                title_ge=title,
-                body_ge=body or "",
-                source_url=url,
-                parsed_from=self.source_name,
-
-                # Bilingual content
-                title_en=title_en,
-                body_en=body_en,
-
-                # Company
-                company_name=company_name,
-
-                # Location - from filter parameters (known!)
-                location=region.name_ge,
-                region_slug=region.our_slug,
-
-                # Category - verified/overridden by keyword classification
-                category_slug=final_category_slug,
+            loaded = await self._load_detail_fields(url, external_id, list_signature)
+            if not loaded:
+                return None
 
-                # jobs.ge original filter values (keep original for reference)
-                jobsge_cid=category.cid,
-                jobsge_lid=region.lid,
+            fields_ge, fields_en, fresh = loaded
+            if fresh:
+                if self._wants_english(external_id, fields_ge):
+                    fields_en = await self._fetch_english_fields(url, external_id, fields_ge)
+                self._put_signature(external_id, list_signature)
 
-                # Dates
-                published_at=published_at,
-                deadline_at=deadline_at,
+            return self._build_job_data(url, external_id, region, category, fields_ge, fields_en)
 
-                # Salary
-                has_salary=salary_min is not None,
-                salary_min=salary_min,
-                salary_max=salary_max,
-                salary_currency=salary_currency or "GEL",
+        except Exception as e:
+            logger.debug("job_parse_failed", url=url, error=str(e))
+            return None
 
-                # Flags
-                is_vip=is_vip,
+    async def _load_detail_fields(
+        self,
+        url: str,
+        external_id: Optional[str],
+        list_signature: Optional[str],
+    ) -> Optional[Tuple[dict, Optional[dict], bool]]:
+        """Get a job's Georgian fields, from cache if the listing is unchanged.
 
-                # Content hash
-                content_hash=content_hash,
-            )
+        Returns:
+            (fields_ge, fields_en, fresh): fields_en only comes from cache;
+            fresh is False for cached listings. None if the page has no
+            title or can't be fetched.
+        """
+        try:
+            cached = self._get_unchanged_listing(external_id, list_signature)
+            if cached:
+                self._cache_stats["listing_unchanged"] += 1
+                fields_ge, fields_en = cached
+                return fields_ge, fields_en, False
 
+            fields_ge = await self._fetch_detail_fields(url, external_id, "ge")
         except Exception as e:
             logger.debug("job_parse_failed", url=url, error=str(e))
             return None
 
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract job title from page."""
-        # Try common title selectors
-        for selector in ["h1", "h2", ".title", ".job-title", "td b", "td strong"]:
-            elem = soup.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                if text and len(text) > 3:
-                    # Skip navigation/breadcrumb text
-                    if "ყველა" not in text and "ვაკანსია" not in text.lower()[:15]:
-                        return text
-
-        # Fallback: page title
-        title_tag = soup.find("title")
-        if title_tag:
-            text = title_tag.get_text(strip=True)
-            # Remove site suffix
-            if "|" in text:
-                return text.split("|")[0].strip()
-            if "-" in text:
-                return text.split("-")[0].strip()
-            return text
+        if not fields_ge.get("title"):
+            return None
+        return fields_ge, None, True
 
-        return None
+    def _wants_english(self, external_id: Optional[str], fields_ge: dict) -> bool:
+        """Decide whether a job's English page is worth a request.
 
-    def _extract_body(self, soup: BeautifulSoup) -> str:
-        """Extract job description from page."""
-        # Try common description containers
-        for selector in [".description", ".job-description", ".content",
-                        "article", "td[colspan]", ".vacancy-text", "#job-description"]:
-            elem = soup.select_one(selector)
-            if elem:
-                body = clean_html(str(elem))
-                if len(body) > 50:
-                    return body
-
-        # Fallback: try to get main content area
-        main = soup.select_one("main, #content, .main")
-        if main:
-            # Remove navigation elements
-            for tag in main.select("script, style, nav, header, footer, .menu"):
-                tag.decompose()
-            body = clean_html(str(main))
-            if len(body) > 50:
-                return body
-
-        return ""
-
-    def _extract_company(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract company name from page."""
-        # Look for company-specific elements
-        for selector in [".company-name", ".employer", ".org-name"]:
-            elem = soup.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                if text and len(text) > 1:
-                    return text
-
-        # Look for organization links (jobs.ge uses view=client&client= pattern)
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            # Check for jobs.ge client links or org links
-            if "view=client&client=" in href or "org=" in href:
-                text = link.get_text(strip=True)
-                # Skip generic link text
-                if text and "ყველა" not in text and "ორგანიზაცია" not in text and "განცხადება" not in text:
-                    if len(text) > 1 and len(text) < 200:
-                        return text
-
-        # Fallback: extract from page title (format: "ჯობს.გე - JobTitle - CompanyName")
-        title_tag = soup.find("title")
-        if title_tag:
-            title_text = title_tag.get_text(strip=True)
-            # Pattern: "ჯობს.გე - JobTitle - CompanyName" or "Jobs.GE - JobTitle - CompanyName"
-            if " - " in title_text:
-                parts = title_text.split(" - ")
-                if len(parts) >= 3:
-                    # Last part is usually the company name
-                    company = parts[-1].strip()
-                    if company and len(company) > 1 and len(company) < 200:
-                        # Skip if it's just the site name
-                        if company.lower() not in ["jobs.ge", "ჯობს.გე"]:
-                            return company
+        Postings written in English have nothing to add; otherwise the
+        detail cache remembers whether this posting, or enough earlier
+        postings of its company, had a distinct English version.
+        """
+        if not get_config().english_enrichment:
+            return False
 
-        return None
+        if detect_language(f"{fields_ge['title']}\n{fields_ge.get('body') or ''}") == "en":
+            self._cache_stats["english_not_needed"] += 1
+            return False
 
-    def _extract_published_date(self, soup: BeautifulSoup) -> Optional[datetime]:
-        """Extract published date from page.
+        if not self.detail_cache or not external_id:
+            return True
 
-        jobs.ge typically shows published date in specific locations:
-        1. Meta tags or structured data
-        2. Near "გამოქვეყნდა" (published) text
-        3. In a dedicated date element near the title
-        4. In table cells with date-like formatting
-        """
-        from datetime import timezone
-
-        # 1. Try meta tags first (most reliable)
-        for meta in soup.find_all("meta"):
-            prop = meta.get("property", "") or meta.get("name", "")
-            if "date" in prop.lower() or "published" in prop.lower():
-                content = meta.get("content", "")
-                if content:
-                    date = extract_date(content)
-                    if date:
-                        return date.replace(tzinfo=timezone.utc)
-
-        # 2. Look for Georgian "გამოქვეყნდა" (published) keyword
-        publish_patterns = [
-            r'გამოქვეყნდა', r'დამატებულია', r'თარიღი',  # Georgian
-            r'published', r'posted', r'date added',  # English
-        ]
-
-        for pattern in publish_patterns:
-            for elem in soup.find_all(string=re.compile(pattern, re.I)):
-                # Get parent and siblings for context
-                parent = elem.parent
-                if parent:
-                    # Check parent's text
-                    context = parent.get_text()
-                    date = extract_date(context)
-                    if date:
-                        return date.replace(tzinfo=timezone.utc)
-
-                    # Check next sibling
-                    next_sib = parent.find_next_sibling()
-                    if next_sib:
-                        context = next_sib.get_text()
-                        date = extract_date(context)
-                        if date:
-                            return date.replace(tzinfo=timezone.utc)
-
-                    # Check grandparent (for nested structures)
-                    grandparent = parent.parent
-                    if grandparent:
-                        context = grandparent.get_text()
-                        date = extract_date(context)
-                        if date:
-                            return date.replace(tzinfo=timezone.utc)
-
-        # 3. Look for table cells with dates (common in jobs.ge layout)
-        for td in soup.find_all("td"):
-            text = td.get_text(strip=True)
-            # Only check cells that look like they contain just a date
-            if len(text) < 30 and re.search(r'\d{1,2}[./]\d{1,2}[./]\d{4}', text):
-                date = extract_date(text)
-                if date:
-                    return date.replace(tzinfo=timezone.utc)
-
-        # 4. Look for spans/divs with date-like classes
-        for elem in soup.find_all(["span", "div"], class_=re.compile(r'date|time', re.I)):
-            text = elem.get_text(strip=True)
-            if text:
-                date = extract_date(text)
-                if date:
-                    return date.replace(tzinfo=timezone.utc)
-
-        # 5. Last resort: scan first 500 chars of page for a date
-        # (avoids footer/sidebar dates)
-        header_area = soup.find("header") or soup.find("article") or soup.find("main")
-        if header_area:
-            text = header_area.get_text()[:500]
-            date = extract_date(text)
-            if date:
-                return date.replace(tzinfo=timezone.utc)
+        posting = self.detail_cache.get_english_hint(self.source_name, f"job:{external_id}")
+        if posting is not None:
+            wanted = posting[1] > 0
+        else:
+            company = fields_ge.get("company_name")
+            checked, differed = (
+                company and self.detail_cache.get_english_hint(self.source_name, f"company:{company}")
+            ) or (0, 0)
+            wanted = differed > 0 or checked < ENGLISH_COMPANY_SAMPLES
 
-        return None
+        if not wanted:
+            self._cache_stats["english_not_needed"] += 1
+        return wanted
 
-    def _extract_deadline_date(self, soup: BeautifulSoup) -> Optional[datetime]:
-        """Extract deadline date from page.
+    async def _fetch_english_fields(
+        self,
+        url: str,
+        external_id: Optional[str],
+        fields_ge: dict,
+    ) -> Optional[dict]:
+        """Fetch a job's English page; None unless it differs from the Georgian one."""
+        try:
+            fields_en = await self._fetch_detail_fields(url.replace("/ge/", "/en/"), external_id, "en")
+        except Exception:
+            return None  # English version is optional
+
+        fields_en = _distinct_english(fields_ge, fields_en)
+        if self.detail_cache and external_id:
+            differs = fields_en is not None
+            self.detail_cache.record_english(self.source_name, f"job:{external_id}", differs)
+            if fields_ge.get("company_name"):
+                self.detail_cache.record_english(
+                    self.source_name, f"company:{fields_ge['company_name']}", differs
+                )
+        return fields_en
+
+    def _put_signature(self, external_id: Optional[str], list_signature: Optional[str]):
+        """Remember a listing's signature once its job is fully fetched."""
+        if self.detail_cache and list_signature and external_id:
+            self.detail_cache.put_signature(self.source_name, external_id, list_signature)
+
+    def _is_known_listing(self, job_url: str, list_signature: Optional[str]) -> bool:
+        """Check if a listing was crawled before with the same row signature."""
+        if not self.detail_cache or not list_signature:
+            return False
+        external_id = self._extract_id_from_url(job_url)
+        if not external_id:
+            return False
+        return self.detail_cache.get_signature(self.source_name, external_id) == list_signature
+
+    def _get_unchanged_listing(
+        self,
+        external_id: Optional[str],
+        list_signature: Optional[str],
+    ) -> Optional[tuple]:
+        """Get cached (ge, en) fields if the listing is unchanged since last run."""
+        if not self.detail_cache or not list_signature or not external_id:
+            return None
 
-        jobs.ge uses various terms for deadline:
-        - ბოლო ვადა (last date)
-        - დედლაინი (deadline)
-        - განაცხადის მიღების ბოლო ვადა (application deadline)
-        """
-        from datetime import timezone
-
-        # Deadline-specific keywords in Georgian and English
-        deadline_patterns = [
-            r'ბოლო\s*ვადა', r'დედლაინ', r'განაცხადის.*ვადა',
-            r'მიღება.*ვადა', r'დასრულება',  # Georgian
-            r'deadline', r'apply\s*by', r'closing\s*date',
-            r'last\s*date', r'expires?',  # English
-        ]
-
-        for pattern in deadline_patterns:
-            for elem in soup.find_all(string=re.compile(pattern, re.I)):
-                parent = elem.parent
-                if not parent:
-                    continue
+        if self.detail_cache.get_signature(self.source_name, external_id) != list_signature:
+            return None
 
-                # Get broader context - parent, grandparent, siblings
-                contexts_to_check = []
-
-                # Parent text
-                contexts_to_check.append(parent.get_text())
-
-                # Next sibling (deadline value often in adjacent element)
-                next_sib = parent.find_next_sibling()
-                if next_sib:
-                    contexts_to_check.append(next_sib.get_text())
-
-                # Grandparent (for nested structures like table rows)
-                grandparent = parent.parent
-                if grandparent:
-                    contexts_to_check.append(grandparent.get_text())
-
-                # Parent's parent's next sibling (for complex layouts)
-                if grandparent:
-                    gp_next = grandparent.find_next_sibling()
-                    if gp_next:
-                        contexts_to_check.append(gp_next.get_text())
-
-                # Try to extract date from each context
-                for context in contexts_to_check:
-                    if not context:
-                        continue
-                    date = extract_date(context)
-                    if date:
-                        return date.replace(tzinfo=timezone.utc)
-
-        # Look for table rows with deadline label
-        for tr in soup.find_all("tr"):
-            row_text = tr.get_text().lower()
-            if any(kw in row_text for kw in ['ვადა', 'deadline', 'დედლაინ']):
-                # Get all text from this row
-                date = extract_date(tr.get_text())
-                if date:
-                    return date.replace(tzinfo=timezone.utc)
+        page_ge = self.detail_cache.get_page(self.source_name, external_id, "ge")
+        refresh_seconds = get_config().detail_cache_refresh_hours * 3600
+        if not page_ge or page_ge.age_seconds() > refresh_seconds:
+            return None
 
-        return None
+        page_en = self.detail_cache.get_page(self.source_name, external_id, "en")
+        return page_ge.payload, _distinct_english(page_ge.payload, page_en.payload) if page_en else None
 
-    def _extract_salary_info(self, soup: BeautifulSoup):
-        """Extract salary information from page.
+    async def _fetch_detail_fields(self, url: str, external_id: Optional[str], lang: str) -> dict:
+        """Fetch a detail page (conditionally, if cached) and extract its fields.
+
+        Args:
+            url: Detail page URL
+            external_id: Job ID (cache key)
+            lang: "ge" or "en"
 
         Returns:
-            Tuple of (min_salary, max_salary, currency)
+            Extracted fields (see _extract_detail_fields)
         """
-        page_text = soup.get_text()
-        return extract_salary(page_text)
+        cache = self.detail_cache if external_id else None
+        cached = cache.get_page(self.source_name, external_id, lang) if cache else None
 
-    def _check_vip_status(self, soup: BeautifulSoup) -> bool:
-        """Check if job is VIP/premium listing."""
-        html_lower = str(soup).lower()
-        return "vip" in html_lower or "premium" in html_lower or "პრემიუმ" in html_lower
+        response = await self.client.get_conditional(
+            url,
+            etag=cached.etag if cached else None,
+            last_modified=cached.last_modified if cached else None,
+        )
+
+        if cached and response.not_modified:
+            self._cache_stats["not_modified"] += 1
+            cache.touch_page(self.source_name, external_id, lang, response.etag, response.last_modified)
+            return cached.payload
+
+        digest = body_digest(response.text)
+        if cached and cached.digest == digest:
+            self._cache_stats["body_unchanged"] += 1
+            cache.touch_page(self.source_name, external_id, lang, response.etag, response.last_modified)
+            return cached.payload
+
+        self._cache_stats["fetched"] += 1
+        fields = await get_parse_executor().run(parse_detail_page, response.content, lang == "ge")
+        if cache:
+            cache.put_page(
+                self.source_name, external_id, lang, digest, fields,
+                etag=response.etag, last_modified=response.last_modified,
+            )
+        return fields
+
+    def _build_job_data(
+        self,
+        url: str,
+        external_id: Optional[str],
+        region: RegionConfig,
+        category: CategoryConfig,
+        fields_ge: dict,
+        fields_en: Optional[dict],
+    ) -> JobData:
+        """Build JobData from extracted Georgian/English fields."""
+        title = fields_ge["title"]
+        body = fields_ge.get("body")
+        company_name = fields_ge.get("company_name")
+        salary_min = fields_ge.get("salary_min")
+
+        title_en = fields_en.get("title") if fields_en else None
+        body_en = fields_en.get("body") if fields_en else None
+
+        # Compute content hash for change detection
+        content_hash = compute_content_hash(title, body, company_name)
+
+        # Determine category: use keyword classification to verify/override filter category
+        # This handles cases where jobs appear in wrong category listings
+        filter_category_slug = category.our_slug
+        classified_category_slug = classify_category(title, body or "")
+
+        # Use classified category if it's confident (not "other") and differs from filter
+        # This prevents miscategorization from cross-listed or recommended jobs
+        final_category_slug = filter_category_slug
+        if classified_category_slug and classified_category_slug != "other":
+            if classified_category_slug != filter_category_slug:
+                logger.debug(
+                    "category_override",
+                    title=title[:50] if title else "",
+                    filter_category=filter_category_slug,
+                    classified_category=classified_category_slug,
+                )
+                final_category_slug = classified_category_slug
+
+        published_at = fields_ge.get("published_at")
+        deadline_at = fields_ge.get("deadline_at")
+
+        return JobData(
+            # Required fields
+            external_id=external_id,
+            title_ge=title,
+            body_ge=body or "",
+            source_url=url,
+            parsed_from=self.source_name,
+
+            # Bilingual content
+            title_en=title_en,
+            body_en=body_en,
+
+            # Company
+            company_name=company_name,
+
+            # Location - from filter parameters (known!)
+            location=region.name_ge,
+            region_slug=region.our_slug,
+
+            # Category - verified/overridden by keyword classification
+            category_slug=final_category_slug,
+
+            # jobs.ge original filter values (keep original for reference)
+            jobsge_cid=category.cid,
+            jobsge_lid=region.lid,
+
+            # Dates
+            published_at=datetime.fromisoformat(published_at) if published_at else None,
+            deadline_at=datetime.fromisoformat(deadline_at) if deadline_at else None,
+
+            # Salary
+            has_salary=salary_min is not None,
+            salary_min=salary_min,
+            salary_max=fields_ge.get("salary_max"),
+            salary_currency=fields_ge.get("salary_currency") or "GEL",
+
+            # Flags
+            is_vip=fields_ge.get("is_vip", False),
+
+            # Content hash
+            content_hash=content_hash,
+        )
 
     def _extract_id_from_url(self, url: str) -> Optional[str]:
         """Extract job ID from URL.
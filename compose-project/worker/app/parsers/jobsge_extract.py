@@ -0,0 +1,641 @@
+"""Single-parse page extraction for jobs.ge.
+
+Each list or detail page is parsed once with lxml, and every field is read
+from that one tree with precompiled XPath expressions. Previously each page
+was parsed by BeautifulSoup several times (links, pagination, title, body),
+and the date extractors rescanned the whole tree once per keyword pattern.
+
+Text extraction deliberately mirrors the BeautifulSoup semantics the
+extractors were written against (Tag.get_text with its collapsing of
+whitespace-only strings, find_all(string=...), clean_html, soupsieve class
+matching), so extracted values - and therefore content hashes of existing
+jobs - are unchanged. tests/unit/test_jobsge_extract.py checks this against
+the BeautifulSoup extractors. One known difference: markup after </html>,
+which BeautifulSoup puts in a second <html> element, is dropped by lxml
+(whitespace and comments there are handled).
+"""
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from app.core.parse_executor import decode_html
+from app.core.utils import extract_date, extract_salary, normalize_text
+
+
+# BeautifulSoup stores strings inside these tags as special string types,
+# which Tag.get_text() on any other tag skips.
+_STRING_CONTAINERS = frozenset({"script", "style", "template", "rt", "rp"})
+
+# BeautifulSoup replaces strings of ASCII whitespace with a single newline
+# (or space, if they have no newline), except inside these tags
+_PRESERVE_WHITESPACE = frozenset({"pre", "textarea"})
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+# What BeautifulSoup keeps after </html> as document-level strings (lxml
+# drops it): ASCII whitespace between comments
+_DOCUMENT_TAIL_RE = re.compile(r"</html[\x20\t\n\f\r]*>((?:[\x20\t\n\f\r]|<!--.*?-->)*)\Z", re.I | re.S)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+
+# Tags clean_html() removes before extracting text
+_CLEAN_HTML_DROP = frozenset({"script", "style", "head", "meta", "link"})
+
+# Processing-instruction target marking elements removed from the tree
+_REMOVED = "jobsge-removed"
+
+_HTML_PARSER = etree.HTMLParser()
+
+_XP_LINKS = etree.XPath("//a[@href]")
+_XP_TITLE_TAG = etree.XPath("//title")
+_XP_META = etree.XPath("//meta")
+_XP_TD = etree.XPath("//td")
+_XP_TR = etree.XPath("//tr")
+_XP_CLASSED_SPAN_DIV = etree.XPath("//*[self::span or self::div][@class]")
+_XP_CLASSED = etree.XPath("//*[@class]")
+_XP_MAIN_CANDIDATES = etree.XPath("//*[self::main or @id = 'content' or @class]")
+_XP_MAIN_NOISE = etree.XPath(".//*[self::script or self::style or self::nav or self::header or self::footer or @class]")
+
+# Selector lists, in the order the extractors try them
+_TITLE_SELECTORS = [
+    etree.XPath("//h1"),
+    etree.XPath("//h2"),
+    "title",
+    "job-title",
+    etree.XPath("//td//b"),
+    etree.XPath("//td//strong"),
+]
+_BODY_SELECTORS = [
+    "description",
+    "job-description",
+    "content",
+    etree.XPath("//article"),
+    etree.XPath("//td[@colspan]"),
+    "vacancy-text",
+    etree.XPath("//*[@id = 'job-description']"),
+]
+_COMPANY_CLASSES = ["company-name", "employer", "org-name"]
+_HEADER_AREA = [etree.XPath("//header"), etree.XPath("//article"), etree.XPath("//main")]
+
+_JOB_ID_RE = re.compile(r"[?&]id=(\d+)")
+_TD_DATE_RE = re.compile(r"\d{1,2}[./]\d{1,2}[./]\d{4}")
+_DATE_CLASS_RE = re.compile(r"date|time", re.I)
+
+_PUBLISH_PATTERNS = [
+    re.compile(p, re.I) for p in (
+        r'გამოქვეყნდა', r'დამატებულია', r'თარიღი',  # Georgian
+        r'published', r'posted', r'date added',  # English
+    )
+]
+_DEADLINE_PATTERNS = [
+    re.compile(p, re.I) for p in (
+        r'ბოლო\s*ვადა', r'დედლაინ', r'განაცხადის.*ვადა',
+        r'მიღება.*ვადა', r'დასრულება',  # Georgian
+        r'deadline', r'apply\s*by', r'closing\s*date',
+        r'last\s*date', r'expires?',  # English
+    )
+]
+_DEADLINE_ROW_KEYWORDS = ('ვადა', 'deadline', 'დედლაინ')
+
+
+# =============================================================================
+# TREE HELPERS (BeautifulSoup-compatible text semantics)
+# =============================================================================
+
+
+def parse_document(html: str) -> etree._Element:
+    """Parse an HTML document and return its root element."""
+    try:
+        root = etree.fromstring(html, _HTML_PARSER)
+    except ValueError:
+        # Unicode strings with an XML encoding declaration are rejected
+        root = etree.fromstring(html.encode("utf-8"), _HTML_PARSER)
+    if root is None:
+        root = etree.Element("html")
+    return root
+
+
+def _is_element(node) -> bool:
+    return isinstance(node.tag, str)
+
+
+def _is_removed(node) -> bool:
+    return node.tag is etree.PI and node.target == _REMOVED
+
+
+def _soup_string(text: str, preserve: bool) -> str:
+    """A text node as BeautifulSoup stores it (whitespace-only strings collapsed)."""
+    if preserve or text.strip(_ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _collect_strings(
+    el, wanted, current, skip, out: List[str], merge_removed: bool = False, preserve: bool = False
+):
+    if el.tag in _STRING_CONTAINERS:
+        current = el.tag
+    inner_preserve = preserve or el.tag in _PRESERVE_WHITESPACE
+    # Whether out[-1] is the text node directly preceding the next child
+    adjacent = False
+    if el.text and current == wanted:
+        out.append(_soup_string(el.text, inner_preserve))
+        adjacent = True
+    for child in el:
+        removed = merge_removed and _is_removed(child)
+        if _is_element(child) and child.tag not in skip:
+            _collect_strings(child, wanted, current, skip, out, merge_removed, inner_preserve)
+        if child.tail and current == wanted:
+            tail = _soup_string(child.tail, inner_preserve)
+            if removed and adjacent:
+                # Text on both sides of a removed element reads as one string
+                out[-1] += tail
+            else:
+                out.append(tail)
+            adjacent = True
+        elif not removed:
+            adjacent = False
+
+
+def get_strings(el) -> List[str]:
+    """Text strings of an element, as BeautifulSoup's Tag.strings yields them."""
+    inherited = None
+    for ancestor in el.iterancestors():
+        if ancestor.tag in _STRING_CONTAINERS:
+            inherited = ancestor.tag
+            break
+    wanted = el.tag if el.tag in _STRING_CONTAINERS else None
+    out: List[str] = []
+    preserve = any(ancestor.tag in _PRESERVE_WHITESPACE for ancestor in el.iterancestors())
+    _collect_strings(el, wanted, inherited, frozenset(), out, preserve=preserve)
+    return out
+
+
+def document_tail_text(html: str) -> str:
+    """Text of the whitespace after </html>, as BeautifulSoup's get_text() ends."""
+    match = _DOCUMENT_TAIL_RE.search(html)
+    if match is None:
+        return ""
+    return "".join(_soup_string(piece, False) for piece in _COMMENT_RE.split(match.group(1)) if piece)
+
+
+def get_text(el, separator: str = "", strip: bool = False) -> str:
+    """Equivalent of BeautifulSoup Tag.get_text(separator, strip)."""
+    strings = get_strings(el)
+    if strip:
+        return separator.join(s.strip() for s in strings if s.strip())
+    return separator.join(strings)
+
+
+def clean_element_text(el) -> str:
+    """Equivalent of utils.clean_html(str(tag)) for a parsed element.
+
+    clean_html re-parses the serialized element, so text on both sides of an
+    element removed earlier (see DetailPage._decompose) becomes one string.
+    """
+    out: List[str] = []
+    if el.tag not in _CLEAN_HTML_DROP:
+        _collect_strings(el, None, None, _CLEAN_HTML_DROP, out, merge_removed=True)
+    lines = [line.strip() for line in "\n".join(out).splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _next_element_sibling(el):
+    for sibling in el.itersiblings():
+        if _is_element(sibling):
+            return sibling
+    return None
+
+
+def _has_class(el, name: str) -> bool:
+    return name in el.get("class", "").split()
+
+
+# =============================================================================
+# LIST PAGES
+# =============================================================================
+
+
+def listing_signature(row_text: str) -> str:
+    """Compute signature of a listing row's visible text."""
+    return hashlib.sha1(normalize_text(row_text).encode("utf-8")).hexdigest()
+
+
+class ListPage:
+    """A parsed jobs.ge list page."""
+
+    def __init__(self, html: str, base_url: str):
+        """Parse list page.
+
+        Args:
+            html: HTML content of list page
+            base_url: Site base URL for canonical job URLs
+        """
+        self.root = parse_document(html)
+        self.base_url = base_url
+        self._links = _XP_LINKS(self.root)
+
+    @property
+    def entries(self) -> List[Tuple[str, str]]:
+        """Job detail URLs and listing row signatures (deduplicated).
+
+        The signature is a digest of the listing row text (title, company,
+        dates), used to detect whether a job changed since the last run.
+        """
+        entries = []
+        seen_ids = set()
+
+        for link in self._links:
+            href = link.get("href")
+
+            # Skip non-job links
+            if "id=" not in href:
+                continue
+
+            # Skip organization links, category links, etc.
+            if "org=" in href or "cid=" in href or "lid=" in href:
+                continue
+
+            match = _JOB_ID_RE.search(href)
+            if match:
+                job_id = match.group(1)
+                if job_id not in seen_ids:
+                    seen_ids.add(job_id)
+                    # Build canonical URL
+                    full_url = f"{self.base_url}/ge/?view=jobs&id={job_id}"
+                    row = next(link.iterancestors("tr"), None)
+                    if row is None:
+                        row = link.getparent()
+                    entries.append((full_url, listing_signature(get_text(row, " "))))
+
+        return entries
+
+    def has_next_page(self, current_page: int) -> bool:
+        """Check if there's a pagination link to the next page."""
+        marker = f"page={current_page + 1}"
+        return any(marker in link.get("href") for link in self._links)
+
+
+# =============================================================================
+# DETAIL PAGES
+# =============================================================================
+
+
+class DetailPage:
+    """A parsed jobs.ge job detail page."""
+
+    def __init__(self, html: str):
+        """Parse detail page.
+
+        Args:
+            html: HTML content of detail page
+        """
+        self.root = parse_document(html)
+        self._tail_text = document_tail_text(html)
+        self._strings: Optional[List[Tuple[str, etree._Element]]] = None
+        self._classes: Optional[Dict[str, etree._Element]] = None
+
+    def _first_with_class(self, name: str):
+        """First element (document order) with a class token, like select_one('.name')."""
+        if self._classes is None:
+            self._classes = {}
+            for el in _XP_CLASSED(self.root):
+                for token in el.get("class").split():
+                    self._classes.setdefault(token, el)
+        return self._classes.get(name)
+
+    def _select_one(self, selector):
+        if isinstance(selector, str):
+            return self._first_with_class(selector)
+        matches = selector(self.root)
+        return matches[0] if matches else None
+
+    def _find_strings(self, pattern: re.Pattern) -> List[Tuple[str, etree._Element]]:
+        """Strings matching pattern with their parent, like find_all(string=pattern).
+
+        Includes comment and script text, as BeautifulSoup does.
+        """
+        if self._strings is None:
+            self._strings = []
+            # Comments outside the root element belong to the document,
+            # which the root element stands in for
+            for sibling in reversed(list(self.root.itersiblings(preceding=True))):
+                if sibling.tag is etree.Comment and sibling.text:
+                    self._strings.append((sibling.text, self.root))
+            self._index_strings(self.root)
+            for sibling in self.root.itersiblings():
+                if sibling.tag is etree.Comment and sibling.text:
+                    self._strings.append((sibling.text, self.root))
+        return [(text, parent) for text, parent in self._strings if pattern.search(text)]
+
+    def _index_strings(self, el):
+        if el.text:
+            self._strings.append((el.text, el))
+        for child in el:
+            if _is_element(child):
+                self._index_strings(child)
+            elif child.tag is etree.Comment and child.text:
+                self._strings.append((child.text, el))
+            if child.tail:
+                self._strings.append((child.tail, el))
+
+    def _grandparent(self, parent):
+        # The document itself stands above the root element; its text is the root's
+        grandparent = parent.getparent()
+        return parent if grandparent is None else grandparent
+
+    def _decompose(self, el):
+        """Remove an element like BeautifulSoup's decompose().
+
+        The element is replaced by a placeholder that keeps its tail as a
+        separate text node, as BeautifulSoup does (lxml would otherwise merge
+        it into the preceding text).
+        """
+        parent = el.getparent()
+        if parent is None:
+            return
+        placeholder = etree.ProcessingInstruction(_REMOVED)
+        placeholder.tail = el.tail
+        parent.replace(el, placeholder)
+        self._strings = None
+        self._classes = None
+
+    def title(self) -> Optional[str]:
+        """Extract job title from page."""
+        # Try common title selectors
+        for selector in _TITLE_SELECTORS:
+            elem = self._select_one(selector)
+            if elem is not None:
+                text = get_text(elem, strip=True)
+                if text and len(text) > 3:
+                    # Skip navigation/breadcrumb text
+                    if "ყველა" not in text and "ვაკანსია" not in text.lower()[:15]:
+                        return text
+
+        # Fallback: page title
+        title_tags = _XP_TITLE_TAG(self.root)
+        if title_tags:
+            text = get_text(title_tags[0], strip=True)
+            # Remove site suffix
+            if "|" in text:
+                return text.split("|")[0].strip()
+            if "-" in text:
+                return text.split("-")[0].strip()
+            return text
+
+        return None
+
+    def body(self) -> str:
+        """Extract job description from page.
+
+        Note: the main-content fallback removes navigation elements from the
+        tree, which later extractors then no longer see.
+        """
+        # Try common description containers
+        for selector in _BODY_SELECTORS:
+            elem = self._select_one(selector)
+            if elem is not None:
+                body = clean_element_text(elem)
+                if len(body) > 50:
+                    return body
+
+        # Fallback: try to get main content area
+        main = next(
+            (
+                el for el in _XP_MAIN_CANDIDATES(self.root)
+                if el.tag == "main" or el.get("id") == "content" or _has_class(el, "main")
+            ),
+            None,
+        )
+        if main is not None:
+            # Remove navigation elements
+            for tag in _XP_MAIN_NOISE(main):
+                if tag.tag in ("script", "style", "nav", "header", "footer") or _has_class(tag, "menu"):
+                    self._decompose(tag)
+            body = clean_element_text(main)
+            if len(body) > 50:
+                return body
+
+        return ""
+
+    def company(self) -> Optional[str]:
+        """Extract company name from page."""
+        # Look for company-specific elements
+        for name in _COMPANY_CLASSES:
+            elem = self._first_with_class(name)
+            if elem is not None:
+                text = get_text(elem, strip=True)
+                if text and len(text) > 1:
+                    return text
+
+        # Look for organization links (jobs.ge uses view=client&client= pattern)
+        for link in _XP_LINKS(self.root):
+            href = link.get("href")
+            # Check for jobs.ge client links or org links
+            if "view=client&client=" in href or "org=" in href:
+                text = get_text(link, strip=True)
+                # Skip generic link text
+                if text and "ყველა" not in text and "ორგანიზაცია" not in text and "განცხადება" not in text:
+                    if len(text) > 1 and len(text) < 200:
+                        return text
+
+        # Fallback: extract from page title (format: "ჯობს.გე - JobTitle - CompanyName")
+        title_tags = _XP_TITLE_TAG(self.root)
+        if title_tags:
+            title_text = get_text(title_tags[0], strip=True)
+            if " - " in title_text:
+                parts = title_text.split(" - ")
+                if len(parts) >= 3:
+                    # Last part is usually the company name
+                    company = parts[-1].strip()
+                    if company and len(company) > 1 and len(company) < 200:
+                        # Skip if it's just the site name
+                        if company.lower() not in ["jobs.ge", "ჯობს.გე"]:
+                            return company
+
+        return None
+
+    def published_at(self) -> Optional[datetime]:
+        """Extract published date from page.
+
+        Checks, in order: meta tags, text near "published" keywords, short
+        date-only table cells, date/time-classed elements, header area.
+        """
+        # 1. Meta tags (most reliable)
+        for meta in _XP_META(self.root):
+            prop = meta.get("property", "") or meta.get("name", "")
+            if "date" in prop.lower() or "published" in prop.lower():
+                content = meta.get("content", "")
+                if content:
+                    date = extract_date(content)
+                    if date:
+                        return date.replace(tzinfo=timezone.utc)
+
+        # 2. Text near "published" keywords: parent, next sibling, grandparent
+        for pattern in _PUBLISH_PATTERNS:
+            for _, parent in self._find_strings(pattern):
+                date = extract_date(get_text(parent))
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+                next_sib = _next_element_sibling(parent)
+                if next_sib is not None:
+                    date = extract_date(get_text(next_sib))
+                    if date:
+                        return date.replace(tzinfo=timezone.utc)
+
+                date = extract_date(get_text(self._grandparent(parent)))
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+        # 3. Table cells containing just a date
+        for td in _XP_TD(self.root):
+            text = get_text(td, strip=True)
+            if len(text) < 30 and _TD_DATE_RE.search(text):
+                date = extract_date(text)
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+        # 4. Spans/divs with date-like classes
+        for elem in _XP_CLASSED_SPAN_DIV(self.root):
+            if not _DATE_CLASS_RE.search(elem.get("class")):
+                continue
+            text = get_text(elem, strip=True)
+            if text:
+                date = extract_date(text)
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+        # 5. Last resort: first 500 chars of header area (avoids footer/sidebar dates)
+        for xpath in _HEADER_AREA:
+            matches = xpath(self.root)
+            if matches:
+                date = extract_date(get_text(matches[0])[:500])
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+                break
+
+        return None
+
+    def deadline_at(self) -> Optional[datetime]:
+        """Extract deadline date from page.
+
+        Looks for deadline keywords (ბოლო ვადა, დედლაინი, deadline, ...) and
+        checks the surrounding elements, then table rows mentioning a deadline.
+        """
+        for pattern in _DEADLINE_PATTERNS:
+            for _, parent in self._find_strings(pattern):
+                # Parent, next sibling, grandparent, grandparent's next sibling
+                contexts_to_check = [parent]
+                next_sib = _next_element_sibling(parent)
+                if next_sib is not None:
+                    contexts_to_check.append(next_sib)
+                grandparent = self._grandparent(parent)
+                contexts_to_check.append(grandparent)
+                if grandparent is not parent:
+                    gp_next = _next_element_sibling(grandparent)
+                    if gp_next is not None:
+                        contexts_to_check.append(gp_next)
+
+                for elem in contexts_to_check:
+                    context = get_text(elem)
+                    if not context:
+                        continue
+                    date = extract_date(context)
+                    if date:
+                        return date.replace(tzinfo=timezone.utc)
+
+        # Table rows with a deadline label
+        for tr in _XP_TR(self.root):
+            row_text = get_text(tr)
+            if any(kw in row_text.lower() for kw in _DEADLINE_ROW_KEYWORDS):
+                date = extract_date(row_text)
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+        return None
+
+    def text(self) -> str:
+        """Text of the whole document, like BeautifulSoup(html).get_text()."""
+        return get_text(self.root) + self._tail_text
+
+    def salary(self):
+        """Extract salary information from page text.
+
+        Returns:
+            Tuple of (min_salary, max_salary, currency)
+        """
+        return extract_salary(self.text())
+
+    def is_vip(self) -> bool:
+        """Check if job is VIP/premium listing."""
+        html_lower = etree.tostring(self.root.getroottree(), encoding="unicode", method="html").lower()
+        return "vip" in html_lower or "premium" in html_lower or "პრემიუმ" in html_lower
+
+
+def extract_detail_fields(html: str, full: bool = True) -> dict:
+    """Extract job fields from a detail page.
+
+    Values are JSON-serializable (dates as ISO strings) so they can be stored
+    in the detail cache.
+
+    Args:
+        html: HTML content of detail page
+        full: Extract all fields (Georgian page) or only title/body
+
+    Returns:
+        Dict of extracted fields
+    """
+    page = DetailPage(html)
+
+    # Order matters: body() may strip navigation from the tree
+    title = page.title()
+    if full and not title:
+        return {"title": None}
+
+    body = page.body()
+    if not full:
+        return {"title": title, "body": body}
+
+    company_name = page.company()
+    published_at = page.published_at()
+    deadline_at = page.deadline_at()
+    salary_min, salary_max, salary_currency = page.salary()
+
+    return {
+        "title": title,
+        "body": body,
+        "company_name": company_name,
+        "published_at": published_at.isoformat() if published_at else None,
+        "deadline_at": deadline_at.isoformat() if deadline_at else None,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": salary_currency,
+        "is_vip": page.is_vip(),
+    }
+
+
+# =============================================================================
+# PARSE EXECUTOR ENTRY POINTS (module-level, picklable)
+# =============================================================================
+
+
+def parse_list_page(html: Union[str, bytes], base_url: str, page: int) -> Tuple[List[Tuple[str, str]], bool]:
+    """Extract a list page's entries and whether it has a next page.
+
+    Args:
+        html: Page body (raw bytes are decoded as UTF-8)
+        base_url: Site base URL for canonical job URLs
+        page: Current page number
+
+    Returns:
+        (ListPage.entries, ListPage.has_next_page(page))
+    """
+    list_page = ListPage(decode_html(html), base_url)
+    return list_page.entries, list_page.has_next_page(page)
+
+
+def parse_detail_page(html: Union[str, bytes], full: bool = True) -> dict:
+    """extract_detail_fields() for raw page bytes."""
+    return extract_detail_fields(decode_html(html), full=full)
@@ -0,0 +1,240 @@
+"""Record-and-replay jobs.ge stand-in for crawl benchmarks.
+
+A ReplaySite serves recorded (or synthetic) list and detail pages through an
+httpx.MockTransport with a configurable per-request latency, so the real
+crawler (HTTPClient, rate limiter, scheduler, parse executor) runs end to end
+without touching jobs.ge.
+
+Record a small slice of the live site once:
+
+    python -m tests.benchmarks.replay record /tmp/jobsge-recording --region adjara --cid 6
+
+and replay it with BENCH_RECORDINGS=/tmp/jobsge-recording. Without
+recordings the benchmarks use a synthetic site built from the conftest pages.
+"""
+import argparse
+import asyncio
+import json
+import resource
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+
+INDEX_FILE = "index.json"
+
+
+def _page_key(url: httpx.URL) -> str:
+    """Path and query of a request (the site is a single host)."""
+    return url.raw_path.decode("ascii")
+
+
+class ReplaySite:
+    """Recorded pages of one site, served from memory."""
+
+    def __init__(self, pages: Dict[str, bytes], latency: float = 0.0):
+        """Initialize the site.
+
+        Args:
+            pages: Response bodies keyed by path and query ("/ge/?cid=6&lid=14")
+            latency: Seconds each response is delayed, like a network round trip
+        """
+        self.pages = pages
+        self.latency = latency
+        self.requests = 0
+        self.misses = 0
+
+    def transport(self) -> httpx.MockTransport:
+        """A transport answering from the recorded pages (404 if unrecorded)."""
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.requests += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            body = self.pages.get(_page_key(request.url))
+            if body is None:
+                self.misses += 1
+                return httpx.Response(404, request=request)
+            return httpx.Response(
+                200, content=body, headers={"Content-Type": "text/html; charset=utf-8"}, request=request
+            )
+
+        return httpx.MockTransport(handler)
+
+    @classmethod
+    def load(cls, directory: Path, latency: float = 0.0) -> "ReplaySite":
+        """Load pages saved by record()."""
+        index = json.loads((directory / INDEX_FILE).read_text())
+        pages = {key: (directory / name).read_bytes() for key, name in index.items()}
+        return cls(pages, latency)
+
+    def save(self, directory: Path):
+        """Write the pages and their index to a directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        index = {}
+        for number, (key, body) in enumerate(sorted(self.pages.items())):
+            name = f"{number:05d}.html"
+            (directory / name).write_bytes(body)
+            index[key] = name
+        (directory / INDEX_FILE).write_text(json.dumps(index, indent=1, ensure_ascii=False))
+
+    @classmethod
+    def synthetic(
+        cls,
+        detail_html: str,
+        lids: list,
+        cids: list,
+        pages_per_category: int = 2,
+        jobs_per_page: int = 20,
+        latency: float = 0.0,
+    ) -> "ReplaySite":
+        """Build a jobs.ge-shaped site: paginated filter pages and job details.
+
+        Every listing is unique, so each one costs two detail fetches (ge, en).
+        """
+        pages = {}
+        job_id = 100000
+        for lid in lids:
+            for cid in cids:
+                for page in range(1, pages_per_category + 1):
+                    rows = []
+                    for _ in range(jobs_per_page):
+                        job_id += 1
+                        rows.append(
+                            f'<tr><td><a href="/ge/?view=jobs&id={job_id}">Job {job_id}</a></td>'
+                            f"<td>TechCorp</td><td>15 იანვარი</td></tr>"
+                        )
+                        detail = detail_html.replace("Developer", f"Developer {job_id}").encode()
+                        pages[f"/ge/?view=jobs&id={job_id}"] = detail
+                        pages[f"/en/?view=jobs&id={job_id}"] = detail
+                    next_link = (
+                        f'<a href="/ge/?cid={cid}&lid={lid}&page={page + 1}">next</a>'
+                        if page < pages_per_category else ""
+                    )
+                    query = f"/ge/?cid={cid}&lid={lid}" + (f"&page={page}" if page > 1 else "")
+                    pages[query] = (
+                        f"<html><body><table>{''.join(rows)}</table>{next_link}</body></html>"
+                    ).encode()
+        return cls(pages, latency)
+
+
+def install_transport(monkeypatch, transport: httpx.AsyncBaseTransport):
+    """Route every httpx.AsyncClient created from now on through transport."""
+    real_client = httpx.AsyncClient
+
+    class ReplayClient(real_client):
+        def __init__(self, **kwargs):
+            kwargs.pop("proxy", None)
+            super().__init__(transport=transport, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", ReplayClient)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB (Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@dataclass
+class CrawlStats:
+    """Throughput of one benchmarked crawl."""
+
+    seconds: float
+    requests: int
+    pages: int
+    jobs: int
+    db_round_trips: Optional[int] = None
+    peak_rss_mb: float = field(default_factory=peak_rss_mb)
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.jobs / self.seconds
+
+    def report(self, name: str) -> str:
+        line = (
+            f"{name}: {self.pages} list pages, {self.requests} requests, {self.jobs} jobs "
+            f"in {self.seconds:.2f}s = {self.requests_per_second:.0f} pages/s, "
+            f"{self.jobs_per_second:.0f} jobs/s"
+        )
+        if self.db_round_trips is not None and self.jobs:
+            line += f", {self.db_round_trips / self.jobs:.2f} DB round trips/job"
+        return f"{line}, peak RSS {self.peak_rss_mb:.0f} MB"
+
+
+class Stopwatch:
+    """Wall-clock timer for `with` blocks."""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.start
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests to the network and keeps successful page bodies."""
+
+    def __init__(self, site: ReplaySite):
+        self.site = site
+        self._transport = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        body = await response.aread()  # decoded, so drop the encoding headers
+        if response.status_code == 200:
+            self.site.pages[_page_key(request.url)] = body
+        headers = [
+            (name, value) for name, value in response.headers.items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+async def record(directory: Path, region: str, cids: list):
+    """Crawl a slice of jobs.ge and save every page it fetched."""
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from app.parsers.jobs_ge import JobsGeAdapter
+
+    site = ReplaySite({})
+    transport = RecordingTransport(site)
+    with MonkeyPatch.context() as monkeypatch:
+        install_transport(monkeypatch, transport)
+        monkeypatch.setenv("DETAIL_CACHE_ENABLED", "false")  # fetch every page
+        adapter = JobsGeAdapter()
+        adapter.categories = [c for c in adapter.categories if c.cid in cids]
+        result = await adapter.run(region)
+    await transport.aclose()
+
+    site.save(directory)
+    print(f"recorded {len(site.pages)} pages ({len(result.jobs)} jobs) to {directory}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="record a slice of jobs.ge")
+    record_parser.add_argument("directory", type=Path)
+    record_parser.add_argument("--region", default="adjara")
+    record_parser.add_argument("--cid", type=int, action="append", help="category id (repeatable)")
+    args = parser.parse_args()
+
+    asyncio.run(record(args.directory, args.region, args.cid or [6]))
+
+
+if __name__ == "__main__":
+    main()
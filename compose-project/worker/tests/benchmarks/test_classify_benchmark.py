@@ -0,0 +1,62 @@
+"""Micro-benchmark: compiled keyword matcher vs per-keyword substring scans.
+
+Run with: pytest tests/benchmarks -m slow -s
+
+Timings are printed, not asserted: they vary with machine load.
+"""
+import time
+
+import pytest
+
+from app.core import utils
+from app.core.utils import classify_categories, classify_category
+
+
+def _naive_classify(title: str, body: str) -> str:
+    """The scoring classify_category did before: one `in` scan per pattern."""
+    title_lower, body_lower = title.lower(), body.lower()
+    scores = {}
+    for table, (title_weight, body_weight) in (
+        (utils._CATEGORY_PHRASES, utils._PHRASE_WEIGHTS),
+        (utils._CATEGORY_KEYWORDS, utils._KEYWORD_WEIGHTS),
+    ):
+        for category_slug, patterns in table.items():
+            score = scores.get(category_slug, 0)
+            for pattern in patterns:
+                if pattern in title_lower:
+                    score += title_weight
+                elif pattern in body_lower:
+                    score += body_weight
+            if score > 0:
+                scores[category_slug] = score
+    if not scores:
+        return "other"
+    best_category = max(scores, key=scores.get)
+    return best_category if scores[best_category] >= 3 else "other"
+
+
+@pytest.fixture
+def jobs(mock_jobs_ge_detail_html: str):
+    """A few thousand jobs with realistic, ~2KB mixed-language bodies."""
+    body = utils.clean_html(mock_jobs_ge_detail_html)
+    titles = ["Python Developer", "გაყიდვების კონსულტანტი", "Driver", "ბუღალტერი", "Random Job"]
+    return [(f"{titles[i % len(titles)]} {i}", f"{body} {i}") for i in range(2000)]
+
+
+@pytest.mark.slow
+class TestClassifyBenchmark:
+    """CPU cost per job of category classification."""
+
+    def test_classify_per_job(self, jobs):
+        """One automaton pass per text vs hundreds of substring scans."""
+        start = time.perf_counter()
+        new = classify_categories(jobs)
+        new_us = (time.perf_counter() - start) * 1e6 / len(jobs)
+
+        start = time.perf_counter()
+        old = [_naive_classify(title, body) for title, body in jobs]
+        old_us = (time.perf_counter() - start) * 1e6 / len(jobs)
+        print(f"\nclassify: matcher {new_us:.1f} us/job, substring scans {old_us:.1f} us/job")
+
+        assert new == old
+        assert new == [classify_category(title, body) for title, body in jobs]
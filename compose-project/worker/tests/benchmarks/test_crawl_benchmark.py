@@ -0,0 +1,127 @@
+"""End-to-end crawl benchmark against a replayed jobs.ge (see replay.py).
+
+Run with: pytest tests/benchmarks/test_crawl_benchmark.py -m slow -s
+
+Knobs (environment):
+    BENCH_RECORDINGS     directory written by `replay record` (default: synthetic site)
+    BENCH_LATENCY_MS     simulated response latency (default 20)
+    BENCH_CONCURRENCY    CRAWL_CONCURRENCY for the run (default 8)
+    BENCH_DATABASE_URL   throwaway Postgres for the ParserRunner benchmark
+                         (skipped if unset); tables are created, jobs upserted
+"""
+import os
+import re
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, select
+
+from app.core import crawl_scheduler
+from app.core.config import ParserConfig
+from app.parsers.jobs_ge import JobsGeAdapter
+from app.parsers.jobsge_config import get_all_categories
+
+from .replay import CrawlStats, ReplaySite, Stopwatch, install_transport
+
+REGION = "adjara"
+REGION_LID = 14
+SYNTHETIC_CATEGORIES = 6
+
+
+@pytest.fixture
+def site(mock_jobs_ge_detail_html: str) -> ReplaySite:
+    """Recorded site if BENCH_RECORDINGS is set, else a synthetic one."""
+    latency = float(os.getenv("BENCH_LATENCY_MS", "20")) / 1000
+    recordings = os.getenv("BENCH_RECORDINGS")
+    if recordings:
+        return ReplaySite.load(Path(recordings), latency)
+    cids = [c.cid for c in get_all_categories()[:SYNTHETIC_CATEGORIES]]
+    return ReplaySite.synthetic(mock_jobs_ge_detail_html, [REGION_LID], cids, latency=latency)
+
+
+@pytest.fixture
+def replayed(site: ReplaySite, monkeypatch) -> ReplaySite:
+    """Serve all HTTP from the site, with a budget that isn't the bottleneck."""
+    install_transport(monkeypatch, site.transport())
+    monkeypatch.setenv("CRAWL_CONCURRENCY", os.getenv("BENCH_CONCURRENCY", "8"))
+    monkeypatch.setenv("HOST_REQUESTS_PER_SECOND", "100000")
+    monkeypatch.setenv("HOST_REQUEST_BURST", "100")
+    monkeypatch.setenv("DETAIL_CACHE_ENABLED", "false")
+    monkeypatch.setattr(crawl_scheduler, "_host_rate_limiter", None)
+    return site
+
+
+def bench_adapter(site: ReplaySite) -> type:
+    """JobsGeAdapter limited to the categories the site has list pages for."""
+    cids = {int(cid) for cid in re.findall(r"[?&]cid=(\d+)", " ".join(site.pages))}
+
+    class BenchJobsGeAdapter(JobsGeAdapter):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.categories = [c for c in self.categories if c.cid in cids]
+
+    return BenchJobsGeAdapter
+
+
+def list_pages(site: ReplaySite) -> int:
+    return sum(1 for key in site.pages if "cid=" in key)
+
+
+@pytest.mark.slow
+class TestCrawlBenchmark:
+    """Crawler throughput with network and database in the loop."""
+
+    async def test_adapter_run(self, replayed: ReplaySite):
+        """JobsGeAdapter.run: fetch, parse and classify every listing."""
+        adapter = bench_adapter(replayed)()
+
+        with Stopwatch() as watch:
+            result = await adapter.run(REGION)
+
+        stats = CrawlStats(watch.seconds, replayed.requests, result.pages_parsed, len(result.jobs))
+        print("\n" + stats.report("adapter"))
+
+        assert not result.errors
+        assert replayed.misses == 0
+        assert result.pages_parsed == list_pages(replayed)
+
+    async def test_runner_run_source(self, replayed: ReplaySite):
+        """ParserRunner.run_source: the crawl plus batched upserts and bookkeeping."""
+        database_url = os.getenv("BENCH_DATABASE_URL")
+        if not database_url:
+            pytest.skip("BENCH_DATABASE_URL not set")
+
+        from app.core.runner import ParserRunner
+        from app.models.category import Category
+        from app.models.job import Job  # noqa: F401  (registers the table)
+
+        config = ParserConfig()
+        config.database_url = database_url
+        runner = ParserRunner(config, {"jobs.ge": bench_adapter(replayed)})
+        await runner.ensure_tables_exist()
+        async with runner._session_maker() as session:
+            if not (await session.execute(select(Category).limit(1))).first():
+                session.add(Category(slug="other", name_ge="სხვა", name_en="Other"))
+                await session.commit()
+
+        round_trips = 0
+
+        def count_round_trip(*args):
+            nonlocal round_trips
+            round_trips += 1
+
+        event.listen(runner._engine.sync_engine, "before_cursor_execute", count_round_trip)
+        try:
+            with Stopwatch() as watch:
+                result = await runner.run_source("jobs.ge", [REGION])
+        finally:
+            event.remove(runner._engine.sync_engine, "before_cursor_execute", count_round_trip)
+            await runner.close()
+
+        stats = CrawlStats(
+            watch.seconds, replayed.requests, result.pages_parsed, result.total_found, round_trips
+        )
+        print("\n" + stats.report("runner"))
+
+        assert not result.errors
+        assert replayed.misses == 0
@@ -0,0 +1,61 @@
+"""Micro-benchmark: single-parse lxml extraction vs BeautifulSoup parsing.
+
+Run with: pytest tests/benchmarks -m slow -s
+
+Timings are printed, not asserted: they vary with machine load.
+"""
+import time
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.parsers.jobsge_extract import ListPage, extract_detail_fields
+
+
+def _per_page_ms(func, html: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(html)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+@pytest.fixture
+def large_list_html(mock_jobs_ge_list_html: str) -> str:
+    """List page with ~300 rows, the size of a real jobs.ge category page."""
+    head, _, rest = mock_jobs_ge_list_html.partition("<table>")
+    rows, _, tail = rest.partition("</table>")
+    many_rows = "".join(
+        rows.replace("id=12345", f"id={100000 + i}").replace("id=67890", f"id={200000 + i}")
+        .replace("id=11111", f"id={300000 + i}")
+        for i in range(100)
+    )
+    return f"{head}<table>{many_rows}</table>{tail}"
+
+
+@pytest.mark.slow
+class TestExtractionBenchmark:
+    """CPU cost per page of the extraction layer."""
+
+    def test_list_page(self, large_list_html: str):
+        """One lxml pass vs the two BeautifulSoup parses the list page used to get."""
+        iterations = 20
+
+        def new(html):
+            page = ListPage(html, "https://jobs.ge")
+            return page.entries, page.has_next_page(1)
+
+        def old_parses_only(html):
+            BeautifulSoup(html, "lxml")
+            BeautifulSoup(html, "lxml")
+
+        new_ms = _per_page_ms(new, large_list_html, iterations)
+        old_ms = _per_page_ms(old_parses_only, large_list_html, iterations)
+        print(f"\nlist page: lxml extraction {new_ms:.2f} ms, BeautifulSoup parses alone {old_ms:.2f} ms")
+
+    def test_detail_page(self, mock_jobs_ge_detail_html: str):
+        """Full field extraction vs a single BeautifulSoup parse of the page."""
+        iterations = 200
+
+        new_ms = _per_page_ms(extract_detail_fields, mock_jobs_ge_detail_html, iterations)
+        old_ms = _per_page_ms(lambda html: BeautifulSoup(html, "lxml"), mock_jobs_ge_detail_html, iterations)
+        print(f"\ndetail page: lxml extraction {new_ms:.3f} ms, BeautifulSoup parse alone {old_ms:.3f} ms")
@@ -0,0 +1,144 @@
+"""Micro-benchmark: precompiled, memoized salary/date extraction vs per-call patterns.
+
+Run with: pytest tests/benchmarks -m slow -s
+
+Timings are printed, not asserted: they vary with machine load.
+"""
+import re
+import time
+from datetime import datetime
+
+import pytest
+
+from app.core import utils
+from app.core.utils import extract_date, extract_salary
+
+# Inputs of tests/unit/test_utils.py, plus the label/context strings a
+# detail page feeds extract_date (each seen several times per document)
+SALARY_TEXTS = [
+    "2000-3000 GEL", "$2500", "1500€", "2,000 - 3,500 GEL", "1500 GEL", "შეთანხმებით",
+    "ხელფასი: 3000 - 5000 GEL", "ანაზღაურება შეთანხმებით", "Salary: competitive",
+]
+DATE_TEXTS = [
+    "2024-01-15", "15.01.2024", "23 იანვარი 2024", "January 15, 2024", "no date here",
+    "გამოქვეყნდა:", "გამოქვეყნდა: 15.01.2026", "ბოლო ვადა:", "ბოლო ვადა: 30 იანვარი",
+    "ვეძებთ გამოცდილ პროგრამისტს Python-ში.", "3+ წლის გამოცდილება",
+]
+
+
+def _reference_extract_salary(text):
+    """extract_salary as it was: patterns rebuilt and three passes per call."""
+    if not text:
+        return None, None, "GEL"
+    salary_keywords = [
+        r'ხელფასი', r'salary', r'ანაზღაურება', r'compensation',
+        r'გასამრჯელო', r'pay', r'wage', r'income',
+        r'GEL', r'ლარი', r'\$', r'USD', r'€', r'EUR',
+    ]
+    salary_pattern = (
+        r'(?:' + '|'.join(salary_keywords) + r')' r'[:\s]*'
+        r'(\d{1,3}(?:[,\s]?\d{3})*)' r'(?:\s*[-–—]\s*(\d{1,3}(?:[,\s]?\d{3})*))?'
+    )
+    reverse_pattern = (
+        r'(\d{1,3}(?:[,\s]?\d{3})*)' r'(?:\s*[-–—]\s*(\d{1,3}(?:[,\s]?\d{3})*))?'
+        r'\s*(?:GEL|ლარი|\$|USD|€|EUR)'
+    )
+    currency = "GEL"
+    if "$" in text or "USD" in text.upper():
+        currency = "USD"
+    elif "€" in text or "EUR" in text.upper():
+        currency = "EUR"
+    text_lower = text.lower()
+    for pattern, subject in ((salary_pattern, text_lower), (reverse_pattern, text)):
+        match = re.search(pattern, subject, re.IGNORECASE)
+        if match:
+            num1 = int(match.group(1).replace(",", "").replace(" ", ""))
+            num2 = int(match.group(2).replace(",", "").replace(" ", "")) if match.group(2) else num1
+            if 50 <= num1 <= 100000 and 50 <= num2 <= 100000:
+                return min(num1, num2), max(num1, num2), currency
+    for keyword in ['ხელფასი', 'salary', 'ანაზღაურება', 'gel', 'ლარი']:
+        if keyword in text_lower:
+            keyword_pos = text_lower.find(keyword)
+            context = text[max(0, keyword_pos - 30):keyword_pos + len(keyword) + 30]
+            valid_numbers = [int(n) for n in re.findall(r'\b(\d{3,5})\b', context) if 100 <= int(n) <= 50000]
+            if valid_numbers:
+                return min(valid_numbers[:2]), max(valid_numbers[:2]), currency
+    return None, None, currency
+
+
+def _reference_extract_date(text):
+    """extract_date as it was: month patterns formatted and searched per call."""
+    if not text:
+        return None
+    text = text.strip()
+    current_year = datetime.now().year
+    for pattern, order in ((r"(\d{4})-(\d{1,2})-(\d{1,2})", (1, 2, 3)), (r"(\d{1,2})\.(\d{1,2})\.(\d{4})", (3, 2, 1))):
+        match = re.search(pattern, text)
+        if match:
+            try:
+                return datetime(*(int(match.group(i)) for i in order))
+            except ValueError:
+                pass
+    for months, subject, with_year, without_year in (
+        (utils._GE_MONTHS, text, r"(\d{{1,2}})\s*{m}\s*(\d{{4}})", r"(\d{{1,2}})\s*{m}"),
+        (utils._EN_MONTHS, text.lower(), r"{m}\s+(\d{{1,2}}),?\s*(\d{{4}})", r"{m}\s+(\d{{1,2}})"),
+    ):
+        for month_name, month_num in months.items():
+            if month_name in subject:
+                match = re.search(with_year.format(m=month_name), subject)
+                if match:
+                    try:
+                        return datetime(int(match.group(2)), month_num, int(match.group(1)))
+                    except ValueError:
+                        pass
+                else:
+                    match = re.search(without_year.format(m=month_name), subject)
+                    if match:
+                        try:
+                            return datetime(current_year, month_num, int(match.group(1)))
+                        except ValueError:
+                            pass
+    return None
+
+
+def _per_call_us(func, texts, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) * 1e6 / (rounds * len(texts))
+
+
+@pytest.mark.slow
+class TestExtractBenchmark:
+    """CPU cost per call of salary and date extraction."""
+
+    @pytest.fixture(autouse=True)
+    def cold_caches(self):
+        utils._extract_salary.cache_clear()
+        utils._extract_date.cache_clear()
+
+    def test_extract_salary(self):
+        """Compiled patterns, digit pre-check and memo vs the per-call build."""
+        assert [extract_salary(t) for t in SALARY_TEXTS] == [_reference_extract_salary(t) for t in SALARY_TEXTS]
+
+        new_us = _per_call_us(extract_salary, SALARY_TEXTS, 500)
+        uncached_us = _per_call_us(utils._extract_salary.__wrapped__, SALARY_TEXTS, 500)
+        old_us = _per_call_us(_reference_extract_salary, SALARY_TEXTS, 500)
+        print(
+            f"\nextract_salary: {new_us:.2f} us/call ({uncached_us:.2f} uncached), "
+            f"per-call patterns {old_us:.2f} us/call"
+        )
+
+    def test_extract_date(self):
+        """Compiled month patterns and memo vs formatting them on every call."""
+        assert [extract_date(t) for t in DATE_TEXTS] == [_reference_extract_date(t) for t in DATE_TEXTS]
+
+        year = datetime.now().year
+        new_us = _per_call_us(extract_date, DATE_TEXTS, 500)
+        uncached_us = _per_call_us(lambda t: utils._extract_date.__wrapped__(t, year), DATE_TEXTS, 500)
+        old_us = _per_call_us(_reference_extract_date, DATE_TEXTS, 500)
+        print(
+            f"\nextract_date: {new_us:.2f} us/call ({uncached_us:.2f} uncached), "
+            f"per-call patterns {old_us:.2f} us/call"
+        )
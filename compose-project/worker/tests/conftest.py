@@ -1,7 +1,54 @@
 """Pytest configuration and fixtures for parser tests."""
+import os
+
 import pytest
 from typing import Generator
 
+from sqlalchemy import delete, select
+
+from app.core import parse_executor
+from app.core.config import ParserConfig
+
+
+@pytest.fixture(autouse=True)
+def inline_parse_executor(monkeypatch):
+    """Parse in-process; pool tests build their own ParseExecutor."""
+    monkeypatch.setattr(parse_executor, "_shared_executor", parse_executor.ParseExecutor(0))
+
+
+@pytest.fixture
+async def db_runner():
+    """ParserRunner on the BENCH_DATABASE_URL Postgres (skipped if unset).
+
+    Tables and an "other" category are created; jobs and categories whose
+    source/slug starts with "test-" are removed afterwards.
+    """
+    database_url = os.getenv("BENCH_DATABASE_URL")
+    if not database_url:
+        pytest.skip("BENCH_DATABASE_URL not set")
+
+    from app.core.runner import ParserRunner
+    from app.models.category import Category
+    from app.models.job import Job
+
+    config = ParserConfig()
+    config.database_url = database_url
+    runner = ParserRunner(config, {})
+    await runner.ensure_tables_exist()
+    async with runner._session_maker() as session:
+        if not (await session.execute(select(Category).where(Category.slug == "other"))).first():
+            session.add(Category(slug="other", name_ge="სხვა", name_en="Other"))
+            await session.commit()
+        await runner._load_categories(session)
+    try:
+        yield runner
+    finally:
+        async with runner._session_maker() as session:
+            await session.execute(delete(Job).where(Job.parsed_from.like("test-%")))
+            await session.execute(delete(Category).where(Category.slug.like("test-%")))
+            await session.commit()
+        await runner.close()
+
 
 # Sample HTML fixtures
 @pytest.fixture
@@ -97,6 +144,40 @@ def mock_jobs_ge_detail_no_salary_html() -> str:
     """
 
 
+@pytest.fixture
+def mock_jobs_ge_detail_indented_html() -> str:
+    """jobs.ge detail page whose salary label is only near its amount once
+    indentation-only text is collapsed (as BeautifulSoup does)."""
+    return """<!DOCTYPE html>
+<html>
+    <head>
+        <title>Backend Developer - Batumi Tech</title>
+    </head>
+    <body>
+        <h1>Backend Developer</h1>
+        <div class="job-description">
+            <p>We are looking for a backend developer to build and maintain our services.</p>
+        </div>
+        <div class="stats">
+            <div class="stat">
+                <div class="stat-value">
+                    <span>1800</span>
+                </div>
+            </div>
+            <div class="stat">
+                <div class="stat-label">
+                    <span>Salary</span>
+                </div>
+            </div>
+        </div>
+        <pre>
+            Apply by 20.02.2026
+        </pre>
+    </body>
+</html>
+"""
+
+
 @pytest.fixture
 def mock_hr_ge_list_html() -> str:
     """Sample hr.ge list page HTML."""
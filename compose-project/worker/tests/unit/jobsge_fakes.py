@@ -0,0 +1,41 @@
+"""Stand-in HTTP clients and crawl scheduler for JobsGeAdapter tests."""
+from app.core.http_client import ConditionalResponse
+
+
+class FakeClient:
+    """Stand-in HTTP client recording conditional requests."""
+
+    def __init__(self, html: str, etag: str = '"v1"', html_en: str = None):
+        self.html = html
+        self.html_en = html_en or html  # /en/ repeats the posting unless given
+        self.etag = etag
+        self.requests = []
+
+    async def get_conditional(self, url, etag=None, last_modified=None, encoding="utf-8"):
+        self.requests.append((url, etag))
+        if etag and etag == self.etag:
+            return ConditionalResponse(not_modified=True, etag=self.etag)
+        html = self.html_en if "/en/" in url else self.html
+        return ConditionalResponse(
+            not_modified=False, text=html, content=html.encode(), etag=self.etag
+        )
+
+
+class ListClient:
+    """Stand-in HTTP client serving one list page."""
+
+    def __init__(self, html: str):
+        self.html = html
+
+    async def get_bytes(self, url, params=None):
+        return self.html.encode()
+
+
+class RecordingScheduler:
+    """Stand-in crawl scheduler recording submitted tasks."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, priority, func, *args):
+        self.submitted.append((func.__name__, args))
@@ -0,0 +1,246 @@
+"""BeautifulSoup reference extractors for jobs.ge pages.
+
+The JobsGeAdapter extraction code before it moved to lxml (jobsge_extract),
+kept as the reference the lxml extractors must reproduce field for field.
+"""
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+
+from app.core.utils import clean_html, extract_date, extract_salary, normalize_text
+
+
+def list_entries(html: str, base_url: str) -> List[tuple]:
+    """(job URL, row signature) per job link of a list page (deduplicated)."""
+    soup = BeautifulSoup(html, "lxml")
+    entries = []
+    seen_ids = set()
+
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        if "id=" not in href:
+            continue
+        if "org=" in href or "cid=" in href or "lid=" in href:
+            continue
+        match = re.search(r'[?&]id=(\d+)', href)
+        if match:
+            job_id = match.group(1)
+            if job_id not in seen_ids:
+                seen_ids.add(job_id)
+                full_url = f"{base_url}/ge/?view=jobs&id={job_id}"
+                row = link.find_parent("tr") or link.parent
+                signature = hashlib.sha1(normalize_text(row.get_text(" ")).encode("utf-8")).hexdigest()
+                entries.append((full_url, signature))
+
+    return entries
+
+
+def has_next_page(html: str, current_page: int) -> bool:
+    """Check for a pagination link to the next page."""
+    soup = BeautifulSoup(html, "lxml")
+    for link in soup.find_all("a", href=True):
+        if f"page={current_page + 1}" in link["href"]:
+            return True
+    return False
+
+
+def detail_fields(html: str, full: bool = True) -> dict:
+    """Job fields of a detail page (dates as ISO strings)."""
+    soup = BeautifulSoup(html, "lxml")
+    title = _title(soup)
+    if full and not title:
+        return {"title": None}
+
+    body = _body(soup)
+    if not full:
+        return {"title": title, "body": body}
+
+    company_name = _company(soup)
+    published_at = _published_date(soup)
+    deadline_at = _deadline_date(soup)
+    salary_min, salary_max, salary_currency = extract_salary(soup.get_text())
+
+    html_lower = str(soup).lower()
+    return {
+        "title": title,
+        "body": body,
+        "company_name": company_name,
+        "published_at": published_at.isoformat() if published_at else None,
+        "deadline_at": deadline_at.isoformat() if deadline_at else None,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": salary_currency,
+        "is_vip": "vip" in html_lower or "premium" in html_lower or "პრემიუმ" in html_lower,
+    }
+
+
+def _title(soup: BeautifulSoup) -> Optional[str]:
+    for selector in ["h1", "h2", ".title", ".job-title", "td b", "td strong"]:
+        elem = soup.select_one(selector)
+        if elem:
+            text = elem.get_text(strip=True)
+            if text and len(text) > 3:
+                if "ყველა" not in text and "ვაკანსია" not in text.lower()[:15]:
+                    return text
+
+    title_tag = soup.find("title")
+    if title_tag:
+        text = title_tag.get_text(strip=True)
+        if "|" in text:
+            return text.split("|")[0].strip()
+        if "-" in text:
+            return text.split("-")[0].strip()
+        return text
+
+    return None
+
+
+def _body(soup: BeautifulSoup) -> str:
+    for selector in [".description", ".job-description", ".content",
+                     "article", "td[colspan]", ".vacancy-text", "#job-description"]:
+        elem = soup.select_one(selector)
+        if elem:
+            body = clean_html(str(elem))
+            if len(body) > 50:
+                return body
+
+    main = soup.select_one("main, #content, .main")
+    if main:
+        for tag in main.select("script, style, nav, header, footer, .menu"):
+            tag.decompose()
+        body = clean_html(str(main))
+        if len(body) > 50:
+            return body
+
+    return ""
+
+
+def _company(soup: BeautifulSoup) -> Optional[str]:
+    for selector in [".company-name", ".employer", ".org-name"]:
+        elem = soup.select_one(selector)
+        if elem:
+            text = elem.get_text(strip=True)
+            if text and len(text) > 1:
+                return text
+
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        if "view=client&client=" in href or "org=" in href:
+            text = link.get_text(strip=True)
+            if text and "ყველა" not in text and "ორგანიზაცია" not in text and "განცხადება" not in text:
+                if len(text) > 1 and len(text) < 200:
+                    return text
+
+    title_tag = soup.find("title")
+    if title_tag:
+        title_text = title_tag.get_text(strip=True)
+        if " - " in title_text:
+            parts = title_text.split(" - ")
+            if len(parts) >= 3:
+                company = parts[-1].strip()
+                if company and len(company) > 1 and len(company) < 200:
+                    if company.lower() not in ["jobs.ge", "ჯობს.გე"]:
+                        return company
+
+    return None
+
+
+def _published_date(soup: BeautifulSoup) -> Optional[datetime]:
+    for meta in soup.find_all("meta"):
+        prop = meta.get("property", "") or meta.get("name", "")
+        if "date" in prop.lower() or "published" in prop.lower():
+            content = meta.get("content", "")
+            if content:
+                date = extract_date(content)
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+    publish_patterns = [
+        r'გამოქვეყნდა', r'დამატებულია', r'თარიღი',
+        r'published', r'posted', r'date added',
+    ]
+    for pattern in publish_patterns:
+        for elem in soup.find_all(string=re.compile(pattern, re.I)):
+            parent = elem.parent
+            if parent:
+                date = extract_date(parent.get_text())
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+                next_sib = parent.find_next_sibling()
+                if next_sib:
+                    date = extract_date(next_sib.get_text())
+                    if date:
+                        return date.replace(tzinfo=timezone.utc)
+
+                grandparent = parent.parent
+                if grandparent:
+                    date = extract_date(grandparent.get_text())
+                    if date:
+                        return date.replace(tzinfo=timezone.utc)
+
+    for td in soup.find_all("td"):
+        text = td.get_text(strip=True)
+        if len(text) < 30 and re.search(r'\d{1,2}[./]\d{1,2}[./]\d{4}', text):
+            date = extract_date(text)
+            if date:
+                return date.replace(tzinfo=timezone.utc)
+
+    for elem in soup.find_all(["span", "div"], class_=re.compile(r'date|time', re.I)):
+        text = elem.get_text(strip=True)
+        if text:
+            date = extract_date(text)
+            if date:
+                return date.replace(tzinfo=timezone.utc)
+
+    header_area = soup.find("header") or soup.find("article") or soup.find("main")
+    if header_area:
+        date = extract_date(header_area.get_text()[:500])
+        if date:
+            return date.replace(tzinfo=timezone.utc)
+
+    return None
+
+
+def _deadline_date(soup: BeautifulSoup) -> Optional[datetime]:
+    deadline_patterns = [
+        r'ბოლო\s*ვადა', r'დედლაინ', r'განაცხადის.*ვადა',
+        r'მიღება.*ვადა', r'დასრულება',
+        r'deadline', r'apply\s*by', r'closing\s*date',
+        r'last\s*date', r'expires?',
+    ]
+    for pattern in deadline_patterns:
+        for elem in soup.find_all(string=re.compile(pattern, re.I)):
+            parent = elem.parent
+            if not parent:
+                continue
+
+            contexts_to_check = [parent.get_text()]
+            next_sib = parent.find_next_sibling()
+            if next_sib:
+                contexts_to_check.append(next_sib.get_text())
+            grandparent = parent.parent
+            if grandparent:
+                contexts_to_check.append(grandparent.get_text())
+                gp_next = grandparent.find_next_sibling()
+                if gp_next:
+                    contexts_to_check.append(gp_next.get_text())
+
+            for context in contexts_to_check:
+                if not context:
+                    continue
+                date = extract_date(context)
+                if date:
+                    return date.replace(tzinfo=timezone.utc)
+
+    for tr in soup.find_all("tr"):
+        row_text = tr.get_text().lower()
+        if any(kw in row_text for kw in ['ვადა', 'deadline', 'დედლაინ']):
+            date = extract_date(tr.get_text())
+            if date:
+                return date.replace(tzinfo=timezone.utc)
+
+    return None
@@ -0,0 +1,144 @@
+"""Unit tests for the default streaming BaseAdapter run loop."""
+import asyncio
+
+import pytest
+
+from app.core.base_adapter import MAX_ERROR_LENGTH, BaseAdapter, ErrorLog, JobData
+
+
+class SlowAdapter(BaseAdapter):
+    """Adapter whose detail pages take a while and can fail."""
+
+    source_name = "test"
+    source_domain = "test"
+    base_url = "https://example.test"
+
+    def __init__(self, urls, fail=(), discovery_error=None, delay=0.01):
+        self.urls = urls
+        self.fail = set(fail)
+        self.discovery_error = discovery_error
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+
+    async def discover_job_urls(self, region=None):
+        for url in self.urls:
+            yield url
+        if self.discovery_error:
+            raise self.discovery_error
+
+    async def parse_job(self, url):
+        self.started.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if url in self.fail:
+                raise ValueError("broken page")
+            return JobData(external_id=url, title_ge=url, body_ge="", source_url=url, parsed_from="test")
+        finally:
+            self.in_flight -= 1
+
+    async def parse_list_page(self, page, region=None):
+        return []
+
+
+def make_urls(n):
+    return [f"u{i}" for i in range(n)]
+
+
+class TestStreamingRun:
+    """Tests for BaseAdapter.run / stream."""
+
+    async def test_parses_concurrently_within_bound(self):
+        """Test detail parses overlap but never exceed max_concurrency."""
+        adapter = SlowAdapter(make_urls(20), fail={"u3"})
+        adapter.max_concurrency = 4
+
+        result = await adapter.run()
+
+        assert adapter.max_in_flight == 4
+        assert sorted(job.external_id for job in result.jobs) == sorted(set(make_urls(20)) - {"u3"})
+        assert result.total_found == 20
+        assert list(result.errors) == ["Error parsing u3: broken page"]
+        assert result.errors.counts == {"detail:ValueError": 1}
+
+    async def test_callback_receives_jobs_instead_of_result(self):
+        """Test on_job_parsed gets every job and result.jobs stays empty."""
+        adapter = SlowAdapter(make_urls(10))
+        adapter.max_concurrency = 3
+        received = []
+
+        async def on_job_parsed(job):
+            received.append(job.external_id)
+            return "new"
+
+        result = await adapter.run(on_job_parsed=on_job_parsed, on_jobs_seen=None)
+
+        assert sorted(received) == make_urls(10)
+        assert result.jobs == []
+
+    async def test_slow_consumer_bounds_fetching(self):
+        """Test fetching stops running ahead of a consumer that doesn't read."""
+        adapter = SlowAdapter(make_urls(50), delay=0)
+        adapter.max_concurrency = 2
+
+        stream = adapter.stream()
+        first = await stream.__anext__()
+        await asyncio.sleep(0.05)
+
+        # Queue (2) + parses blocked handing over (2) + the one yielded
+        assert first.external_id == "u0"
+        assert len(adapter.started) <= 5
+        await stream.aclose()
+
+    async def test_discovery_error_after_in_flight_jobs(self):
+        """Test a discovery failure surfaces once in-flight jobs are yielded."""
+        adapter = SlowAdapter(make_urls(3), discovery_error=RuntimeError("list page down"))
+        jobs = []
+
+        with pytest.raises(RuntimeError, match="list page down"):
+            async for job in adapter.stream():
+                jobs.append(job)
+
+        assert len(jobs) == 3
+
+
+class TestErrorLog:
+    """Tests for the bounded error log."""
+
+    def test_keeps_recent_and_counts_all(self):
+        """Test old messages are dropped but still counted by kind."""
+        errors = ErrorLog(keep=3)
+        for i in range(5):
+            errors.append(f"list error {i}", kind="list:HTTPClientError")
+        errors.append("x" * (MAX_ERROR_LENGTH + 10), kind="detail:ValueError")
+
+        assert len(errors) == 6
+        assert list(errors) == ["list error 3", "list error 4", "x" * MAX_ERROR_LENGTH]
+        assert errors.summary()[0] == (
+            "6 errors (list:HTTPClientError: 5, detail:ValueError: 1); last 3 kept"
+        )
+
+    def test_sink_and_merge(self):
+        """Test the sink sees each error once, merged logs keep counts."""
+        seen = []
+        region = ErrorLog(sink=lambda kind, message: seen.append((kind, message)))
+        region.append("boom", kind="run")
+        combined = ErrorLog()
+        combined.extend(region)
+
+        assert seen == [("run", "boom")]
+        assert combined.summary() == ["boom"]
+        assert combined.counts == {"run": 1}
+
+    async def test_adapter_errors_go_to_sink(self):
+        """Test run() hands errors to the adapter's error_sink."""
+        seen = []
+        adapter = SlowAdapter(["u1", "u2"], fail={"u2"})
+        adapter.error_sink = lambda kind, message: seen.append(kind)
+
+        await adapter.run()
+
+        assert seen == ["detail:ValueError"]
@@ -0,0 +1,206 @@
+"""Unit tests for crawl scheduling and rate limiting."""
+import asyncio
+import time
+
+import pytest
+
+from app.core.crawl_scheduler import CrawlScheduler, HostRateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    async def test_enforces_rate(self):
+        """Test acquisitions beyond the burst are spaced by 1/rate."""
+        bucket = TokenBucket(rate=20.0, capacity=1.0)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # First token is immediate, the other 4 take 50ms each
+        assert elapsed >= 0.19
+
+    async def test_burst_is_immediate(self):
+        """Test a full bucket serves `capacity` requests without waiting."""
+        bucket = TokenBucket(rate=1.0, capacity=3.0)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+
+class TestHostRateLimiter:
+    """Tests for HostRateLimiter."""
+
+    def test_buckets_per_host(self):
+        """Test each host has its own rate."""
+        limiter = HostRateLimiter(default_rate=1.0)
+        limiter.set_rate("jobs.ge", 0.5)
+
+        assert limiter.get_rate("jobs.ge") == 0.5
+        assert limiter.get_rate("hr.ge") == 1.0
+
+    async def test_hosts_do_not_share_budget(self):
+        """Test requests to different hosts are not throttled together."""
+        limiter = HostRateLimiter(default_rate=0.1)
+        start = time.monotonic()
+        await limiter.acquire("https://jobs.ge/ge/?view=jobs&id=1")
+        await limiter.acquire("https://hr.ge/announcement/1")
+
+        assert time.monotonic() - start < 0.1
+
+
+class TestCrawlScheduler:
+    """Tests for CrawlScheduler."""
+
+    async def test_runs_by_priority(self):
+        """Test lower priority values run first, FIFO within a priority."""
+        order = []
+
+        async def task(name):
+            order.append(name)
+
+        scheduler = CrawlScheduler(concurrency=1)
+        scheduler.submit(1, task, "list-1")
+        scheduler.submit(0, task, "detail-1")
+        scheduler.submit(1, task, "list-2")
+        scheduler.submit(0, task, "detail-2")
+        await scheduler.run()
+
+        assert order == ["detail-1", "detail-2", "list-1", "list-2"]
+
+    async def test_tasks_can_submit_tasks(self):
+        """Test tasks submitted while running are processed."""
+        seen = []
+        scheduler = CrawlScheduler(concurrency=2)
+
+        async def list_page(page):
+            seen.append(page)
+            if page < 3:
+                scheduler.submit(1, list_page, page + 1)
+
+        scheduler.submit(1, list_page, 1)
+        await scheduler.run()
+
+        assert seen == [1, 2, 3]
+
+    async def test_concurrency_bound(self):
+        """Test no more than `concurrency` tasks run at once."""
+        running = 0
+        peak = 0
+
+        async def task():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler = CrawlScheduler(concurrency=3)
+        for _ in range(10):
+            scheduler.submit(0, task)
+        await scheduler.run()
+
+        assert peak == 3
+
+    async def test_errors_are_contained(self):
+        """Test a failing task does not stop the crawl."""
+        done = []
+
+        async def bad():
+            raise ValueError("boom")
+
+        async def good():
+            done.append(True)
+
+        scheduler = CrawlScheduler(concurrency=1)
+        scheduler.submit(0, bad)
+        scheduler.submit(0, good)
+        await scheduler.run()
+
+        assert done == [True]
+
+    async def test_cancellation_propagates(self):
+        """Test a task raising CancelledError stops the crawl."""
+        done = []
+
+        async def stop():
+            raise asyncio.CancelledError("Job stopped")
+
+        async def later():
+            done.append(True)
+
+        scheduler = CrawlScheduler(concurrency=1)
+        scheduler.submit(0, stop)
+        scheduler.submit(1, later)
+
+        with pytest.raises(asyncio.CancelledError):
+            await scheduler.run()
+        assert done == []
+
+
+class TestAdaptiveRate:
+    """Tests for AIMD rate control."""
+
+    def test_healthy_responses_raise_rate_to_ceiling(self):
+        """Test steady fast responses increase the rate up to max_rate."""
+        limiter = HostRateLimiter(adaptive=True, max_rate_factor=2.0)
+        limiter.set_rate("jobs.ge", 1.0)
+
+        for _ in range(10):
+            limiter.observe("https://jobs.ge/ge/", 200, latency=0.1)
+        assert limiter.get_rate("jobs.ge") == pytest.approx(1.5)
+
+        for _ in range(100):
+            limiter.observe("https://jobs.ge/ge/", 200, latency=0.1)
+        assert limiter.get_rate("jobs.ge") == pytest.approx(2.0)
+
+    def test_throttle_status_halves_once_per_cooldown(self):
+        """Test 429/503 halve the rate, and a burst of them counts once."""
+        limiter = HostRateLimiter(adaptive=True)
+        limiter.set_rate("jobs.ge", 2.0)
+
+        limiter.observe("https://jobs.ge/ge/", 429)
+        limiter.observe("https://jobs.ge/ge/", 503)
+
+        assert limiter.get_rate("jobs.ge") == pytest.approx(1.0)
+
+    def test_rising_latency_backs_off(self):
+        """Test latency well above the baseline is treated as congestion."""
+        limiter = HostRateLimiter(adaptive=True)
+        limiter.set_rate("jobs.ge", 1.0)
+        for _ in range(10):
+            limiter.observe("https://jobs.ge/ge/", 200, latency=0.1)
+        raised = limiter.get_rate("jobs.ge")
+
+        for _ in range(3):
+            limiter.observe("https://jobs.ge/ge/", 200, latency=1.0)
+
+        assert limiter.get_rate("jobs.ge") == pytest.approx(raised * 0.5, rel=0.1)
+
+    def test_set_rate_keeps_adapted_rate(self):
+        """Test a new run with the same base rate doesn't reset adaptation."""
+        limiter = HostRateLimiter(adaptive=True)
+        limiter.set_rate("jobs.ge", 1.0)
+        limiter.observe("https://jobs.ge/ge/", 429)
+        limiter.set_rate("jobs.ge", 1.0)
+        assert limiter.get_rate("jobs.ge") == pytest.approx(0.5)
+
+        limiter.set_rate("jobs.ge", 2.0)
+        assert limiter.get_rate("jobs.ge") == 2.0
+        assert limiter.rates() == {"jobs.ge": 2.0}
+
+    async def test_retry_after_pauses_host(self):
+        """Test Retry-After blocks the host's bucket, adaptive or not."""
+        limiter = HostRateLimiter(default_rate=100.0, burst=5)
+        limiter.observe("https://jobs.ge/ge/", 429, retry_after=0.2)
+
+        start = time.monotonic()
+        await limiter.acquire("https://jobs.ge/ge/")
+        assert time.monotonic() - start >= 0.19
+
+        start = time.monotonic()
+        await limiter.acquire("https://hr.ge/")
+        assert time.monotonic() - start < 0.05
@@ -0,0 +1,124 @@
+"""Unit tests for the detail page cache."""
+import pytest
+
+from app.core.detail_cache import DetailCache, body_digest
+from app.parsers.jobs_ge import JobsGeAdapter
+from app.parsers.jobsge_config import get_category_by_cid, get_region_by_lid
+
+from .jobsge_fakes import FakeClient
+
+
+class TestDetailCache:
+    """Tests for DetailCache storage."""
+
+    @pytest.fixture
+    def cache(self) -> DetailCache:
+        """Create an in-memory cache."""
+        return DetailCache(":memory:")
+
+    def test_page_roundtrip(self, cache: DetailCache):
+        """Test storing and reading back a page."""
+        cache.put_page("jobs.ge", "1", "ge", "abc", {"title": "ტესტი"}, etag='"e"')
+        page = cache.get_page("jobs.ge", "1", "ge")
+
+        assert page is not None
+        assert page.payload == {"title": "ტესტი"}
+        assert page.etag == '"e"'
+        assert page.digest == "abc"
+        assert cache.get_page("jobs.ge", "1", "en") is None
+
+    def test_touch_keeps_validators(self, cache: DetailCache):
+        """Test revalidation does not drop existing validators."""
+        cache.put_page("jobs.ge", "1", "ge", "abc", {}, etag='"e"', last_modified="lm")
+        cache.touch_page("jobs.ge", "1", "ge")
+        page = cache.get_page("jobs.ge", "1", "ge")
+
+        assert page.etag == '"e"'
+        assert page.last_modified == "lm"
+
+    def test_signature_roundtrip(self, cache: DetailCache):
+        """Test listing signatures are stored per source/job."""
+        cache.put_signature("jobs.ge", "1", "sig")
+
+        assert cache.get_signature("jobs.ge", "1") == "sig"
+        assert cache.get_signature("hr.ge", "1") is None
+
+    def test_prune_removes_old_entries(self, cache: DetailCache):
+        """Test pruning removes entries older than max age."""
+        cache.put_page("jobs.ge", "1", "ge", "abc", {})
+        cache.put_signature("jobs.ge", "1", "sig")
+
+        cache.record_english("jobs.ge", "job:1", differed=False)
+
+        assert cache.prune(max_age_days=1) == 0
+        assert cache.prune(max_age_days=-1) == 3
+        assert cache.get_page("jobs.ge", "1", "ge") is None
+
+    def test_english_hints_accumulate(self, cache: DetailCache):
+        """Test English checks are counted per key."""
+        cache.record_english("jobs.ge", "company:TechCorp", differed=False)
+        cache.record_english("jobs.ge", "company:TechCorp", differed=True)
+
+        assert cache.get_english_hint("jobs.ge", "company:TechCorp") == (2, 1)
+        assert cache.get_english_hint("jobs.ge", "job:1") is None
+
+    def test_body_digest_stable(self):
+        """Test body digest is deterministic."""
+        assert body_digest("<html>") == body_digest("<html>")
+        assert body_digest("<html>") != body_digest("<html >")
+
+
+class TestJobsGeDetailCaching:
+    """Tests for JobsGeAdapter use of the detail cache."""
+
+    URL = "https://jobs.ge/ge/?view=jobs&id=12345"
+
+    @pytest.fixture
+    def adapter(self) -> JobsGeAdapter:
+        """Create adapter with an in-memory cache."""
+        return JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+
+    def test_listing_signatures_extracted(
+        self, adapter: JobsGeAdapter, mock_jobs_ge_list_html: str
+    ):
+        """Test every listed job gets a signature."""
+        entries = adapter._extract_job_entries(mock_jobs_ge_list_html)
+
+        assert entries
+        assert all(signature for _, signature in entries)
+        assert [url for url, _ in entries] == adapter._extract_job_urls(mock_jobs_ge_list_html)
+
+    async def test_unchanged_listing_skips_fetch(
+        self, adapter: JobsGeAdapter, mock_jobs_ge_detail_html: str
+    ):
+        """Test an unchanged listing is served from cache without requests."""
+        adapter.client = FakeClient(mock_jobs_ge_detail_html)
+        region = get_region_by_lid(14)
+        category = get_category_by_cid(6)
+
+        first = await adapter._parse_job_detail(self.URL, region, category, "sig-1")
+        assert first is not None
+        assert len(adapter.client.requests) == 2  # ge + en
+
+        second = await adapter._parse_job_detail(self.URL, region, category, "sig-1")
+        assert len(adapter.client.requests) == 2
+        assert second.content_hash == first.content_hash
+        assert second.published_at == first.published_at
+
+    async def test_changed_listing_sends_conditional_request(
+        self, adapter: JobsGeAdapter, mock_jobs_ge_detail_html: str
+    ):
+        """Test a changed listing revalidates with the stored ETag."""
+        adapter.client = FakeClient(
+            mock_jobs_ge_detail_html,
+            html_en=mock_jobs_ge_detail_html.replace("პროგრამისტი / Developer", "Developer"),
+        )
+        region = get_region_by_lid(14)
+        category = get_category_by_cid(6)
+
+        first = await adapter._parse_job_detail(self.URL, region, category, "sig-1")
+        second = await adapter._parse_job_detail(self.URL, region, category, "sig-2")
+
+        assert adapter.client.requests[2] == (self.URL, '"v1"')
+        assert adapter._cache_stats["not_modified"] == 2
+        assert second.content_hash == first.content_hash
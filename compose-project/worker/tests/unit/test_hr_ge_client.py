@@ -0,0 +1,103 @@
+"""hr.ge adapter connection reuse, against a local stand-in server."""
+import asyncio
+
+import pytest
+
+from app.core import crawl_scheduler
+from app.core.crawl_scheduler import HostRateLimiter
+from app.parsers.hr_ge import HrGeAdapter
+
+LIST_PAGE = """
+<html><body>
+  <div class="vacancy-item"><a href="/vacancy/101">Senior Developer</a></div>
+  <div class="vacancy-item"><a href="/vacancy/102">Project Manager</a></div>
+  <div class="vacancy-item"><a href="/vacancy/103">Accountant</a></div>
+</body></html>
+"""
+
+
+class StandInServer:
+    """Minimal HTTP/1.1 keep-alive server serving hr.ge-like pages."""
+
+    def __init__(self, detail_html: str):
+        self.detail_html = detail_html
+        self.connections = 0
+        self.requests = []
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _page(self, path: str) -> str:
+        if path.startswith("/vacancies"):
+            return LIST_PAGE if "page=1" in path else "<html><body></body></html>"
+        return self.detail_html
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ", 2)[1].decode()
+                self.requests.append(path)
+                body = self._page(path).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+def fast_rate_limit(monkeypatch):
+    """Fresh process-wide limiter with a budget that doesn't slow the test."""
+    monkeypatch.setenv("HOST_REQUESTS_PER_SECOND", "1000")
+    monkeypatch.setattr(crawl_scheduler, "_host_rate_limiter", HostRateLimiter(1000, burst=10))
+
+
+class TestHrGeConnectionReuse:
+    """Tests for the adapter-owned HTTP client."""
+
+    async def test_run_reuses_pooled_connections(self, mock_hr_ge_detail_html, fast_rate_limit):
+        """Test a whole run (list pages + details) reuses pooled connections."""
+        server = StandInServer(mock_hr_ge_detail_html)
+        adapter = HrGeAdapter()
+        adapter.max_concurrency = 1
+        adapter.base_url = await server.start()
+        try:
+            result = await adapter.run()
+        finally:
+            await server.stop()
+
+        assert sorted(job.external_id for job in result.jobs) == ["101", "102", "103"]
+        assert len(server.requests) == 5  # list pages 1-2, three details
+        # The list producer and one detail fetch overlap; over HTTP/1.1
+        # that is two keep-alive connections, not one per request
+        assert server.connections <= 2
+        assert adapter.client is None  # closed with the run
+
+    async def test_standalone_calls_share_client(self, mock_hr_ge_detail_html, fast_rate_limit):
+        """Test calls outside run() open the client once and keep it."""
+        server = StandInServer(mock_hr_ge_detail_html)
+        try:
+            async with HrGeAdapter() as adapter:
+                adapter.base_url = await server.start()
+                client = adapter.client
+                await adapter.parse_list_page(1)
+                await adapter.parse_job(f"{adapter.base_url}/vacancy/101")
+                await adapter.parse_job(f"{adapter.base_url}/vacancy/102")
+                assert adapter.client is client
+        finally:
+            await server.stop()
+
+        assert server.connections == 1
+        assert len(server.requests) == 3
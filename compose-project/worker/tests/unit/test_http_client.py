@@ -0,0 +1,71 @@
+"""Unit tests for HTTPClient backoff handling."""
+import httpx
+import pytest
+from tenacity import RetryError, wait_none
+
+from app.core.crawl_scheduler import HostRateLimiter
+from app.core.http_client import HTTPClient, RateLimitedError, parse_retry_after
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    """Retry immediately (the limiter still enforces Retry-After)."""
+    monkeypatch.setattr(HTTPClient.get.retry, "wait", wait_none())
+
+
+async def open_client(handler, rate_limiter=None) -> HTTPClient:
+    client = HTTPClient(rate_limit_delay=0, rate_limiter=rate_limiter)
+    await client.__aenter__()
+    await client._client.aclose()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestBackoff:
+    """Tests for 429/503 handling."""
+
+    async def test_throttled_request_is_retried(self, no_retry_wait):
+        """Test a 429 with Retry-After backs the host off and is retried."""
+        statuses = [429, 200]
+        limiter = HostRateLimiter(default_rate=100.0, adaptive=True)
+        limiter.set_rate("jobs.ge", 2.0)
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"}, text="ok")
+
+        client = await open_client(handler, limiter)
+        try:
+            response = await client.get("https://jobs.ge/ge/")
+        finally:
+            await client.__aexit__(None, None, None)
+
+        assert response.status_code == 200
+        assert limiter.get_rate("jobs.ge") < 2.0
+
+    async def test_gives_up_after_retries(self, no_retry_wait):
+        """Test persistent 503s exhaust the retries with RateLimitedError."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        client = await open_client(handler)
+        try:
+            with pytest.raises(RetryError) as error:
+                await client.get("https://jobs.ge/ge/")
+        finally:
+            await client.__aexit__(None, None, None)
+
+        last_error = error.value.last_attempt.exception()
+        assert isinstance(last_error, RateLimitedError)
+        assert last_error.status_code == 503
+        assert len(calls) == 3
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds and HTTP-date forms, capped and clamped."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("999999") == 300.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
@@ -0,0 +1,198 @@
+"""Unit tests for the parse job control channel."""
+import asyncio
+import uuid
+
+from app.core import job_controls
+from app.core.job_controls import (
+    SAFETY_REFRESH_SECONDS,
+    JobControlCache,
+    JobControlListener,
+    control_payload,
+)
+
+
+class ControlRow:
+    """Stand-in for the parse_jobs control columns, read via fetch()."""
+
+    def __init__(self, action: str = "continue", delay: float = 0.0):
+        self.action = action
+        self.delay = delay
+        self.reads = 0
+
+    async def fetch(self) -> str:
+        self.reads += 1
+        action = self.action
+        await asyncio.sleep(self.delay)
+        return action
+
+
+class FakeConnection:
+    """Stand-in for the listener's asyncpg connection."""
+
+    def __init__(self):
+        self.closed = False
+        self.termination_listeners = []
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.remove(callback)
+
+    async def close(self):
+        self.closed = True
+        for callback in list(self.termination_listeners):
+            callback(self)
+
+
+def connected_listener(fallback_interval: float = 0.01) -> JobControlListener:
+    listener = JobControlListener("postgresql+asyncpg://u:p@db:5432/jobboard", fallback_interval)
+    listener._conn = FakeConnection()
+    listener._conn.termination_listeners.append(listener._on_terminated)
+    return listener
+
+
+class TestJobControlCache:
+    """Tests for JobControlCache."""
+
+    async def test_refreshes_in_background(self):
+        """Test the cached action follows the row without explicit checks."""
+        row = ControlRow()
+        controls = JobControlCache(row.fetch, interval=0.02)
+        await controls.start()
+        assert controls.action == "continue"
+
+        row.action = "stop"
+        await asyncio.sleep(0.1)
+        await controls.close()
+
+        assert controls.action == "stop"
+        reads = row.reads
+        await asyncio.sleep(0.05)
+        assert row.reads == reads
+
+    async def test_notify_wakes_waiter(self):
+        """Test a notification resolves a paused wait without polling."""
+        row = ControlRow("paused")
+        controls = JobControlCache(row.fetch, interval=60)
+        await controls.start()
+
+        waiter = asyncio.create_task(controls.wait_for_update())
+        await asyncio.sleep(0)
+        row.action = "continue"
+        controls.notify()
+
+        assert await asyncio.wait_for(waiter, timeout=1) == "continue"
+        await controls.close()
+
+    async def test_notify_during_refresh_reads_again(self):
+        """Test a change arriving mid-refresh is not lost."""
+        row = ControlRow("continue", delay=0.02)
+        controls = JobControlCache(row.fetch, interval=60)
+
+        controls.notify()
+        await asyncio.sleep(0.005)  # first read has started
+        row.action = "stop"
+        controls.notify()
+        await asyncio.sleep(0.1)
+
+        assert controls.action == "stop"
+        assert row.reads == 2
+        await controls.close()
+
+    async def test_set_interval_cuts_pending_wait(self):
+        """Test a shorter interval applies without waiting out the old one."""
+        row = ControlRow()
+        controls = JobControlCache(row.fetch, interval=60)
+        await controls.start()
+
+        row.action = "stop"
+        controls.set_interval(0.01)
+        await asyncio.sleep(0.05)
+
+        assert controls.action == "stop"
+        await controls.close()
+
+
+class TestJobControlListener:
+    """Tests for JobControlListener dispatch."""
+
+    async def test_dispatches_by_job_id(self):
+        """Test notifications wake only the caches of the named job."""
+        listener = JobControlListener("postgresql+asyncpg://u:p@db:5432/jobboard")
+        job_id, other_id = uuid.uuid4(), uuid.uuid4()
+        row, other_row = ControlRow(), ControlRow()
+        controls = JobControlCache(row.fetch, interval=60)
+        other = JobControlCache(other_row.fetch, interval=60)
+        listener.subscribe(job_id, controls)
+        listener.subscribe(other_id, other)
+
+        row.action = "stop"
+        listener._on_notify(None, 0, "parse_job_control", control_payload(job_id, "stop"))
+        listener._on_notify(None, 0, "parse_job_control", "not json")
+        await asyncio.sleep(0.01)
+
+        assert controls.action == "stop"
+        assert other_row.reads == 0
+
+        listener.unsubscribe(job_id, controls)
+        listener._on_notify(None, 0, "parse_job_control", control_payload(job_id, "pause"))
+        await asyncio.sleep(0.01)
+        assert row.reads == 1
+        await controls.close()
+
+    def test_dsn_drops_sqlalchemy_driver(self):
+        """Test the asyncpg DSN is derived from the SQLAlchemy URL."""
+        listener = JobControlListener("postgresql+asyncpg://u:p@db:5432/jobboard")
+
+        assert listener._dsn == "postgresql://u:p@db:5432/jobboard"
+
+    async def test_disconnect_falls_back_to_polling(self, monkeypatch):
+        """Test a dropped connection re-reads caches and polls until reconnected."""
+        monkeypatch.setattr(job_controls, "RECONNECT_SECONDS", 0.05)
+        listener = connected_listener()
+        job_id = uuid.uuid4()
+        row = ControlRow()
+        controls = JobControlCache(row.fetch, listener.refresh_interval)
+        listener.subscribe(job_id, controls)
+        await controls.start()
+        assert controls.interval == SAFETY_REFRESH_SECONDS
+
+        connection = listener._conn
+        connection.closed = True
+        row.action = "pause"
+        listener._on_terminated(connection)
+        await asyncio.sleep(0.01)
+        assert controls.action == "pause"
+        assert controls.interval == 0.01
+
+        row.action = "stop"
+        await asyncio.sleep(0.02)
+        assert controls.action == "stop"
+
+        async def reconnect():
+            listener._conn = FakeConnection()
+            listener._conn.termination_listeners.append(listener._on_terminated)
+            return True
+
+        monkeypatch.setattr(listener, "start", reconnect)
+        await asyncio.sleep(0.1)
+        assert listener.connected
+        assert controls.interval == SAFETY_REFRESH_SECONDS
+
+        await controls.close()
+        await listener.close()
+
+    async def test_close_is_not_a_disconnect(self):
+        """Test closing the listener does not switch caches to polling."""
+        listener = connected_listener()
+        row = ControlRow()
+        controls = JobControlCache(row.fetch, listener.refresh_interval)
+        listener.subscribe(uuid.uuid4(), controls)
+
+        await listener.close()
+        await asyncio.sleep(0.01)
+
+        assert row.reads == 0
+        assert controls.interval == SAFETY_REFRESH_SECONDS
+        assert listener._reconnect_task is None
@@ -0,0 +1,155 @@
+"""Unit tests for batched job upserts."""
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from app.core.base_adapter import JobData
+from app.core.job_upsert import build_upsert_statement, plan_batch
+from app.core.utils import compute_content_hash
+from app.models.category import Category
+from app.models.job import Job
+
+NOW = datetime(2026, 1, 20, tzinfo=timezone.utc)
+CATEGORY_ID = uuid.uuid4()
+# Source of the rows written to Postgres (db_runner removes "test-" rows)
+DB_SOURCE = "test-batch"
+
+
+def make_job(external_id: str, title: str = "Developer", **kwargs) -> JobData:
+    return JobData(
+        external_id=external_id,
+        title_ge=title,
+        body_ge="Body",
+        source_url=f"https://jobs.ge/ge/?view=jobs&id={external_id}",
+        parsed_from="jobs.ge",
+        category_slug="it-programming",
+        **kwargs,
+    )
+
+
+def hash_of(job: JobData) -> str:
+    return compute_content_hash(job.title_ge, job.body_ge, job.company_name)
+
+
+def plan(jobs, existing=None, category_id=CATEGORY_ID, source_name="jobs.ge"):
+    return plan_batch(jobs, existing or {}, lambda slug: category_id, source_name, NOW)
+
+
+class TestPlanBatch:
+    """Tests for batch classification."""
+
+    def test_new_updated_skipped(self):
+        """Test each row is classified like the per-job upsert."""
+        unchanged = make_job("1")
+        changed = make_job("2", title="New title")
+        new = make_job("3")
+
+        result = plan(
+            [unchanged, changed, new],
+            existing={"1": hash_of(unchanged), "2": "old-hash"},
+        )
+
+        assert result.results == [("skipped", "unchanged_content"), ("updated", None), ("new", None)]
+        assert list(result.upserts) == ["2", "3"]
+        assert [touch["b_external_id"] for touch in result.touches] == ["1"]
+
+    def test_null_stored_hash_counts_as_update(self):
+        """Test rows stored without a content hash are rewritten."""
+        result = plan([make_job("1")], existing={"1": None})
+
+        assert result.results == [("updated", None)]
+
+    def test_no_category(self):
+        """Test new jobs without a category are skipped, not written."""
+        result = plan([make_job("1")], category_id=None)
+
+        assert result.results == [("skipped", "no_category")]
+        assert result.upserts == {}
+        assert result.touches == []
+
+    def test_duplicates_within_batch(self):
+        """Test repeated jobs are classified as if written one at a time."""
+        first = make_job("1", location="Batumi")
+        repeat = make_job("1", location="Tbilisi")
+        changed = make_job("1", title="Changed")
+
+        result = plan([first, repeat, changed])
+
+        assert result.results == [("new", None), ("skipped", "unchanged_content"), ("updated", None)]
+        # One insert row per external_id, carrying the latest content and
+        # the category resolved when the job was first seen
+        assert list(result.upserts) == ["1"]
+        row = result.upserts["1"]
+        assert row["title_ge"] == "Changed"
+        assert row["category_id"] == CATEGORY_ID
+        assert result.touches[0]["b_location"] == "Tbilisi"
+
+    def test_updated_rows_keep_stored_category(self):
+        """Test changed jobs carry their stored category in the insert row."""
+        stored = uuid.uuid4()
+
+        result = plan_batch(
+            [make_job("1", title="Changed")],
+            {"1": "old-hash"},
+            lambda slug: CATEGORY_ID,
+            "jobs.ge",
+            NOW,
+            existing_categories={"1": stored},
+        )
+
+        assert result.results == [("updated", None)]
+        assert result.upserts["1"]["category_id"] == stored
+
+    def test_updated_rows_resolve_missing_category(self):
+        """Test changed jobs stored without a category resolve one."""
+        result = plan([make_job("1", title="Changed")], existing={"1": "old-hash"})
+
+        assert result.upserts["1"]["category_id"] == CATEGORY_ID
+
+    def test_touch_keeps_metadata_when_missing(self):
+        """Test empty location and missing jobs.ge ids are not overwritten."""
+        job = make_job("1", location="")
+
+        touch = plan([job], existing={"1": hash_of(job)}).touches[0]
+
+        assert touch["b_location"] is None
+        assert touch["b_cid"] is None
+        assert touch["b_now"] == NOW
+
+
+class TestBatchUpsert:
+    """Batch upserts executed against Postgres."""
+
+    async def test_mixed_batch(self, db_runner):
+        """Test new, changed and unchanged jobs are written in one batch."""
+        unchanged = make_job("1")
+        changed = make_job("2", title="New title")
+        new = make_job("3")
+
+        # Stored rows, in a category the slug would no longer resolve to
+        stored = Category(slug=f"test-{uuid.uuid4()}", name_ge="ტესტი", name_en="Test")
+        async with db_runner._session_maker() as session:
+            session.add(stored)
+            await session.flush()
+            rows = plan(
+                [unchanged, make_job("2", title="Old title")], category_id=stored.id, source_name=DB_SOURCE
+            ).upserts
+            await session.execute(build_upsert_statement(list(rows.values())))
+            await session.commit()
+
+        async with db_runner._session_maker() as session:
+            results = await db_runner._upsert_jobs_batch(session, [unchanged, changed, new], DB_SOURCE)
+            await session.commit()
+
+        assert results == [("skipped", "unchanged_content"), ("updated", None), ("new", None)]
+        async with db_runner._session_maker() as session:
+            jobs = {
+                job.external_id: job
+                for job in (await session.execute(select(Job).where(Job.parsed_from == DB_SOURCE))).scalars()
+            }
+        assert jobs["1"].last_seen_at > NOW
+        assert jobs["2"].title_ge == "New title"
+        assert jobs["2"].content_hash == hash_of(changed)
+        assert jobs["2"].category_id == stored.id
+        assert jobs["3"].category_id == db_runner._default_category_id
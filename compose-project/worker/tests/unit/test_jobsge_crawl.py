@@ -0,0 +1,118 @@
+"""Unit tests for jobs.ge list page crawling."""
+import pytest
+
+from app.core.base_adapter import ParseResult
+from app.core.detail_cache import DetailCache
+from app.core.seen_index import SeenIndex
+from app.parsers.jobs_ge import JobsGeAdapter
+from app.parsers.jobsge_config import get_category_by_cid, get_region_by_lid
+
+from .jobsge_fakes import ListClient, RecordingScheduler
+
+
+@pytest.fixture
+def list_html(mock_jobs_ge_list_html: str) -> str:
+    """List page with a link to page 2."""
+    return mock_jobs_ge_list_html.replace(
+        "</table>", '</table><a href="/ge/?cid=6&lid=14&page=2">2</a>'
+    )
+
+
+async def crawl_page(adapter: JobsGeAdapter, html: str) -> list:
+    """Crawl one list page and return the (task name, args) it queued."""
+    adapter.client = ListClient(html)
+    adapter._scheduler = RecordingScheduler()
+    await adapter._crawl_list_page(
+        get_region_by_lid(14), get_category_by_cid(6), 1, ParseResult()
+    )
+    return adapter._scheduler.submitted
+
+
+def remember(adapter: JobsGeAdapter, html: str, skip: int = 0):
+    """Record list signatures as a previous run would have."""
+    for url, signature in adapter._extract_job_entries(html)[skip:]:
+        adapter.detail_cache.put_signature(
+            "jobs.ge", adapter._extract_id_from_url(url), signature
+        )
+
+
+class TestIncrementalCrawl:
+    """Tests for incremental list crawling."""
+
+    async def test_fully_known_page_stops_pagination(self, list_html: str):
+        """Test a page of known listings queues nothing, not even page 2."""
+        adapter = JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+        adapter.incremental = True
+        remember(adapter, list_html)
+
+        assert await crawl_page(adapter, list_html) == []
+        assert adapter._cache_stats["listing_known"] == 6
+
+    async def test_new_listing_continues(self, list_html: str):
+        """Test only new listings are fetched and pagination continues."""
+        adapter = JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+        adapter.incremental = True
+        remember(adapter, list_html, skip=1)
+
+        submitted = await crawl_page(adapter, list_html)
+
+        assert [name for name, _ in submitted] == ["_crawl_job_detail", "_crawl_list_page"]
+        assert submitted[0][1][0] == "https://jobs.ge/ge/?view=jobs&id=12345"
+
+    async def test_queued_listings_do_not_stop_pagination(self, list_html: str):
+        """Test listings skipped as already queued don't count as known."""
+        adapter = JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+        adapter.incremental = True
+        remember(adapter, list_html, skip=1)
+        # Queued from another category this run, so not fetched yet
+        adapter._seen.add("12345")
+
+        submitted = await crawl_page(adapter, list_html)
+
+        assert [name for name, _ in submitted] == ["_crawl_list_page"]
+        assert adapter._cache_stats["listing_known"] == 5
+
+    async def test_full_mode_visits_known_listings(self, list_html: str):
+        """Test full sweeps still visit every listing."""
+        adapter = JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+        remember(adapter, list_html)
+
+        submitted = await crawl_page(adapter, list_html)
+
+        assert [name for name, _ in submitted].count("_crawl_job_detail") == 6
+        assert submitted[-1][0] == "_crawl_list_page"
+
+    async def test_skipped_listings_are_reported_seen(self, list_html: str):
+        """Test every listing on the page is reported, even when not fetched."""
+        adapter = JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+        adapter.incremental = True
+        remember(adapter, list_html)
+        reported = []
+
+        async def on_jobs_seen(seen):
+            reported.extend(seen)
+
+        adapter._on_jobs_seen = on_jobs_seen
+
+        assert await crawl_page(adapter, list_html) == []
+        assert ("12345", 6, 14) in reported
+        assert len(reported) == 6
+
+
+class TestSharedSeenIndex:
+    """Tests for deduplication across the adapters of a sweep."""
+
+    async def test_shared_seen_index_dedups_across_adapters(self, list_html: str):
+        """Test a job queued by one adapter of a sweep is not queued by the next."""
+        shared = SeenIndex()
+        first = JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+        second = JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+        for adapter in (first, second):
+            adapter.seen_index = shared
+            adapter._seen = shared
+
+        queued = await crawl_page(first, list_html)
+        requeued = await crawl_page(second, list_html)
+
+        assert [name for name, _ in queued].count("_crawl_job_detail") == 6
+        assert [name for name, _ in requeued] == ["_crawl_list_page"]
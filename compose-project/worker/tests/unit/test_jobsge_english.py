@@ -0,0 +1,131 @@
+"""Unit tests for jobs.ge English page enrichment."""
+import pytest
+
+from app.core.base_adapter import ParseResult
+from app.core.crawl_scheduler import CrawlScheduler
+from app.core.detail_cache import DetailCache
+from app.parsers.jobs_ge import DETAIL_PRIORITY, LIST_PRIORITY, JobsGeAdapter
+from app.parsers.jobsge_config import get_category_by_cid, get_region_by_lid
+
+from .jobsge_fakes import FakeClient, RecordingScheduler
+
+
+class TestEnglishEnrichment:
+    """Tests for skipping English pages that add nothing."""
+
+    URL = "https://jobs.ge/ge/?view=jobs&id=12345"
+
+    @pytest.fixture
+    def adapter(self) -> JobsGeAdapter:
+        """Create adapter with an in-memory cache."""
+        return JobsGeAdapter(detail_cache=DetailCache(":memory:"))
+
+    async def parse(self, adapter: JobsGeAdapter, job_id: int, signature: str = "sig-1"):
+        return await adapter._parse_job_detail(
+            f"https://jobs.ge/ge/?view=jobs&id={job_id}",
+            get_region_by_lid(14), get_category_by_cid(6), signature,
+        )
+
+    async def test_georgian_only_posting_is_not_rechecked(
+        self, adapter: JobsGeAdapter, mock_jobs_ge_detail_html: str
+    ):
+        """Test a posting whose /en/ page repeated it skips English when it changes."""
+        adapter.client = FakeClient(mock_jobs_ge_detail_html)
+
+        first = await self.parse(adapter, 12345, "sig-1")
+        second = await self.parse(adapter, 12345, "sig-2")
+
+        assert [url for url, _ in adapter.client.requests] == [
+            self.URL, self.URL.replace("/ge/", "/en/"), self.URL,
+        ]
+        assert first.title_en is None and second.title_en is None
+
+    async def test_company_without_english_is_learned(
+        self, adapter: JobsGeAdapter, mock_jobs_ge_detail_html: str
+    ):
+        """Test a company's new postings skip English after enough checks."""
+        adapter.client = FakeClient(
+            mock_jobs_ge_detail_html.replace('class="company"', 'class="company-name"')
+        )
+
+        for job_id in range(1, 5):
+            await self.parse(adapter, job_id)
+
+        english = [url for url, _ in adapter.client.requests if "/en/" in url]
+        assert len(english) == 3
+        assert adapter._cache_stats["english_not_needed"] == 1
+
+    async def test_distinct_english_is_kept(self, adapter: JobsGeAdapter, mock_jobs_ge_detail_html: str):
+        """Test a real English version is stored and keeps being fetched."""
+        adapter.client = FakeClient(
+            mock_jobs_ge_detail_html,
+            etag=None,
+            html_en=mock_jobs_ge_detail_html.replace("პროგრამისტი / Developer", "Developer"),
+        )
+
+        first = await self.parse(adapter, 12345, "sig-1")
+        second = await self.parse(adapter, 12345, "sig-2")
+
+        assert first.title_en == "Developer"
+        assert second.title_en == "Developer"
+        assert len(adapter.client.requests) == 4
+
+    async def test_english_posting_needs_no_english_page(self, adapter: JobsGeAdapter):
+        """Test postings written in English are not fetched twice."""
+        html = (
+            "<html><body><h1>Python Developer</h1>"
+            "<p>We are looking for an experienced developer.</p></body></html>"
+        )
+        adapter.client = FakeClient(html)
+
+        job = await self.parse(adapter, 12345)
+
+        assert job.title_ge == "Python Developer"
+        assert len(adapter.client.requests) == 1
+
+    async def test_english_is_a_separate_crawl_stage(
+        self, adapter: JobsGeAdapter, mock_jobs_ge_detail_html: str
+    ):
+        """Test the crawl queues English after the Georgian page, and past the
+        budget hands the job on Georgian-only without marking it complete."""
+        adapter.client = FakeClient(mock_jobs_ge_detail_html)
+        adapter._scheduler = RecordingScheduler()
+        region, category = get_region_by_lid(14), get_category_by_cid(6)
+        result = ParseResult()
+
+        await adapter._crawl_job_detail(self.URL, region, category, "sig-1", result)
+
+        assert len(adapter.client.requests) == 1
+        assert result.jobs == []
+        [(name, args)] = adapter._scheduler.submitted
+        assert name == "_crawl_job_english"
+
+        adapter._deadline = 0.0  # budget spent
+        await adapter._crawl_job_english(*args)
+
+        assert len(adapter.client.requests) == 1
+        assert [job.external_id for job in result.jobs] == ["12345"]
+        assert adapter.detail_cache.get_signature("jobs.ge", "12345") is None
+        assert adapter._cache_stats["english_over_budget"] == 1
+
+    async def test_english_does_not_wait_for_the_crawl(
+        self, adapter: JobsGeAdapter, mock_jobs_ge_detail_html: str
+    ):
+        """Test a job waiting for English is handed on before the next list page."""
+        adapter.client = FakeClient(mock_jobs_ge_detail_html)
+        adapter._scheduler = CrawlScheduler(concurrency=1)
+        region, category = get_region_by_lid(14), get_category_by_cid(6)
+        result = ParseResult()
+        delivered_before_next_page = []
+
+        async def next_list_page():
+            delivered_before_next_page.extend(job.external_id for job in result.jobs)
+
+        adapter._scheduler.submit(
+            DETAIL_PRIORITY, adapter._crawl_job_detail, self.URL, region, category, "sig-1", result
+        )
+        adapter._scheduler.submit(LIST_PRIORITY, next_list_page)
+        await adapter._scheduler.run()
+
+        assert [url for url, _ in adapter.client.requests] == [self.URL, self.URL.replace("/ge/", "/en/")]
+        assert delivered_before_next_page == ["12345"]
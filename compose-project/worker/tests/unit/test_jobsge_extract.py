@@ -0,0 +1,179 @@
+"""Unit tests for single-parse jobs.ge extraction."""
+import pytest
+from bs4 import BeautifulSoup
+
+from app.parsers.jobsge_extract import (
+    DetailPage,
+    ListPage,
+    clean_element_text,
+    extract_detail_fields,
+    get_text,
+    parse_document,
+)
+
+from . import jobsge_soup
+
+# Every HTML fixture in conftest
+HTML_FIXTURES = [
+    "mock_jobs_ge_list_html",
+    "mock_jobs_ge_detail_html",
+    "mock_jobs_ge_detail_no_salary_html",
+    "mock_jobs_ge_detail_indented_html",
+    "mock_hr_ge_list_html",
+    "mock_hr_ge_detail_html",
+]
+
+
+class TestTextSemantics:
+    """Tests that text extraction matches BeautifulSoup behavior."""
+
+    def test_get_text_skips_script_and_template(self):
+        """Test script/style/template strings are excluded from get_text."""
+        root = parse_document(
+            "<div><p>a <b>x</b></p><script>var s=1</script><template><i>t</i></template> z</div>"
+        )
+        div = root.find(".//div")
+
+        assert get_text(div) == "a x z"
+        assert get_text(root.find(".//script")) == "var s=1"
+        assert get_text(root.find(".//i")) == ""
+
+    def test_get_text_strip_keeps_string_boundaries(self):
+        """Test strip=True strips each string before joining."""
+        root = parse_document("<p> a <b> b </b> c </p>")
+
+        assert get_text(root.find(".//p"), strip=True) == "abc"
+        assert get_text(root.find(".//p"), " ") == " a   b   c "
+
+    def test_clean_element_text(self):
+        """Test clean_html-equivalent line cleanup."""
+        root = parse_document("<div><p> one </p>\n<style>x{}</style><p>two<br>three</p></div>")
+
+        assert clean_element_text(root.find(".//div")) == "one\ntwo\nthree"
+
+    def test_unicode_with_encoding_declaration(self):
+        """Test documents with an XML encoding declaration still parse."""
+        root = parse_document('<?xml version="1.0" encoding="utf-8"?><html><body><h1>სათაური</h1></body></html>')
+
+        assert get_text(root.find(".//h1")) == "სათაური"
+
+    def test_empty_document(self):
+        """Test empty input yields no fields instead of raising."""
+        assert extract_detail_fields("") == {"title": None}
+        assert ListPage("", "https://jobs.ge").entries == []
+
+
+class TestListPage:
+    """Tests for list page extraction."""
+
+    def test_entries(self, mock_jobs_ge_list_html: str):
+        """Test job URLs and per-row signatures."""
+        entries = ListPage(mock_jobs_ge_list_html, "https://jobs.ge").entries
+        urls = [url for url, _ in entries]
+        signatures = [signature for _, signature in entries]
+
+        assert urls[0] == "https://jobs.ge/ge/?view=jobs&id=12345"
+        assert "https://jobs.ge/ge/?view=jobs&id=67890" in urls
+        # Links in the same row share the row signature
+        assert signatures[0] == signatures[1]
+        assert signatures[0] != signatures[2]
+
+    def test_has_next_page(self):
+        """Test pagination detection."""
+        page = ListPage('<a href="/ge/?cid=6&lid=14&page=3">3</a>', "https://jobs.ge")
+
+        assert page.has_next_page(2) is True
+        assert page.has_next_page(3) is False
+
+
+class TestDetailPage:
+    """Tests for detail page extraction."""
+
+    def test_extract_detail_fields(self, mock_jobs_ge_detail_html: str):
+        """Test all fields from one parse (values as extracted by BeautifulSoup)."""
+        fields = extract_detail_fields(mock_jobs_ge_detail_html)
+
+        assert fields["title"] == "პროგრამისტი / Developer"
+        assert fields["body"].startswith("ვეძებთ გამოცდილ პროგრამისტს Python-ში.\nმოთხოვნები:")
+        assert fields["company_name"] is None
+        assert fields["published_at"] == "2026-01-15T00:00:00+00:00"
+        assert fields["deadline_at"] == "2026-01-30T00:00:00+00:00"
+        assert fields["salary_currency"] == "GEL"
+        assert fields["is_vip"] is False
+
+    def test_no_salary(self, mock_jobs_ge_detail_no_salary_html: str):
+        """Test page without salary or dates."""
+        fields = extract_detail_fields(mock_jobs_ge_detail_no_salary_html)
+
+        assert fields["title"] == "გრაფიკული დიზაინერი"
+        assert fields["salary_min"] is None
+        assert fields["published_at"] is None
+
+    def test_english_page_title_and_body_only(self, mock_jobs_ge_detail_html: str):
+        """Test reduced extraction for the English page."""
+        fields = extract_detail_fields(mock_jobs_ge_detail_html, full=False)
+
+        assert set(fields) == {"title", "body"}
+
+    def test_published_date_in_comment(self):
+        """Test keyword strings in comments are searched, as with find_all(string=)."""
+        page = DetailPage("<div><!-- published --><span>12.03.2024</span></div>")
+
+        assert page.published_at().isoformat() == "2024-03-12T00:00:00+00:00"
+
+    def test_main_fallback_strips_navigation(self):
+        """Test the main-content fallback drops navigation and joins surrounding text."""
+        text = "ვაკანსიის აღწერა, რომელიც საკმარისად გრძელია ტექსტის შესამოწმებლად"
+        page = DetailPage(f"<main><p>{text}<nav>menu</nav>!</p><footer>footer</footer></main>")
+
+        assert page.body() == text + "!"
+        assert "footer" not in get_text(page.root)
+
+    def test_vip_flag(self):
+        """Test VIP detection includes markup, not just text."""
+        assert DetailPage('<div class="vip-badge"></div>').is_vip() is True
+        assert DetailPage("<div>regular</div>").is_vip() is False
+
+
+class TestSoupParity:
+    """The lxml extractors against the BeautifulSoup ones they replaced."""
+
+    @pytest.mark.parametrize("fixture", HTML_FIXTURES)
+    def test_list_page(self, fixture: str, request):
+        """Test list entries, signatures and pagination match."""
+        html = request.getfixturevalue(fixture)
+        page = ListPage(html, "https://jobs.ge")
+
+        assert page.entries == jobsge_soup.list_entries(html, "https://jobs.ge")
+        for current in (0, 1):
+            assert page.has_next_page(current) == jobsge_soup.has_next_page(html, current)
+
+    @pytest.mark.parametrize("full", [True, False])
+    @pytest.mark.parametrize("fixture", HTML_FIXTURES)
+    def test_detail_page(self, fixture: str, full: bool, request):
+        """Test every detail field matches."""
+        html = request.getfixturevalue(fixture)
+
+        assert extract_detail_fields(html, full=full) == jobsge_soup.detail_fields(html, full=full)
+
+    @pytest.mark.parametrize("fixture", HTML_FIXTURES)
+    def test_document_text(self, fixture: str, request):
+        """Test document text matches, whitespace-only strings included."""
+        html = request.getfixturevalue(fixture)
+
+        assert DetailPage(html).text() == BeautifulSoup(html, "lxml").get_text()
+
+    @pytest.mark.parametrize("tail", ["", "\n", "  ", "\n\t\n", "\n<!-- rendered -->\n"])
+    def test_text_after_document(self, tail: str):
+        """Test whitespace and comments after </html> read as in BeautifulSoup."""
+        html = f"<html><body><p>2000</p></body></html >{tail}"
+
+        assert DetailPage(html).text() == BeautifulSoup(html, "lxml").get_text()
+
+    def test_indentation_keeps_salary_in_reach(self, mock_jobs_ge_detail_indented_html: str):
+        """Test indentation collapses as in BeautifulSoup, except inside <pre>."""
+        text = DetailPage(mock_jobs_ge_detail_indented_html).text()
+
+        assert "1800\n\n\n\n\nSalary" in text
+        assert "\n            Apply by 20.02.2026\n        " in text
+        assert extract_detail_fields(mock_jobs_ge_detail_indented_html)["salary_min"] == 1800
@@ -0,0 +1,42 @@
+"""Unit tests for the compiled keyword matcher."""
+import random
+
+from app.core.keyword_matcher import KeywordMatcher
+
+
+def naive_find(keywords, text):
+    return {keyword for keyword in keywords if keyword and keyword in text}
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher."""
+
+    def test_overlapping_keywords(self):
+        """Test keywords that are prefixes, suffixes or overlaps of each other."""
+        matcher = KeywordMatcher(["he", "she", "his", "hers", "it", "it support"])
+
+        assert matcher.find("ushers") == {"he", "she", "hers"}
+        assert matcher.find("audit support desk") == {"it", "it support"}
+        assert matcher.find("") == set()
+
+    def test_georgian_and_projection_collisions(self):
+        """Test Georgian keywords, and characters sharing their low byte."""
+        matcher = KeywordMatcher(["ექიმი", "ab"])
+
+        assert matcher.find("ვეძებთ ექიმს და ექიმი") == {"ექიმი"}
+        # "ÔåØÛØ" has the same low bytes as "ექიმი" but must not match
+        assert matcher.find("ÔåØÛØ") == set()
+        assert matcher.find("šb ab") == {"ab"}
+
+    def test_matches_in_operator(self):
+        """Test results equal `keyword in text` on random texts."""
+        rng = random.Random(0)
+        alphabet = "abc აბგàáâ\U0001F600"
+        keywords = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(200)
+        }
+        matcher = KeywordMatcher(keywords)
+
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            assert matcher.find(text) == naive_find(keywords, text)
@@ -0,0 +1,61 @@
+"""Unit tests for worker metrics."""
+import socket
+import urllib.request
+
+import pytest
+
+from app.core import metrics
+from app.core.parse_executor import ParseExecutor
+
+
+@pytest.fixture
+def metrics_on(monkeypatch):
+    """Metrics served on a free port for the test."""
+    pytest.importorskip("prometheus_client")
+    monkeypatch.setattr(metrics, "_metrics", None)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    assert metrics.start_metrics_server(port)
+    return port
+
+
+def scrape(port: int) -> str:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+        return response.read().decode()
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+class TestMetrics:
+    """Tests for metric recording."""
+
+    async def test_disabled_by_default(self, monkeypatch):
+        """Test recorders are no-ops until the server is started."""
+        monkeypatch.setattr(metrics, "_metrics", None)
+
+        assert not metrics.start_metrics_server(None)
+        assert not metrics.enabled()
+        metrics.observe_fetch("https://jobs.ge/", 200, 0.1)
+        metrics.count_job("jobs.ge", "new")
+        assert await ParseExecutor(0).run(count_words, "a b c") == 3
+
+    async def test_hot_path_metrics_are_served(self, metrics_on):
+        """Test fetch, parse, upsert, queue and job metrics reach /metrics."""
+        metrics.observe_fetch("https://jobs.ge/ge/?cid=6", 200, 0.2)
+        metrics.observe_upsert("jobs.ge", 0.01)
+        metrics.set_queue_depth("crawl_frontier", 7)
+        metrics.count_job("jobs.ge", "new")
+        metrics.count_job("jobs.ge", "new")
+        assert await ParseExecutor(0).run(count_words, "a b c") == 3
+
+        text = scrape(metrics_on)
+
+        assert 'worker_http_fetch_seconds_count{host="jobs.ge",status="200"} 1.0' in text
+        assert 'worker_parse_cpu_seconds_count{page_type="count_words"} 1.0' in text
+        assert 'worker_db_upsert_seconds_count{source="jobs.ge"} 1.0' in text
+        assert 'worker_queue_depth{stage="crawl_frontier"} 7.0' in text
+        assert 'worker_jobs_total{result="new",source="jobs.ge"} 2.0' in text
+        assert "worker_host_request_rate" in text
@@ -0,0 +1,50 @@
+"""Unit tests for the HTML parse process pool."""
+import asyncio
+
+from app.core.base_adapter import JobData
+from app.core.parse_executor import ParseExecutor, decode_html
+from app.parsers.hr_ge import HrGeAdapter, parse_detail_html
+from app.parsers.jobsge_extract import extract_detail_fields, parse_detail_page, parse_list_page
+
+
+class TestParseExecutor:
+    """Tests for ParseExecutor."""
+
+    async def test_pool_matches_inline(self, mock_jobs_ge_list_html, mock_jobs_ge_detail_html):
+        """Test pooled parsing of raw bytes returns what inline parsing does."""
+        pool, inline = ParseExecutor(2), ParseExecutor(0)
+        try:
+            list_bytes = mock_jobs_ge_list_html.encode()
+            detail_bytes = mock_jobs_ge_detail_html.encode()
+
+            pooled = await asyncio.gather(
+                pool.run(parse_list_page, list_bytes, "https://jobs.ge", 1),
+                pool.run(parse_detail_page, detail_bytes, True),
+            )
+            direct = [
+                await inline.run(parse_list_page, mock_jobs_ge_list_html, "https://jobs.ge", 1),
+                extract_detail_fields(mock_jobs_ge_detail_html),
+            ]
+        finally:
+            pool.shutdown()
+
+        assert pooled[0] == (direct[0][0], direct[0][1])
+        assert pooled[1] == direct[1]
+        assert pooled[1]["title"]
+
+    async def test_hr_ge_detail_in_pool(self, mock_hr_ge_detail_html):
+        """Test hr.ge detail pages come back from the pool as JobData."""
+        url = "https://www.hr.ge/vacancy/12345"
+        pool = ParseExecutor(1)
+        try:
+            job = await pool.run(parse_detail_html, mock_hr_ge_detail_html.encode(), url)
+        finally:
+            pool.shutdown()
+
+        assert isinstance(job, JobData)
+        assert job == HrGeAdapter()._parse_detail_page(mock_hr_ge_detail_html, url)
+
+    def test_decode_html_replaces_invalid_bytes(self):
+        """Test raw bodies decode like HTTPClient.get_text (UTF-8, replace)."""
+        assert decode_html("ვაკანსია".encode() + b"\xff") == "ვაკანსია�"
+        assert decode_html("text") == "text"
@@ -0,0 +1,77 @@
+"""Unit tests for ParserRunner against Postgres (BENCH_DATABASE_URL)."""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.base_adapter import BaseAdapter
+from app.models.job import Job
+
+SOURCE = "test-seen"
+
+
+class KnownListingsAdapter(BaseAdapter):
+    """Adapter whose listings are all unchanged: reported seen, never parsed.
+
+    This is what JobsGeAdapter does in incremental mode for listings whose
+    signature is in the detail cache.
+    """
+
+    source_name = SOURCE
+    source_domain = "example.test"
+    base_url = "https://example.test"
+    listings = ["1", "2"]
+
+    async def run(self, region: Optional[str] = None, on_job_parsed=None, on_jobs_seen=None):
+        assert self.incremental
+        await on_jobs_seen([(external_id, 6, 14) for external_id in self.listings])
+        return self.new_result()
+
+    async def discover_job_urls(self, region: Optional[str] = None):
+        yield  # pragma: no cover
+
+    async def parse_job(self, url: str):
+        return None
+
+    async def parse_list_page(self, page: int, region: Optional[str] = None):
+        return []
+
+
+class TestJobsSeen:
+    """Tests for last_seen_at bookkeeping of skipped listings."""
+
+    async def test_skipped_listings_stay_active(self, db_runner):
+        """Test incremental runs keep unchanged listings from being deactivated."""
+        stale = datetime.now(timezone.utc) - timedelta(days=db_runner.config.not_seen_days_to_inactive + 1)
+        async with db_runner._session_maker() as session:
+            for external_id in ("1", "2", "3"):
+                session.add(
+                    Job(
+                        title_ge="Developer",
+                        body_ge="Body",
+                        parsed_from=SOURCE,
+                        external_id=external_id,
+                        category_id=db_runner._default_category_id,
+                        status="active",
+                        first_seen_at=stale,
+                        last_seen_at=stale,
+                    )
+                )
+            await session.commit()
+        db_runner.adapters[SOURCE] = KnownListingsAdapter
+
+        result = await db_runner.run_source(SOURCE, ["adjara"], mode="incremental")
+        await db_runner.deactivate_not_seen()
+
+        assert result.total_found == 0  # nothing was parsed or upserted
+        async with db_runner._session_maker() as session:
+            jobs = {
+                job.external_id: job
+                for job in (await session.execute(select(Job).where(Job.parsed_from == SOURCE))).scalars()
+            }
+        assert jobs["1"].last_seen_at > stale
+        assert {external_id: job.status for external_id, job in jobs.items()} == {
+            "1": "active",
+            "2": "active",
+            "3": "inactive",  # not listed: deactivated as before
+        }
@@ -0,0 +1,46 @@
+"""Unit tests for the run-scoped seen index."""
+import random
+
+from app.core import seen_index
+from app.core.seen_index import SeenIndex
+
+
+class TestSeenIndex:
+    """Tests for SeenIndex."""
+
+    def test_add_and_contains(self):
+        """Test numeric ids are found whether given as str or int."""
+        index = SeenIndex()
+
+        assert index.add("693885") is True
+        assert index.add("693885") is False
+        assert "693885" in index
+        assert 693885 in index
+        assert "693886" not in index
+        assert len(index) == 1
+
+    def test_non_numeric_keys(self):
+        """Test URLs and zero-padded ids are kept verbatim."""
+        index = SeenIndex()
+        index.add("https://jobs.ge/ge/?view=jobs")
+        index.add("007")
+
+        assert "https://jobs.ge/ge/?view=jobs" in index
+        assert "007" in index
+        assert "7" not in index
+
+    def test_merge_keeps_membership(self, monkeypatch):
+        """Test ids stay visible across buffer merges into the sorted array."""
+        monkeypatch.setattr(seen_index, "_MERGE_THRESHOLD", 16)
+        ids = random.Random(0).sample(range(10 ** 9), 500)
+        index = SeenIndex()
+
+        for external_id in ids:
+            assert index.add(str(external_id)) is True
+        for external_id in ids:
+            assert index.add(external_id) is False
+
+        assert len(index) == 500
+        assert all(str(external_id) in index for external_id in ids)
+        assert list(index._sorted) == sorted(index._sorted)
+        assert index._sorted.itemsize == 8
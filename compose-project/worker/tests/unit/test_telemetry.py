@@ -0,0 +1,90 @@
+"""Unit tests for parse job telemetry."""
+import asyncio
+import uuid
+
+from app.core.telemetry import MAX_ERRORS_PER_FLUSH, ParseTelemetry
+
+
+class RecordingSession:
+    """Async session stand-in that records executed statements."""
+
+    def __init__(self, log: list):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.log.append((stmt.table.name, stmt.is_insert, params))
+
+    async def commit(self):
+        self.log.append("commit")
+
+
+def make_telemetry(log: list, interval: float = 0.05) -> ParseTelemetry:
+    return ParseTelemetry(lambda: RecordingSession(log), uuid.uuid4(), flush_interval=interval)
+
+
+class TestParseTelemetry:
+    """Tests for ParseTelemetry."""
+
+    async def test_items_are_bulk_inserted(self):
+        """Test queued items go out in one executemany on close."""
+        log = []
+        telemetry = make_telemetry(log)
+        for i in range(3):
+            telemetry.record_item(external_id=str(i), status="completed", result="new")
+        await telemetry.close()
+
+        assert len(log) == 2
+        table, is_insert, rows = log[0]
+        assert (table, is_insert) == ("parse_job_items", True)
+        assert [row["external_id"] for row in rows] == ["0", "1", "2"]
+        assert all(row["job_id"] == telemetry.job_id for row in rows)
+
+    async def test_progress_is_coalesced(self):
+        """Test only the newest progress is written per interval."""
+        log = []
+        telemetry = make_telemetry(log, interval=0.05)
+        telemetry.start()
+        for processed in range(1, 101):
+            telemetry.update_progress(processed=processed, new=processed, updated=0, skipped=0)
+        await asyncio.sleep(0.12)
+        telemetry.update_progress(processed=101, new=101, updated=0, skipped=0)
+        await telemetry.close()
+
+        updates = [entry for entry in log if entry != "commit"]
+        assert [(table, is_insert) for table, is_insert, _ in updates] == [
+            ("parse_jobs", False),
+            ("parse_jobs", False),
+        ]
+
+    async def test_errors_are_logged_up_to_cap(self):
+        """Test errors become log rows, with the overflow counted by kind."""
+        log = []
+        telemetry = make_telemetry(log)
+        for i in range(MAX_ERRORS_PER_FLUSH + 5):
+            telemetry.record_error("detail:ValueError", f"Error parsing u{i}")
+        await telemetry.close()
+
+        table, is_insert, rows = log[0]
+        assert (table, is_insert) == ("parse_job_logs", True)
+        assert len(rows) == MAX_ERRORS_PER_FLUSH + 1
+        assert rows[0]["message"] == "Error parsing u0"
+        assert rows[0]["details"] == {"kind": "detail:ValueError"}
+        assert rows[-1]["details"] == {"dropped": {"detail:ValueError": 5}}
+
+    async def test_flush_errors_are_contained(self):
+        """Test a failing write is logged, not raised."""
+
+        class FailingSession(RecordingSession):
+            async def execute(self, stmt, params=None):
+                raise RuntimeError("db down")
+
+        telemetry = ParseTelemetry(lambda: FailingSession([]), uuid.uuid4())
+        telemetry.record_item(external_id="1")
+        await telemetry.close()
+
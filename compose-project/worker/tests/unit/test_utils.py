@@ -1,5 +1,7 @@
 """Unit tests for parsing utilities."""
+import re
 import pytest
+from bs4 import BeautifulSoup
 from datetime import datetime
 from app.core.utils import (
     compute_content_hash,
@@ -9,6 +11,7 @@ from app.core.utils import (
     clean_html,
     detect_language,
     classify_category,
+    classify_categories,
 )
 
 
@@ -40,6 +43,69 @@ class TestContentHash:
         assert hash1 == hash2
 
 
+class TestContentHashStability:
+    """Digests of existing jobs must not change, or every job is re-saved as "updated"."""
+
+    # Digests computed with the original BeautifulSoup-based normalize_text
+    GOLDEN = [
+        (
+            ("პროგრამისტი / Developer",
+             "ვეძებთ გამოცდილ პროგრამისტს Python-ში.\nმოთხოვნები:\n3+ წლის გამოცდილება\nPython, FastAPI\nPostgreSQL",
+             "TechCorp"),
+            "cca955fca8ef1b89208cf8b9dff703751506876bc3843963f2a45056b1889df5",
+        ),
+        (
+            ("გრაფიკული დიზაინერი", "ვეძებთ კრეატიულ დიზაინერს.\nგამოცდილება: 2+ წელი\nხელფასი: შეთანხმებით", None),
+            "bad61ff7e087cc3dd194d311ec69be11d9104ed749af3bf30a93ce9c62967539",
+        ),
+        (
+            ("Sales Manager (B2B)", "Salary: 2,000 - 3,000 GEL\n\tFull-time;  Batumi!", "Skami LLC"),
+            "605b728c80ecce8868d5738a519e01e5a9ee0fbd7e60e1559b2dafd0ea09ec30",
+        ),
+        (
+            ("  მზარეული  ", "სამუშაო გრაფიკი: 5/2\r\nხელფასი 1500₾ + ბონუსი", "რესტორანი „ზღვა“"),
+            "a5a8c5e304602dcb54d752d05d675fc23c421ebec349e84e54a0bce02b8a467b",
+        ),
+        (
+            ("Barista", "Tips & bonuses — apply at <b>cafe</b> &amp; bar", "Coffee & Co"),
+            "e2ce7ce97e2f9c9ef77b47bb28864452de515714782363086c65407706bd3032",
+        ),
+        (
+            ("ᲛᲔᲜᲔᲯᲔᲠᲘ", "Ⴀ Ⴁ ⴀ ⴁ ა ბ nbsp\u3000ideo", ""),
+            "9eb517f9ed404a6265fc1b3c903914ff41c7f401cf76460b25d627c1a367ad59",
+        ),
+        (
+            ("", "", None),
+            "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+        ),
+    ]
+
+    @pytest.mark.parametrize("args,digest", GOLDEN)
+    def test_golden_digests(self, args, digest):
+        """Test digests match those stored for existing rows."""
+        assert compute_content_hash(*args) == digest
+
+    @pytest.mark.parametrize("text", [
+        "plain text",
+        "  tabs\tand\nnewlines\r\n ",
+        "\x0c\x0b\x1c\x85\xa0\u3000",
+        "Straße İstanbul ﬁle",
+        "a - b , c",
+        "5 > 3",
+        "<p>Some <b>text</b></p>",
+        "AT&T &amp; &nbsp;x &#4318;",
+        "<!-- note --> after",
+        "ხელფასი: 1500 ₾",
+    ])
+    def test_matches_html_parser_reference(self, text):
+        """Test fast path equals always parsing with html.parser."""
+        expected = BeautifulSoup(text.lower(), "html.parser").get_text()
+        expected = re.sub(r"\s+", " ", expected).strip()
+        expected = re.sub(r"[^\w\s\u10A0-\u10FF]", "", expected)
+
+        assert normalize_text(text) == expected
+
+
 class TestNormalizeText:
     """Tests for text normalization."""
 
@@ -297,3 +363,20 @@ class TestClassifyCategory:
         """Test that weak matches return 'other'."""
         # Single weak keyword in body should not be enough
         assert classify_category("General Position", "some random text") == "other"
+
+    def test_classify_ties_keep_scoring_order(self):
+        """Test equal scores resolve to the category the phrase pass scores first."""
+        # "sales consultant" (phrase) vs "consultant" keyword elsewhere
+        assert classify_category("Sales Consultant", "") == "sales-marketing"
+
+    def test_classify_categories_batch(self):
+        """Test the batch API matches one call per job, in order."""
+        jobs = [
+            ("Python Developer", "Looking for a programmer"),
+            ("Random Job", "No keywords here"),
+            ("Python Developer", "Looking for a programmer"),
+            (None, None),
+            ("ექიმი", "კლინიკა"),
+        ]
+
+        assert classify_categories(jobs) == [classify_category(t, b) for t, b in jobs]
@@ -0,0 +1,58 @@
+"""Unit tests for the worker's run scheduling."""
+import asyncio
+
+from app.main import WorkerService
+
+
+class RecordingRunner:
+    """Stand-in for ParserRunner that records the runs it is asked for."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.modes = []
+        self.deactivations = 0
+
+    async def run_all(self, mode: str = "incremental"):
+        self.modes.append(mode)
+        await asyncio.sleep(self.delay)
+        return {}
+
+    async def deactivate_not_seen(self) -> int:
+        self.deactivations += 1
+        return 0
+
+
+def make_worker() -> WorkerService:
+    worker = WorkerService()
+    worker.runner = RecordingRunner()
+    return worker
+
+
+class TestRunParsers:
+    """Tests for WorkerService.run_parsers."""
+
+    async def test_triggers_fire_together_incremental_first(self):
+        """Test a sweep firing with an incremental run is not dropped."""
+        worker = make_worker()
+
+        await asyncio.gather(worker.run_parsers("incremental"), worker.run_parsers("full"))
+
+        assert worker.runner.modes == ["incremental", "full"]
+        assert worker.runner.deactivations == 1
+
+    async def test_triggers_fire_together_full_first(self):
+        """Test the incremental run is dropped while the sweep covers it."""
+        worker = make_worker()
+
+        await asyncio.gather(worker.run_parsers("full"), worker.run_parsers("incremental"))
+
+        assert worker.runner.modes == ["full"]
+        assert worker.runner.deactivations == 1
+
+    async def test_incremental_dropped_during_run(self):
+        """Test overlapping incremental runs are dropped."""
+        worker = make_worker()
+
+        await asyncio.gather(worker.run_parsers("incremental"), worker.run_parsers("incremental"))
+
+        assert worker.runner.modes == ["incremental"]
@@ -0,0 +1,36 @@
+"""Trigram indexes for job search
+
+The list and /jobs/search endpoints match ILIKE '%q%' on title, title_en
+and description. pg_trgm GIN indexes let Postgres answer those from an
+index instead of scanning every job.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-01-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ['title', 'title_en', 'description']
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_jobs_{column}_trgm', 'jobs', [column],
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f'ix_jobs_{column}_trgm', 'jobs')